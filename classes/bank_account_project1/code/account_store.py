@@ -0,0 +1,210 @@
+"""Snapshot + write-ahead log persistence for the whole account population"""
+
+from array import array
+from collections import namedtuple
+import glob
+import json
+import os
+import struct
+
+from bank_account_project import Account, TimeZone
+from ledger import Ledger
+
+Snapshot = namedtuple("Snapshot", "generation last_transaction_id account_numbers first_names last_names "
+                                  "tz_names tz_hours tz_minutes balances")
+
+_MAGIC = b"BASNAP01"
+#magic, generation, last transaction id, number of accounts, byte length of the four text columns
+_HEADER = struct.Struct("<8sqqqqqqq")
+_SEPARATOR = "\0"
+
+
+def write_snapshot(path: str, accounts, generation: int, last_transaction_id: int) -> None:
+    """
+    Writes every account to `path` in a columnar layout: four text columns (account number, first name,
+    last name, time zone name) followed by `array` columns for the time zone offsets and the balances.
+    The file is written next to `path` first and then renamed, so a crash never leaves a half written snapshot.
+    """
+    accounts = list(accounts)
+    text_columns = [
+        _SEPARATOR.join(a.account_number for a in accounts).encode("utf-8"),
+        _SEPARATOR.join(a.first_name for a in accounts).encode("utf-8"),
+        _SEPARATOR.join(a.last_Name for a in accounts).encode("utf-8"),
+        _SEPARATOR.join(a.prefer_timezone.name for a in accounts).encode("utf-8"),
+    ]
+    tz_hours = array("i", (a.prefer_timezone.offset_hours for a in accounts))
+    tz_minutes = array("i", (a.prefer_timezone.offset_minutes for a in accounts))
+    balances = array("d", (a.balance for a in accounts))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, generation, last_transaction_id, len(accounts), *(len(c) for c in text_columns)))
+        for column in text_columns:
+            f.write(column)
+        for column in (tz_hours, tz_minutes, balances):
+            column.tofile(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path: str) -> Snapshot:
+    """
+    Loads a snapshot written by `write_snapshot` as columns (lists of str and `array` objects),
+    without building one object or dict per account.
+
+    **Raises:**
+
+    * `ValueError`: If the file is not a snapshot.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+
+    magic, generation, last_transaction_id, count, *text_lengths = _HEADER.unpack_from(data, 0)
+    if magic != _MAGIC:
+        raise ValueError(f"{path} is not an account snapshot")
+
+    offset = _HEADER.size
+    text_columns = []
+    for length in text_lengths:
+        text = data[offset:offset + length].decode("utf-8")
+        text_columns.append(text.split(_SEPARATOR) if count else [])
+        offset += length
+
+    numeric_columns = []
+    for typecode in "iid":
+        column = array(typecode)
+        column.frombytes(data[offset:offset + count * column.itemsize])
+        numeric_columns.append(column)
+        offset += count * column.itemsize
+
+    return Snapshot(generation, last_transaction_id, *text_columns, *numeric_columns)
+
+
+class AccountStore:
+    """
+    **Summary:**
+
+    Keeps the account population recoverable after a crash with a periodic columnar snapshot plus a
+    write-ahead log (a `Ledger`) of every transaction since that snapshot. Recovery reads the last snapshot
+    and replays only the log, so its cost follows recent activity and not total history.
+
+    **Files (one generation at a time):**
+
+    * `snapshot-<generation>.bin`: The columnar snapshot, see `write_snapshot`.
+    * `wal-<generation>.bin`: The transaction ledger attached to `Account` since that snapshot.
+    * `accounts-<generation>.jsonl`: Names and time zone of accounts registered since that snapshot.
+
+    **Methods:**
+
+    * `__init__(self, directory: str, commit_every: int = 1024)`: Opens the store, starting generation 0 if it is empty.
+    * `recover(self) -> dict`: Rebuilds every `Account` (keyed by account number) and attaches the write-ahead log.
+    * `register(self, account: Account) -> None`: Journals a new account (or its new names/time zone) until the next checkpoint.
+    * `checkpoint(self, accounts) -> None`: Writes a new snapshot, starts a new log and removes the previous generation.
+    * `close(self) -> None`: Commits and detaches the log.
+
+    **Notes:**
+
+    * Accounts created after a snapshot must be passed to `register`, the log only carries balances.
+    """
+
+    def __init__(self, directory: str, commit_every: int = 1024) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self._directory = directory
+        self._commit_every = commit_every
+
+        generations = sorted(int(os.path.basename(p)[len("snapshot-"):-len(".bin")])
+                             for p in glob.glob(os.path.join(directory, "snapshot-*.bin")))
+        if generations:
+            self._generation = generations[-1]
+        else:
+            self._generation = 0
+            write_snapshot(self._path("snapshot", "bin"), (), 0, 0)
+
+        self._ledger = None
+
+    @property
+    def generation(self):
+        return self._generation
+
+    def _path(self, kind, extension, generation=None):
+        generation = self._generation if generation is None else generation
+        return os.path.join(self._directory, f"{kind}-{generation}.{extension}")
+
+    def _open_ledger(self, last_transaction_id):
+        self._ledger = Ledger(self._path("wal", "bin"), self._commit_every, last_transaction_id=last_transaction_id)
+        Account.attach_ledger(self._ledger)
+
+    def recover(self) -> dict:
+        snapshot = read_snapshot(self._path("snapshot", "bin"))
+
+        rows = {number: (first, last, TimeZone(tz_name, hours, minutes))
+                for number, first, last, tz_name, hours, minutes in zip(
+                    snapshot.account_numbers, snapshot.first_names, snapshot.last_names,
+                    snapshot.tz_names, snapshot.tz_hours, snapshot.tz_minutes)}
+
+        journal = self._path("accounts", "jsonl")
+        if os.path.exists(journal):
+            with open(journal, encoding="utf-8") as f:
+                for line in f:
+                    number, first, last, tz_name, hours, minutes = json.loads(line)
+                    rows[number] = (first, last, TimeZone(tz_name, hours, minutes))
+
+        if self._ledger is None:
+            self._open_ledger(snapshot.last_transaction_id)
+
+        balances = self._ledger.balances(dict(zip(snapshot.account_numbers, snapshot.balances)))
+
+        #the accounts are rebuilt with the log detached, they are not new transactions
+        Account.attach_ledger(None)
+        try:
+            accounts = {number: Account(number, first, last, tz, balances.get(number, 0.0))
+                        for number, (first, last, tz) in rows.items()}
+        finally:
+            Account.attach_ledger(self._ledger)
+
+        return accounts
+
+    def register(self, account: Account) -> None:
+        tz = account.prefer_timezone
+        line = json.dumps([account.account_number, account.first_name, account.last_Name,
+                           tz.name, tz.offset_hours, tz.offset_minutes])
+        with open(self._path("accounts", "jsonl"), "a", encoding="utf-8") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def checkpoint(self, accounts) -> None:
+        previous = self._generation
+        if self._ledger is None:
+            last_transaction_id = read_snapshot(self._path("snapshot", "bin")).last_transaction_id
+        else:
+            self._ledger.commit()
+            last_transaction_id = self._ledger.last_transaction_id
+            Account.attach_ledger(None)
+            self._ledger.close()
+            self._ledger = None
+
+        self._generation += 1
+        write_snapshot(self._path("snapshot", "bin"), accounts, self._generation, last_transaction_id)
+        self._open_ledger(last_transaction_id)
+
+        for kind, extension in (("wal", "bin"), ("accounts", "jsonl"), ("snapshot", "bin")):
+            path = self._path(kind, extension, previous)
+            if os.path.exists(path):
+                os.remove(path)
+
+    def close(self) -> None:
+        if self._ledger is not None:
+            Account.attach_ledger(None)
+            self._ledger.close()
+            self._ledger = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"AccountStore(directory='{self._directory}', generation={self._generation})"
@@ -0,0 +1,159 @@
+"""Asyncio front-end for Account operations"""
+
+import asyncio
+
+from bank_account_project import Account
+
+
+class AsyncAccount:
+    """
+    **Summary:**
+
+    Wraps an `Account` behind an asyncio queue: every coroutine that calls `deposit`, `withdraw` or `pay_interest`
+    enqueues its operation and awaits the confirmation code, while a single worker task owns all mutations of the account.
+    Whatever has piled up in the queue when the worker wakes up is applied as one burst through `Account.apply_batch`,
+    so a burst of deposits becomes one balance update while returning the same codes as the synchronous methods.
+
+    **Methods:**
+
+    * `__init__(self, account: Account, max_burst: int = 1024)`: Wraps an account, bursts are capped at `max_burst` operations.
+    * `account (self) -> Account`: The wrapped account. (property)
+    * `async deposit(self, amount_to_deposit) -> str`: Deposits and returns the confirmation code.
+    * `async withdraw(self, amount_to_withdraw) -> str`: Withdraws (or gets rejected) and returns the confirmation code.
+    * `async pay_interest(self) -> str`: Pays interest and returns the confirmation code.
+    * `async close(self) -> None`: Stops the worker task. Operations still queued are not applied, their callers get a `RuntimeError`.
+
+    **Raises:**
+
+    * `ValueError`: Straight away, before queueing, if the operation is invalid (same checks as `Account`).
+    * `RuntimeError`: If an operation is submitted after `close`, or was still queued when `close` ran.
+    """
+
+    def __init__(self, account: Account, max_burst: int = 1024) -> None:
+        if max_burst < 1:
+            raise ValueError("max_burst must be positive")
+        self._account = account
+        self._max_burst = max_burst
+        self._queue = None
+        self._worker = None
+        self._closed = False
+
+    @property
+    def account(self):
+        return self._account
+
+    async def deposit(self, amount_to_deposit):
+        return await self._submit(Account.validate_transaction("deposit", amount_to_deposit))
+
+    async def withdraw(self, amount_to_withdraw):
+        return await self._submit(Account.validate_transaction("withdraw", amount_to_withdraw))
+
+    async def pay_interest(self):
+        return await self._submit(Account.validate_transaction("interest"))
+
+    async def _submit(self, op):
+        if self._closed:
+            raise RuntimeError(f"AsyncAccount {self._account.account_number} is closed")
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((op, future))
+        return await future
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            burst = [await queue.get()]
+            while len(burst) < self._max_burst and not queue.empty():
+                burst.append(queue.get_nowait())
+            self._apply(burst)
+
+    def _apply(self, burst):
+        try:
+            codes = self._account.apply_batch([op for op, _ in burst])
+        except Exception as ex:
+            for _, future in burst:
+                if not future.done():
+                    future.set_exception(ex)
+            return
+
+        for (_, future), code in zip(burst, codes):
+            #a caller that was cancelled still had its operation applied, there is just nobody to tell
+            if not future.done():
+                future.set_result(code)
+
+    async def close(self) -> None:
+        self._closed = True
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        #the worker only stops while waiting on the queue, so whatever is left was never applied
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError(f"AsyncAccount {self._account.account_number} was closed before the operation ran"))
+
+    def __repr__(self):
+        return f"AsyncAccount({self._account!r})"
+
+
+class AsyncAccountService:
+    """
+    **Summary:**
+
+    Routes awaitable operations to the `AsyncAccount` that owns each account number.
+
+    **Methods:**
+
+    * `register(self, account: Account) -> AsyncAccount`: Adds an account to the service.
+    * `get(self, account_number: str) -> AsyncAccount`: Returns the async wrapper of an account.
+    * `async deposit(self, account_number, amount_to_deposit) -> str`
+    * `async withdraw(self, account_number, amount_to_withdraw) -> str`
+    * `async pay_interest(self, account_number) -> str`
+    * `async close(self) -> None`: Stops every worker task.
+
+    **Raises:**
+
+    * `ValueError`: If an account is registered twice or an account number is unknown.
+    """
+
+    def __init__(self, accounts=(), max_burst: int = 1024) -> None:
+        self._max_burst = max_burst
+        self._accounts = {}
+        for account in accounts:
+            self.register(account)
+
+    def register(self, account: Account) -> AsyncAccount:
+        if account.account_number in self._accounts:
+            raise ValueError(f"Account {account.account_number} is already registered")
+        async_account = self._accounts[account.account_number] = AsyncAccount(account, self._max_burst)
+        return async_account
+
+    def get(self, account_number: str) -> AsyncAccount:
+        try:
+            return self._accounts[account_number]
+        except KeyError:
+            raise ValueError(f"Unknown account {account_number}") from None
+
+    async def deposit(self, account_number, amount_to_deposit):
+        return await self.get(account_number).deposit(amount_to_deposit)
+
+    async def withdraw(self, account_number, amount_to_withdraw):
+        return await self.get(account_number).withdraw(amount_to_withdraw)
+
+    async def pay_interest(self, account_number):
+        return await self.get(account_number).pay_interest()
+
+    async def close(self) -> None:
+        await asyncio.gather(*(a.close() for a in self._accounts.values()))
+
+    def __len__(self):
+        return len(self._accounts)
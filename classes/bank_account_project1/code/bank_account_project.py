@@ -2,6 +2,35 @@ from datetime import timedelta, datetime,timezone
 from collections import namedtuple
 import itertools
 import numbers
+import time
+
+#********************************************************************************
+#************************UTC clock***********************************************
+class _SecondTick:
+    """
+    **Summary:**
+
+    Caches the formatted UTC timestamp used inside confirmation codes, so `strftime` runs once per second-tick instead of once per transaction.
+
+    **Methods:**
+
+    * `now(self) -> tuple`: Returns `(epoch_seconds, "YYYYmmddHHMMSS")` for the current UTC second.
+    """
+    __slots__ = ("_tick",)
+
+    def __init__(self):
+        self._tick = (None, "")
+
+    def now(self):
+        epoch = int(time.time())
+        tick = self._tick
+        if tick[0] != epoch:
+            #the tuple is swapped in one assignment so readers never see a half updated tick
+            tick = (epoch, time.strftime("%Y%m%d%H%M%S", time.gmtime(epoch)))
+            self._tick = tick
+        return tick
+
+_utc_clock = _SecondTick()
 
 #********************************************************************************
 #************************TimeZone Class*******************************************
@@ -10,6 +39,8 @@ class TimeZone:
     **Summary:**
 
     Represents a time zone with its name and offset from Coordinated Universal Time (UTC).
+    Time zones are immutable flyweights: constructing one with the same (name, hours, minutes) returns the cached instance,
+    so only the first construction pays for the validation and the `timedelta` objects.
 
     **Attributes:**
 
@@ -20,10 +51,12 @@ class TimeZone:
 
     **Methods:**
 
-    * `__init__(self, name: str, offset_hours: int, offset_minutes: int)`: Initializes a `TimeZone` object with the given name and offset.
+    * `__new__(cls, name: str, offset_hours: int, offset_minutes: int)`: Returns the registered `TimeZone` for the given name and offset, creating and validating it on first use.
     * `offset(self) -> timedelta`: Returns the time offset from UTC.
     * `name(self) -> str`: Returns the name of the time zone.
+    * `offset_hours(self) -> int`, `offset_minutes(self) -> int`: Return the components the time zone was created with.
     * `__eq__(self, other_timezone) -> bool`: Compares two `TimeZone` objects for equality.
+    * `__hash__(self) -> int`: Hashes on the name and offset, so time zones can be used as dict keys.
     * `__repr__(self) -> str`: Returns a string representation of the `TimeZone` object.
 
     **Raises:**
@@ -34,10 +67,16 @@ class TimeZone:
         * The offset minutes are outside the range of -59 to 59.
         * The total offset is outside the range of -12:00 to 14:00.
     """
-    def __init__(self, name: str, offset_hours: int, offset_minutes: int):
+    __slots__ = ("_name", "_offset_hours", "_offset_minutes", "_offset")
+
+    _registry = {}
+
+    _MIN_OFFSET = timedelta(hours=-12, minutes=0)
+    _MAX_OFFSET = timedelta(hours=14, minutes=0)
+
+    def __new__(cls, name: str, offset_hours: int, offset_minutes: int):
         if name is None:
             raise ValueError("Timezone name can not be empty")
-        self._name = name.strip()
 
         if not isinstance(offset_hours, int):
             raise ValueError("Hour offset must be an integer")
@@ -46,17 +85,27 @@ class TimeZone:
         if not isinstance(offset_minutes, int):
             raise ValueError("Hour offset must be an integer")
 
+        key = (cls, name, offset_hours, offset_minutes)
+        time_zone = cls._registry.get(key)
+        if time_zone is not None:
+            return time_zone
+
         if offset_minutes > 59 or offset_minutes < -59:
             raise ValueError("Minutes offset must be between -59 and 59")
 
         offset = timedelta(hours=offset_hours, minutes=offset_minutes)
 
-        if offset < timedelta(hours=-12, minutes=0) or offset > timedelta(hours=14, minutes= 0):
+        if offset < TimeZone._MIN_OFFSET or offset > TimeZone._MAX_OFFSET:
             raise ValueError("Offset must be between -12:00 and 14:00")
 
-        self._offset_hours = offset_hours
-        self._offset_minutes = offset_minutes
-        self._offset = offset
+        time_zone = super().__new__(cls)
+        time_zone._name = name.strip()
+        time_zone._offset_hours = offset_hours
+        time_zone._offset_minutes = offset_minutes
+        time_zone._offset = offset
+
+        cls._registry[key] = time_zone
+        return time_zone
 
 
     @property
@@ -66,16 +115,72 @@ class TimeZone:
     @property
     def name(self):
         return self._name
+
+    @property
+    def offset_hours(self):
+        return self._offset_hours
+
+    @property
+    def offset_minutes(self):
+        return self._offset_minutes
     
     def __eq__(self, other_timezone):
         return (isinstance(other_timezone, TimeZone) and
                 self._name == other_timezone._name and
                 self._offset == other_timezone._offset)
 
+    def __hash__(self):
+        return hash((self._name, self._offset))
+
+    def __reduce__(self):
+        #__new__ needs its arguments, so pickling goes back through the registry
+        return (type(self), (self._name, self._offset_hours, self._offset_minutes))
+
     def __repr__(self):
-        return (f"TimeZone(name='{self.name}'", 
-                f"offset_hours= {self._offset_hours}", 
-                f"offset_minutes = {self._offset_minutes}")
+        return (f"TimeZone(name='{self.name}', "
+                f"offset_hours={self._offset_hours}, "
+                f"offset_minutes={self._offset_minutes})")
+
+
+def convert_many(utc_datetimes, tz):
+    """
+    Renders many UTC times in the preferred time zone, in the same format as `Account.parse_confirmation_code`.
+
+    Confirmations made in the same second share one rendered string, so a million confirmations cost one
+    `strftime` per distinct second rather than one per item.
+
+    **Args:**
+
+    * `utc_datetimes (iterable)`: UTC `datetime` objects, or the raw `YYYYmmddHHMMSS` stamps found in confirmation codes.
+    * `tz (TimeZone)`: The time zone to render in.
+
+    **Returns:**
+
+    * `list`: Strings like `2024-02-29 20:03:06 (GMT-5)`, in input order.
+
+    **Raises:**
+
+    * `ValueError`: If `tz` is not a `TimeZone`.
+    """
+    if not isinstance(tz, TimeZone):
+        raise ValueError("Invalid TimeZone object")
+
+    offset = tz.offset
+    suffix = f" ({tz.name})"
+    rendered = {}
+    result = []
+    append = result.append
+
+    for dt_utc in utc_datetimes:
+        text = rendered.get(dt_utc)
+        if text is None:
+            dt = dt_utc
+            if isinstance(dt, str):
+                dt = datetime(int(dt[0:4]), int(dt[4:6]), int(dt[6:8]), int(dt[8:10]), int(dt[10:12]), int(dt[12:14]))
+            text = rendered[dt_utc] = f"{(dt + offset).strftime('%Y-%m-%d %H:%M:%S')}{suffix}"
+        append(text)
+
+    return result
     
 
 #time_zone1 = TimeZone("ABC", 2, 4)
@@ -135,12 +240,20 @@ class Account:
     * `deposit(self, amount_to_deposit: numbers.Real) -> str`: Deposits a specified amount and returns a confirmation code.
     * `withdraw(self, amount_to_withdraw: numbers.Real) -> str`: Attempts to withdraw an amount and returns a confirmation code (success or rejection).
     * `pay_interest(self) -> str`: Calculates and deposits interest, returning a confirmation code.
+    * `@staticmethod validate_transaction(operation: str, amount=None) -> tuple`: Validates one `(operation, amount)` pair and returns it normalized.
+    * `apply_batch(self, ops) -> list`: Validates a whole batch of `(operation, amount)` pairs up front, applies them in order and returns every confirmation code.
+    * `@classmethod attach_ledger(cls, ledger)`: Appends every following transaction of every account to `ledger` (a `ledger.Ledger`), `None` detaches it.
 """
     #this is going return a new transction id each time it gets called
     transaction_counter = itertools.count(100)
 
     _INTERES_RATE = 0.5
 
+    _MIN_DEPOSIT = 50000
+
+    #optional ledger.Ledger shared by all accounts, see attach_ledger
+    ledger = None
+
     _transactions_code = {
         "deposit" : "D",
         "withdraw" : "W",
@@ -174,6 +287,9 @@ class Account:
             raise ValueError("Balance can not be negative")
         self._balance = initial_balance
 
+        if Account.ledger is not None:
+            Account.ledger.append("O", account_number, _utc_clock.now()[0], 0, initial_balance)
+
 
     @property
     def account_number(self):
@@ -221,6 +337,15 @@ class Account:
         
         cls._INTERES_RATE = new_rate
 
+    @classmethod
+    def attach_ledger(cls, ledger):
+        if ledger is not None:
+            #resume the ids after the ones already in the ledger so codes stay unique across restarts
+            #type() keeps a thread-safe counter thread-safe, both it and itertools.count take a start value
+            counter = cls.transaction_counter
+            cls.transaction_counter = type(counter)(max(ledger.last_transaction_id + 1, next(counter)))
+        cls.ledger = ledger
+
     @staticmethod
     def validate_firstOrLast_name(value, fiel_title):
         if not isinstance(value, str) or len(value.strip()) == 0:
@@ -228,9 +353,18 @@ class Account:
         return value.strip().capitalize()
     
     def generate_confirmation_code(self, transaction_code:str) -> str:
-        dt_str = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+        dt_str = _utc_clock.now()[1]
         return f"{transaction_code}-{self.account_number}-{dt_str}-{next(Account.transaction_counter)}"
 
+    def _record(self, transaction_code, amount):
+        epoch, dt_str = _utc_clock.now()
+        transaction_id = next(Account.transaction_counter)
+
+        if Account.ledger is not None:
+            Account.ledger.append(transaction_code, self._account_number, epoch, transaction_id, amount)
+
+        return f"{transaction_code}-{self.account_number}-{dt_str}-{transaction_id}"
+
 
     @staticmethod
     def parse_confirmation_code(confirmation_code, preferred_time_zone = None):
@@ -260,18 +394,36 @@ class Account:
         return Account.Confirmation(account_number, transaction_code, 
                             trasaction_counter_id,dt_utc.isoformat(), dt_preferred_str )
 
-    def deposit(self, amount_to_deposit):
-        min_deposit_value = 50000
+    @staticmethod
+    def validate_transaction(operation, amount = None):
+        if operation == "deposit":
+            if not isinstance(amount, numbers.Real):
+                raise ValueError("Deposit value must be a real number")
 
-        if not isinstance(amount_to_deposit, numbers.Real):
-            raise ValueError("Deposit value must be a real number")
-        
-        if amount_to_deposit < min_deposit_value:
-            raise ValueError(f"The minimun deposit value is {min_deposit_value}$")
+            if amount < Account._MIN_DEPOSIT:
+                raise ValueError(f"The minimun deposit value is {Account._MIN_DEPOSIT}$")
+
+        elif operation == "withdraw":
+            if not isinstance(amount, numbers.Real):
+                raise ValueError("Withdraw value must be a real number")
+
+            if amount <= 0:
+                raise ValueError("Withdraw can not be negative")
+
+        elif operation == "interest":
+            amount = None
+
+        else:
+            raise ValueError(f"Invalid operation {operation!r}, must be deposit, withdraw or interest")
+
+        return operation, amount
+
+    def deposit(self, amount_to_deposit):
+        Account.validate_transaction("deposit", amount_to_deposit)
 
         transaction_code = Account._transactions_code["deposit"]
 
-        confirmation_code = self.generate_confirmation_code(transaction_code)
+        confirmation_code = self._record(transaction_code, amount_to_deposit)
 
         self._balance += amount_to_deposit
 
@@ -281,11 +433,7 @@ class Account:
 
         accepted = False
 
-        if not isinstance(amount_to_withdraw, numbers.Real):
-            raise ValueError("Withdraw value must be a real number")
-        
-        if amount_to_withdraw <= 0:
-            raise ValueError("Withdraw can not be negative")
+        Account.validate_transaction("withdraw", amount_to_withdraw)
         
         if self.balance - amount_to_withdraw < 0:
             transaction_code = Account._transactions_code["rejected"]
@@ -294,7 +442,7 @@ class Account:
             accepted = True
             transaction_code = Account._transactions_code["withdraw"]
 
-        confirmation_code = self.generate_confirmation_code(transaction_code)
+        confirmation_code = self._record(transaction_code, amount_to_withdraw)
 
         if accepted:
             self._balance -= amount_to_withdraw
@@ -305,15 +453,105 @@ class Account:
     def pay_interest(self):
         interest_earn = self._balance * Account.get_interest_rate() / 100
 
-        confirmation_code = self.generate_confirmation_code(Account._transactions_code["interest"])
+        confirmation_code = self._record(Account._transactions_code["interest"], interest_earn)
 
         self._balance += interest_earn
 
         return confirmation_code
     
+    def apply_batch(self, ops):
+        #validate everything first so a bad operation leaves the account untouched
+        validated = [Account.validate_transaction(*op) for op in ops]
+        return self._apply_validated(validated, Account.transaction_counter)
+
+    def _apply_validated(self, validated, transaction_ids):
+        #same arithmetic as deposit/withdraw/pay_interest, but with the balance, rate
+        #and codes kept in locals for the whole batch
+        codes = []
+        append = codes.append
+        now = time.time
+        epoch, stamp = _utc_clock.now()
+        next_tick = epoch + 1
+        account_number = self._account_number
+        deposit_code, withdraw_code, interest_code, rejected_code = (
+            Account._transactions_code[k] for k in ("deposit", "withdraw", "interest", "rejected"))
+        rate = Account.get_interest_rate()
+        ledger = Account.ledger
+        balance = self._balance
+
+        for (operation, amount), transaction_id in zip(validated, transaction_ids):
+            if operation == "deposit":
+                transaction_code = deposit_code
+                balance += amount
+            elif operation == "withdraw":
+                if balance - amount < 0:
+                    transaction_code = rejected_code
+                else:
+                    transaction_code = withdraw_code
+                    balance -= amount
+            else:
+                transaction_code = interest_code
+                amount = balance * rate / 100
+                balance += amount
+
+            if now() >= next_tick:
+                epoch, stamp = _utc_clock.now()
+                next_tick = epoch + 1
+
+            if ledger is not None:
+                ledger.append(transaction_code, account_number, epoch, transaction_id, amount)
+
+            append(f"{transaction_code}-{account_number}-{stamp}-{transaction_id}")
+
+        self._balance = balance
+        return codes
+    
     def __repr__(self):
         return (f"Account = ({self._account_number}, {self._first_name}, {self._last_name})")
 
+
+def process_transactions(accounts, ops):
+    """
+    Applies a batch of `(account_number, operation, amount)` operations across many accounts.
+
+    Every operation is validated before any balance changes. Transaction ids are reserved
+    in the order the operations were given, so the codes are identical to calling
+    `deposit`/`withdraw`/`pay_interest` one by one, but each account is updated in a single pass.
+
+    **Args:**
+
+    * `accounts (dict)`: Maps account numbers to `Account` objects.
+    * `ops (iterable)`: `(account_number, operation, amount)` tuples, `operation` being deposit, withdraw or interest.
+
+    **Returns:**
+
+    * `list`: The confirmation codes, in the same order as `ops`.
+
+    **Raises:**
+
+    * `ValueError`: If an account number is unknown or an operation is invalid.
+    """
+    per_account = {}
+    positions = []
+    for account_number, *op in ops:
+        if account_number not in accounts:
+            raise ValueError(f"Unknown account {account_number}")
+        validated = Account.validate_transaction(*op)
+        bucket = per_account.setdefault(account_number, [])
+        positions.append((account_number, len(bucket)))
+        bucket.append(validated)
+
+    transaction_ids = itertools.islice(Account.transaction_counter, len(positions))
+    ids_per_account = {account_number: [] for account_number in per_account}
+    for (account_number, _), transaction_id in zip(positions, transaction_ids):
+        ids_per_account[account_number].append(transaction_id)
+
+    codes_per_account = {account_number: accounts[account_number]._apply_validated(validated, ids_per_account[account_number])
+                         for account_number, validated in per_account.items()}
+
+    return [codes_per_account[account_number][i] for account_number, i in positions]
+
+
 a1 = Account("ABC111", "Juan", "Hernandez")
 
 """
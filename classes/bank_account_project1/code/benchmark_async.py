@@ -0,0 +1,53 @@
+"""
+Latency percentiles of AsyncAccountService under many concurrent clients
+command line: python benchmark_async.py -c 10000 -n 10 -a 100
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+
+import bank_account_project as ba
+from async_account import AsyncAccountService
+
+
+async def client(service, account_numbers, n, seed, latencies):
+    rng = random.Random(seed)
+    for _ in range(n):
+        account_number = rng.choice(account_numbers)
+        start = time.perf_counter()
+        if rng.random() < 0.6:
+            await service.deposit(account_number, 60000)
+        else:
+            await service.withdraw(account_number, rng.randint(1, 100000))
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(clients, n, n_accounts):
+    accounts = [ba.Account(f"ASYNC{i}", "Async", "Client") for i in range(n_accounts)]
+    service = AsyncAccountService(accounts)
+    account_numbers = [a.account_number for a in accounts]
+    latencies = []
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(service, account_numbers, n, seed, latencies) for seed in range(clients)))
+    elapsed = time.perf_counter() - start
+    await service.close()
+
+    return elapsed, latencies
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-c", "--clients", type=int, default=10000, help="Number of concurrent clients")
+    parser.add_argument("-n", "--operations", type=int, default=10, help="Operations per client")
+    parser.add_argument("-a", "--accounts", type=int, default=100, help="Number of accounts")
+    args = parser.parse_args()
+
+    elapsed, latencies = asyncio.run(run(args.clients, args.operations, args.accounts))
+    cuts = statistics.quantiles(latencies, n=100)
+
+    print(f"{len(latencies):,} ops in {elapsed:.2f}s ({len(latencies) / elapsed:,.0f} ops/s)")
+    print(f"p50={cuts[49] * 1000:.2f}ms  p95={cuts[94] * 1000:.2f}ms  p99={cuts[98] * 1000:.2f}ms")
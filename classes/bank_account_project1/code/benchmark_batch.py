@@ -0,0 +1,49 @@
+"""
+Compares the per-call transaction path (`deposit`/`withdraw`) against `Account.apply_batch`
+command line: python benchmark_batch.py -n 1000000
+"""
+
+import argparse
+import time
+
+import bank_account_project as ba
+
+
+def build_ops(n):
+    return [("deposit", 60000) if i % 2 == 0 else ("withdraw", 1000) for i in range(n)]
+
+
+def per_call(ops):
+    account = ba.Account("BENCH1", "Bench", "Mark")
+    start = time.perf_counter()
+    for operation, amount in ops:
+        if operation == "deposit":
+            account.deposit(amount)
+        else:
+            account.withdraw(amount)
+    return time.perf_counter() - start, account.balance
+
+
+def batched(ops):
+    account = ba.Account("BENCH2", "Bench", "Mark")
+    start = time.perf_counter()
+    account.apply_batch(ops)
+    return time.perf_counter() - start, account.balance
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--operations", type=int, default=1_000_000,
+                        help="Number of operations to run through each path")
+    args = parser.parse_args()
+
+    ops = build_ops(args.operations)
+
+    single_elapsed, single_balance = per_call(ops)
+    batch_elapsed, batch_balance = batched(ops)
+
+    assert single_balance == batch_balance
+
+    print(f"per-call : {single_elapsed:.3f}s ({args.operations / single_elapsed:,.0f} ops/s)")
+    print(f"batch    : {batch_elapsed:.3f}s ({args.operations / batch_elapsed:,.0f} ops/s)")
+    print(f"speedup  : {single_elapsed / batch_elapsed:.2f}x")
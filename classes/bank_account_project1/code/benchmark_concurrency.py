@@ -0,0 +1,70 @@
+"""
+Multi-threaded stress benchmark for SafeAccount
+command line: python benchmark_concurrency.py -t 32 -n 20000 --optimistic
+"""
+
+import argparse
+import random
+import threading
+import time
+
+from concurrent_account import SafeAccount
+
+
+def worker(accounts, n, optimistic, seed, results):
+    rng = random.Random(seed)
+    codes = []
+    for _ in range(n):
+        account = rng.choice(accounts)
+        if rng.random() < 0.3:
+            amount = rng.randint(50000, 100000)
+            codes.append(("deposit", amount, account.deposit(amount)))
+        else:
+            amount = rng.randint(1, 100000)
+            withdraw = account.withdraw_optimistic if optimistic else account.withdraw
+            codes.append(("withdraw", amount, withdraw(amount)))
+    results.append(codes)
+
+
+def run(threads, n, n_accounts, optimistic):
+    accounts = [SafeAccount(f"STRESS{i}", "Stress", "Test", initial_balance=100000) for i in range(n_accounts)]
+    results = []
+    pool = [threading.Thread(target=worker, args=(accounts, n, optimistic, seed, results)) for seed in range(threads)]
+
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    elapsed = time.perf_counter() - start
+
+    #every balance must be reproducible from the accepted transactions and never negative
+    expected = {a.account_number: 100000 for a in accounts}
+    ids = set()
+    for codes in results:
+        for operation, amount, code in codes:
+            transaction_code, account_number, _, transaction_id = code.split("-")
+            ids.add(transaction_id)
+            if transaction_code == "D":
+                expected[account_number] += amount
+            elif transaction_code == "W":
+                expected[account_number] -= amount
+
+    total_ops = threads * n
+    assert len(ids) == total_ops, "duplicate transaction ids"
+    assert all(a.balance >= 0 for a in accounts), "overdraft detected"
+    assert all(expected[a.account_number] == a.balance for a in accounts), "lost update detected"
+
+    return total_ops / elapsed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-t", "--threads", type=int, default=32, help="Number of worker threads")
+    parser.add_argument("-n", "--operations", type=int, default=20000, help="Operations per thread")
+    parser.add_argument("-a", "--accounts", type=int, default=16, help="Number of shared accounts")
+    parser.add_argument("--optimistic", action="store_true", help="Use withdraw_optimistic instead of withdraw")
+    args = parser.parse_args()
+
+    ops_per_sec = run(args.threads, args.operations, args.accounts, args.optimistic)
+    print(f"{args.threads} threads, {args.accounts} accounts: {ops_per_sec:,.0f} ops/s, no overdrafts, no lost updates")
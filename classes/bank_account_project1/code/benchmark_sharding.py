@@ -0,0 +1,45 @@
+"""
+Scaling benchmark of ShardedAccounts from 1 to N shards
+command line: python benchmark_sharding.py -n 1000000 -a 10000 -s 4
+"""
+
+import argparse
+import os
+import random
+import time
+
+import bank_account_project as ba
+from sharding import ShardedAccounts
+
+
+def build_ops(n, account_numbers, seed=0):
+    rng = random.Random(seed)
+    return [(rng.choice(account_numbers), "deposit", 60000) if rng.random() < 0.5
+            else (rng.choice(account_numbers), "withdraw", rng.randint(1, 100000)) for _ in range(n)]
+
+
+def run(shards, ops, account_numbers, batch_size):
+    with ShardedAccounts(shards) as sharded:
+        sharded.open_accounts(ba.Account(number, "Shard", "Bench") for number in account_numbers)
+        start = time.perf_counter()
+        for i in range(0, len(ops), batch_size):
+            sharded.process(ops[i:i + batch_size])
+        return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--operations", type=int, default=1_000_000, help="Number of operations")
+    parser.add_argument("-a", "--accounts", type=int, default=10000, help="Number of accounts")
+    parser.add_argument("-s", "--max-shards", type=int, default=os.cpu_count(), help="Largest number of shards to try")
+    parser.add_argument("-b", "--batch-size", type=int, default=100000, help="Operations routed per batch")
+    args = parser.parse_args()
+
+    account_numbers = [f"SHARD{i:06d}" for i in range(args.accounts)]
+    ops = build_ops(args.operations, account_numbers)
+
+    baseline = None
+    for shards in range(1, args.max_shards + 1):
+        elapsed = run(shards, ops, account_numbers, args.batch_size)
+        baseline = baseline or elapsed
+        print(f"{shards:>2} shards: {elapsed:.2f}s ({args.operations / elapsed:,.0f} ops/s, {baseline / elapsed:.2f}x)")
@@ -0,0 +1,172 @@
+"""Thread-safe accounts: lock striping, atomic transaction ids and optimistic updates"""
+
+import threading
+
+from bank_account_project import Account
+
+
+class AtomicCounter:
+    """
+    **Summary:**
+
+    Thread-safe drop-in replacement for the `itertools.count` stored in `Account.transaction_counter`.
+
+    **Methods:**
+
+    * `__next__(self) -> int`: Returns the next id.
+    * `reserve(self, n: int) -> range`: Atomically reserves `n` consecutive ids.
+    """
+
+    def __init__(self, start: int = 0) -> None:
+        self._lock = threading.Lock()
+        self._next = start
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            value = self._next
+            self._next += 1
+        return value
+
+    def reserve(self, n: int) -> range:
+        with self._lock:
+            start = self._next
+            self._next += n
+        return range(start, start + n)
+
+    def __repr__(self):
+        return f"AtomicCounter({self._next})"
+
+
+class LockStripes:
+    """
+    **Summary:**
+
+    A fixed pool of locks shared by all accounts: each account number always maps to the same lock,
+    so memory stays bounded no matter how many accounts exist, while unrelated accounts rarely contend.
+
+    **Methods:**
+
+    * `lock_for(self, account_number: str) -> threading.Lock`: Returns the lock guarding an account.
+    """
+
+    def __init__(self, stripes: int = 64) -> None:
+        if stripes < 1:
+            raise ValueError("stripes must be positive")
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def lock_for(self, account_number: str):
+        return self._locks[hash(account_number) % len(self._locks)]
+
+    def __len__(self):
+        return len(self._locks)
+
+
+_setup_lock = threading.Lock()
+_ledger_lock = threading.Lock()
+
+
+def enable_thread_safety() -> None:
+    """
+    Swaps `Account.transaction_counter` for an `AtomicCounter` that continues from the current id.
+    Safe to call more than once.
+    """
+    with _setup_lock:
+        if not isinstance(Account.transaction_counter, AtomicCounter):
+            Account.transaction_counter = AtomicCounter(next(Account.transaction_counter))
+
+
+class SafeAccount(Account):
+    """
+    **Summary:**
+
+    An `Account` whose mutations are serialized per account through `LockStripes`, so a withdraw
+    check-then-debit can never race with another transaction on the same account.
+
+    **Attributes:**
+
+    * Inherits all attributes from the `Account` class.
+    * `version (int)`: Incremented on every committed transaction. (read-only)
+
+    **Methods:**
+
+    * Overrides `deposit`, `withdraw`, `pay_interest` and `apply_batch` to run under the account's stripe lock.
+    * `withdraw_optimistic(self, amount_to_withdraw) -> str`: Computes the withdraw without holding the lock and commits it
+      only if `version` did not change in between (compare-and-swap emulated with the stripe lock), retrying otherwise.
+
+    **Notes:**
+
+    * Creating a `SafeAccount` calls `enable_thread_safety`, so transaction ids stay unique under threads.
+    * Appends to `Account.ledger` are serialized by a module level lock, since one ledger is shared by every account.
+    """
+
+    stripes = LockStripes()
+
+    def __init__(self, account_number: str, first_name: str, last_name: str,
+                 prefer_timezone = None, initial_balance = 0.0):
+        enable_thread_safety()
+        with _ledger_lock:
+            super().__init__(account_number, first_name, last_name, prefer_timezone, initial_balance)
+        self._lock = SafeAccount.stripes.lock_for(account_number)
+        self._version = 0
+
+    @property
+    def version(self):
+        return self._version
+
+    def _record(self, transaction_code, amount):
+        if Account.ledger is None:
+            return super()._record(transaction_code, amount)
+        with _ledger_lock:
+            return super()._record(transaction_code, amount)
+
+    def deposit(self, amount_to_deposit):
+        with self._lock:
+            confirmation_code = super().deposit(amount_to_deposit)
+            self._version += 1
+        return confirmation_code
+
+    def withdraw(self, amount_to_withdraw):
+        with self._lock:
+            confirmation_code = super().withdraw(amount_to_withdraw)
+            self._version += 1
+        return confirmation_code
+
+    def pay_interest(self):
+        with self._lock:
+            confirmation_code = super().pay_interest()
+            self._version += 1
+        return confirmation_code
+
+    def apply_batch(self, ops):
+        validated = [Account.validate_transaction(*op) for op in ops]
+        with self._lock:
+            if Account.ledger is None:
+                codes = self._apply_validated(validated, Account.transaction_counter.reserve(len(validated)))
+            else:
+                with _ledger_lock:
+                    codes = self._apply_validated(validated, Account.transaction_counter.reserve(len(validated)))
+            self._version += 1
+        return codes
+
+    def withdraw_optimistic(self, amount_to_withdraw):
+        Account.validate_transaction("withdraw", amount_to_withdraw)
+
+        while True:
+            version = self._version
+            balance = self._balance
+            accepted = balance - amount_to_withdraw >= 0
+
+            with self._lock:
+                if self._version != version:
+                    #someone committed in between, start again from the new balance
+                    continue
+
+                transaction_code = Account._transactions_code["withdraw" if accepted else "rejected"]
+                confirmation_code = self._record(transaction_code, amount_to_withdraw)
+                if accepted:
+                    self._balance = balance - amount_to_withdraw
+                self._version += 1
+                return confirmation_code
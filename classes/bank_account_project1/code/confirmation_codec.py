@@ -0,0 +1,133 @@
+"""Compact binary / base32 encoding of confirmation codes"""
+
+import base64
+import calendar
+from datetime import datetime
+import struct
+import time
+
+from bank_account_project import Account, TimeZone, convert_many
+
+#transaction code, account number (zero padded), UTC epoch seconds, transaction id
+CODE = struct.Struct("<c16sqq")
+ACCOUNT_WIDTH = 16
+
+
+def _stamp_to_epoch(raw_dt_utc):
+    #same check as Account.parse_confirmation_code, timegm alone would roll month 13 or day 32 into a real date
+    if len(raw_dt_utc) != 14 or not raw_dt_utc.isdigit():
+        raise ValueError("Invalid transaction datetime")
+    try:
+        dt_utc = datetime.strptime(raw_dt_utc, "%Y%m%d%H%M%S")
+    except ValueError as ex:
+        raise ValueError("Invalid transaction datetime") from ex
+    if dt_utc.strftime("%Y%m%d%H%M%S") != raw_dt_utc:
+        raise ValueError("Invalid transaction datetime")
+    return calendar.timegm(dt_utc.timetuple())
+
+
+def _transaction_id(raw_transaction_id):
+    #ids are stored as integers, so a leading zero (or a sign) could not be decoded back
+    if not raw_transaction_id.isdigit() or (raw_transaction_id[0] == "0" and raw_transaction_id != "0"):
+        raise ValueError("Invalid transaction id")
+    return int(raw_transaction_id)
+
+
+def _epoch_to_stamp(epoch):
+    return time.strftime("%Y%m%d%H%M%S", time.gmtime(epoch))
+
+
+def _pack(confirmation_code, epochs):
+    parts = confirmation_code.split("-")
+    if len(parts) != 4:
+        raise ValueError("Invalid confirmation Code")
+
+    transaction_code, account_number, raw_dt_utc, transaction_id = parts
+
+    account = account_number.encode("ascii")
+    if len(account) > ACCOUNT_WIDTH or len(transaction_code) != 1:
+        raise ValueError("Invalid confirmation Code")
+
+    epoch = epochs.get(raw_dt_utc)
+    if epoch is None:
+        epoch = epochs[raw_dt_utc] = _stamp_to_epoch(raw_dt_utc)
+
+    return CODE.pack(transaction_code.encode("ascii"), account, epoch, _transaction_id(transaction_id))
+
+
+def encode(confirmation_code: str) -> bytes:
+    """
+    Packs a confirmation code like `D-ABC111-20240301010306-100` into 33 bytes.
+
+    **Raises:**
+
+    * `ValueError`: If the code is malformed, its timestamp is not a real date, its transaction id has a leading zero
+      or the account number is longer than 16 characters.
+    """
+    return _pack(confirmation_code, {})
+
+
+def encode_many(confirmation_codes) -> bytes:
+    """
+    Packs many confirmation codes into one contiguous buffer of `CODE.size` byte records.
+    Each distinct timestamp is converted to an epoch only once.
+    """
+    epochs = {}
+    return b"".join(_pack(confirmation_code, epochs) for confirmation_code in confirmation_codes)
+
+
+def decode(packed: bytes) -> str:
+    """Turns 33 packed bytes back into the human-readable confirmation code."""
+    return decode_many(packed)[0]
+
+
+def decode_many(buffer) -> list:
+    """
+    Unpacks a buffer built by `encode_many` (or read back from disk) into confirmation code strings.
+
+    **Raises:**
+
+    * `ValueError`: If the buffer length is not a multiple of `CODE.size`.
+    """
+    if len(buffer) % CODE.size:
+        raise ValueError(f"Buffer length must be a multiple of {CODE.size}")
+
+    stamps = {}
+    codes = []
+    append = codes.append
+    for transaction_code, account, epoch, transaction_id in CODE.iter_unpack(buffer):
+        stamp = stamps.get(epoch)
+        if stamp is None:
+            stamp = stamps[epoch] = _epoch_to_stamp(epoch)
+        account_number = account.rstrip(b"\0").decode("ascii")
+        append(f"{transaction_code.decode('ascii')}-{account_number}-{stamp}-{transaction_id}")
+    return codes
+
+
+def to_base32(packed: bytes) -> str:
+    """Text form of a packed code, safe for URLs and case-insensitive channels (padding removed)."""
+    return base64.b32encode(packed).decode("ascii").rstrip("=")
+
+
+def from_base32(text: str) -> bytes:
+    """Inverse of `to_base32`."""
+    return base64.b32decode(text.upper() + "=" * (-len(text) % 8))
+
+
+def to_confirmation(packed: bytes, preferred_time_zone=None):
+    """
+    Builds the same `Account.Confirmation` namedtuple as `Account.parse_confirmation_code`, without `strptime`.
+
+    **Raises:**
+
+    * `ValueError`: If `preferred_time_zone` is not a `TimeZone`.
+    """
+    transaction_code, account, epoch, transaction_id = CODE.unpack(packed)
+    dt_utc = datetime(*time.gmtime(epoch)[:6])
+
+    if preferred_time_zone is None:
+        preferred_time_zone = TimeZone("UTC", 0, 0)
+
+    return Account.Confirmation(account.rstrip(b"\0").decode("ascii"), transaction_code.decode("ascii"),
+                                str(transaction_id), dt_utc.isoformat(),
+                                convert_many((dt_utc,), preferred_time_zone)[0])
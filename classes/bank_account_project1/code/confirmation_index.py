@@ -0,0 +1,131 @@
+"""Indexed lookups over confirmation codes"""
+
+from array import array
+from bisect import bisect_left, bisect_right, insort
+
+
+class ConfirmationIndex:
+    """
+    **Summary:**
+
+    Keeps the confirmation codes returned by `Account.deposit`, `withdraw`, `pay_interest` and `apply_batch`,
+    indexed so they can be found again without scanning everything that was logged.
+
+    **Indexes:**
+
+    * Transaction id: a hash map for O(1) point lookups plus a sorted `array` of ids for range queries.
+    * Account number: a hash map from account number to the positions of its codes.
+    * UTC time: one bucket per minute, with the bucket keys kept sorted. Each bucket keeps its stamps in a sorted `array`
+      (codes arrive almost in time order, so this is almost always an append), so the edges of a time range are found
+      with `bisect` and a range costs O(log n + k).
+
+    **Methods:**
+
+    * `ingest(self, confirmation_code: str) -> None`: Adds one code to every index.
+    * `ingest_many(self, confirmation_codes) -> None`: Adds several codes.
+    * `get(self, transaction_id: int) -> str`: Returns the code of a transaction, or `None`.
+    * `by_account(self, account_number: str) -> list`: Returns the codes of an account, in ingestion order.
+    * `by_transaction_range(self, first_id: int, last_id: int) -> list`: Returns the codes with `first_id <= id <= last_id`, ordered by id.
+    * `by_time_range(self, start: datetime, end: datetime) -> list`: Returns the codes made between two UTC datetimes (inclusive), ordered by time.
+
+    **Raises:**
+
+    * `ValueError`: If a confirmation code is malformed or its transaction id was already ingested.
+    """
+
+    def __init__(self, confirmation_codes=()) -> None:
+        self._codes = []
+        self._positions_by_id = {}
+        self._sorted_ids = array("q")
+        self._sorted_positions = array("q")
+        self._positions_by_account = {}
+        self._time_buckets = {}
+        self._bucket_keys = []
+
+        self.ingest_many(confirmation_codes)
+
+    def ingest(self, confirmation_code: str) -> None:
+        parts = confirmation_code.split("-")
+        if len(parts) != 4:
+            raise ValueError("Invalid confirmation Code")
+
+        _, account_number, raw_dt_utc, raw_transaction_id = parts
+
+        if len(raw_dt_utc) != 14 or not raw_dt_utc.isdigit() or not raw_transaction_id.isdigit():
+            raise ValueError("Invalid confirmation Code")
+
+        transaction_id = int(raw_transaction_id)
+        if transaction_id in self._positions_by_id:
+            raise ValueError(f"Transaction {transaction_id} was already ingested")
+
+        position = len(self._codes)
+        self._codes.append(confirmation_code)
+        self._positions_by_id[transaction_id] = position
+
+        #ids are generated in increasing order, so this is almost always an append
+        if not self._sorted_ids or self._sorted_ids[-1] < transaction_id:
+            self._sorted_ids.append(transaction_id)
+            self._sorted_positions.append(position)
+        else:
+            i = bisect_left(self._sorted_ids, transaction_id)
+            self._sorted_ids.insert(i, transaction_id)
+            self._sorted_positions.insert(i, position)
+
+        self._positions_by_account.setdefault(account_number, []).append(position)
+
+        stamp = int(raw_dt_utc)
+        bucket_key = stamp // 100
+        bucket = self._time_buckets.get(bucket_key)
+        if bucket is None:
+            bucket = self._time_buckets[bucket_key] = (array("q"), array("q"))
+            insort(self._bucket_keys, bucket_key)
+        stamps, positions = bucket
+        if not stamps or stamps[-1] <= stamp:
+            stamps.append(stamp)
+            positions.append(position)
+        else:
+            #after the codes with the same stamp, so they stay in ingestion order
+            i = bisect_right(stamps, stamp)
+            stamps.insert(i, stamp)
+            positions.insert(i, position)
+
+    def ingest_many(self, confirmation_codes) -> None:
+        for confirmation_code in confirmation_codes:
+            self.ingest(confirmation_code)
+
+    def get(self, transaction_id: int):
+        position = self._positions_by_id.get(transaction_id)
+        return None if position is None else self._codes[position]
+
+    def by_account(self, account_number: str) -> list:
+        codes = self._codes
+        return [codes[p] for p in self._positions_by_account.get(account_number, ())]
+
+    def by_transaction_range(self, first_id: int, last_id: int) -> list:
+        codes, positions = self._codes, self._sorted_positions
+        start = bisect_left(self._sorted_ids, first_id)
+        end = bisect_right(self._sorted_ids, last_id)
+        return [codes[positions[i]] for i in range(start, end)]
+
+    def by_time_range(self, start, end) -> list:
+        first = int(start.strftime("%Y%m%d%H%M%S"))
+        last = int(end.strftime("%Y%m%d%H%M%S"))
+        codes, keys = self._codes, self._bucket_keys
+
+        result = []
+        for i in range(bisect_left(keys, first // 100), bisect_right(keys, last // 100)):
+            stamps, positions = self._time_buckets[keys[i]]
+            #only the first and last buckets can hold codes outside the range, their edges are found with bisect
+            low = bisect_left(stamps, first) if keys[i] == first // 100 else 0
+            high = bisect_right(stamps, last) if keys[i] == last // 100 else len(stamps)
+            result.extend(codes[positions[j]] for j in range(low, high))
+        return result
+
+    def __len__(self):
+        return len(self._codes)
+
+    def __contains__(self, transaction_id):
+        return transaction_id in self._positions_by_id
+
+    def __repr__(self):
+        return f"ConfirmationIndex(codes={len(self._codes)}, accounts={len(self._positions_by_account)})"
@@ -0,0 +1,172 @@
+"""Append-only, memory-mapped transaction ledger"""
+
+import mmap
+import os
+import struct
+
+
+class Ledger:
+    """
+    **Summary:**
+
+    Persists every account transaction as a fixed-width binary record in an mmap-backed file.
+    Records are only made durable on a group commit (every `commit_every` appends, or when `commit` is called),
+    which writes the committed record count to the header and fsyncs the file once for the whole group.
+
+    **Record layout:**
+
+    * `transaction_code (1 byte)`: `D`, `W`, `I`, `R` like the confirmation codes, plus `O` for an opening/restored balance.
+    * `account_number (16 bytes)`: ASCII, padded with zeros.
+    * `epoch (int64)`: UTC epoch seconds of the transaction.
+    * `transaction_id (int64)`: The id used in the confirmation code (0 for `O` records).
+    * `amount (float64)`: The amount moved (the interest earned for `I`, the balance for `O`).
+
+    **Methods:**
+
+    * `__init__(self, path: str, commit_every: int = 1024, grow_by: int = 65536, last_transaction_id: int = 0)`: Opens (or creates) the ledger file.
+      `last_transaction_id` seeds a new file, so ids keep increasing when a ledger replaces an older one.
+    * `append(self, transaction_code, account_number, epoch, transaction_id, amount) -> None`: Appends one record.
+    * `commit(self) -> None`: Makes every appended record durable.
+    * `records(self) -> iterator`: Yields the records committed when it is called, as `(transaction_code, account_number, epoch, transaction_id, amount)`.
+      Appending while the iterator is open is fine.
+    * `balances(self, initial: dict = None) -> dict`: Rebuilds the balance of every account by scanning the mapped file.
+    * `last_transaction_id (self) -> int`: The highest transaction id in the ledger. (property)
+    * `close(self) -> None`: Commits and closes the file.
+
+    **Raises:**
+
+    * `ValueError`: If the file is not a ledger or an account number does not fit in 16 bytes.
+    """
+
+    MAGIC = b"BALEDGR1"
+    HEADER = struct.Struct("<8sqq")
+    RECORD = struct.Struct("<c16sqqd")
+    ACCOUNT_WIDTH = 16
+
+    _CREDITS = (b"D", b"I")
+    _DEBITS = (b"W",)
+    _OPENING = b"O"
+    _RECORDS_PER_BLOCK = 4096
+
+    def __init__(self, path: str, commit_every: int = 1024, grow_by: int = 65536, last_transaction_id: int = 0) -> None:
+        if commit_every < 1 or grow_by < 1:
+            raise ValueError("commit_every and grow_by must be positive")
+
+        self._path = path
+        self._commit_every = commit_every
+        self._grow_by = grow_by
+
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "w+b" if new_file else "r+b")
+
+        if new_file:
+            self._file.truncate(self.HEADER.size + grow_by * self.RECORD.size)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            self.HEADER.pack_into(self._mm, 0, self.MAGIC, 0, last_transaction_id)
+            self._count = 0
+            self._last_transaction_id = last_transaction_id
+        else:
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            magic, self._count, self._last_transaction_id = self.HEADER.unpack_from(self._mm, 0)
+            if magic != self.MAGIC:
+                self._mm.close()
+                self._file.close()
+                raise ValueError(f"{path} is not a transaction ledger")
+
+        self._committed = self._count
+        self._capacity = (len(self._mm) - self.HEADER.size) // self.RECORD.size
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def last_transaction_id(self):
+        return self._last_transaction_id
+
+    def __len__(self):
+        return self._count
+
+    def append(self, transaction_code: str, account_number: str, epoch: int, transaction_id: int, amount) -> None:
+        account = account_number.encode("ascii")
+        if len(account) > self.ACCOUNT_WIDTH:
+            raise ValueError(f"Account number can not be longer than {self.ACCOUNT_WIDTH} characters")
+
+        if self._count == self._capacity:
+            self._grow()
+
+        self.RECORD.pack_into(self._mm, self.HEADER.size + self._count * self.RECORD.size,
+                              transaction_code.encode("ascii"), account, epoch, transaction_id, amount)
+        self._count += 1
+
+        if transaction_id > self._last_transaction_id:
+            self._last_transaction_id = transaction_id
+
+        if self._count - self._committed >= self._commit_every:
+            self.commit()
+
+    def commit(self) -> None:
+        if self._count == self._committed:
+            return
+        #the records go to disk before the header that makes them visible
+        self._mm.flush()
+        self.HEADER.pack_into(self._mm, 0, self.MAGIC, self._count, self._last_transaction_id)
+        self._mm.flush(0, self.HEADER.size)
+        os.fsync(self._file.fileno())
+        self._committed = self._count
+
+    def _grow(self):
+        self._mm.flush()
+        self._mm.close()
+        self._capacity += self._grow_by
+        self._file.truncate(self.HEADER.size + self._capacity * self.RECORD.size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def _view(self):
+        return memoryview(self._mm)[self.HEADER.size:self.HEADER.size + self._committed * self.RECORD.size]
+
+    def records(self):
+        #blocks are copied out of the map instead of exporting a buffer, so appends (and the remap in `_grow`)
+        #still work while a caller holds the generator; `self._mm` is looked up again for every block for that reason
+        block = self._RECORDS_PER_BLOCK * self.RECORD.size
+        end = self.HEADER.size + self._committed * self.RECORD.size
+        for start in range(self.HEADER.size, end, block):
+            chunk = self._mm[start:min(start + block, end)]
+            for code, account, epoch, transaction_id, amount in self.RECORD.iter_unpack(chunk):
+                yield code.decode("ascii"), account.rstrip(b"\0").decode("ascii"), epoch, transaction_id, amount
+
+    def balances(self, initial: dict = None) -> dict:
+        #accounts stay as raw bytes while scanning, they are decoded once at the end
+        balances = {account.encode("ascii").ljust(self.ACCOUNT_WIDTH, b"\0"): balance
+                    for account, balance in (initial or {}).items()}
+        credits, debits, opening = self._CREDITS, self._DEBITS, self._OPENING
+
+        view = self._view()
+        try:
+            for code, account, _, _, amount in self.RECORD.iter_unpack(view):
+                if code in credits:
+                    balances[account] = balances.get(account, 0.0) + amount
+                elif code in debits:
+                    balances[account] = balances.get(account, 0.0) - amount
+                elif code == opening:
+                    balances[account] = amount
+        finally:
+            view.release()
+
+        return {account.rstrip(b"\0").decode("ascii"): balance for account, balance in balances.items()}
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        self.commit()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"Ledger(path='{self._path}', records={self._count})"
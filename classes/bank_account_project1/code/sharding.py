@@ -0,0 +1,130 @@
+"""Sharded multi-process account processing"""
+
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import os
+import zlib
+
+from bank_account_project import Account, TimeZone, process_transactions
+
+
+def shard_of(account_number: str, shards: int) -> int:
+    """Stable owner of an account: unlike `hash`, `crc32` gives the same answer in every process."""
+    return zlib.crc32(account_number.encode("utf-8")) % shards
+
+
+#********************************************************************************
+#************************Worker side*********************************************
+#each shard runs in its own single-worker process, so this dict is private to the shard
+_shard_accounts = {}
+
+
+def _open_accounts(rows):
+    for account_number, first_name, last_name, tz_name, tz_hours, tz_minutes, balance in rows:
+        _shard_accounts[account_number] = Account(account_number, first_name, last_name,
+                                                  TimeZone(tz_name, tz_hours, tz_minutes), balance)
+
+
+def _apply(ops, transaction_ids):
+    #the ids were reserved by the parent, the shard only hands them out in order
+    Account.transaction_counter = iter(transaction_ids)
+    return process_transactions(_shard_accounts, ops)
+
+
+def _balances():
+    return {account_number: account.balance for account_number, account in _shard_accounts.items()}
+
+
+#********************************************************************************
+#************************Parent side*********************************************
+class ShardedAccounts:
+    """
+    **Summary:**
+
+    Partitions accounts by a stable hash of `account_number` across `shards` worker processes
+    (one single-worker `ProcessPoolExecutor` per shard, so every account always lives in the same process).
+    Transactions are routed to the owning shard in batches and applied there with `process_transactions`.
+
+    **Methods:**
+
+    * `__init__(self, shards: int = None)`: Starts one process per shard (defaults to the number of CPUs).
+    * `open_accounts(self, accounts) -> None`: Moves `Account` objects into their shards.
+    * `process(self, ops) -> list`: Applies `(account_number, operation, amount)` operations and returns the confirmation codes in input order.
+    * `balances(self) -> dict`: Collects the balance of every account from every shard.
+    * `close(self) -> None`: Stops the worker processes.
+
+    **Notes:**
+
+    * Transaction ids are reserved from `Account.transaction_counter` in the parent, in input order, before routing,
+      so they stay globally unique and monotonic no matter which shard applies the operation.
+
+    **Raises:**
+
+    * `ValueError`: If an account is opened twice, an account number is unknown or an operation is invalid.
+    """
+
+    def __init__(self, shards: int = None) -> None:
+        self._shards = shards or os.cpu_count() or 1
+        if self._shards < 1:
+            raise ValueError("shards must be positive")
+        self._executors = [ProcessPoolExecutor(max_workers=1) for _ in range(self._shards)]
+        self._owners = {}
+
+    @property
+    def shards(self):
+        return self._shards
+
+    def open_accounts(self, accounts) -> None:
+        rows = [[] for _ in range(self._shards)]
+        for account in accounts:
+            if account.account_number in self._owners:
+                raise ValueError(f"Account {account.account_number} is already open")
+            shard = shard_of(account.account_number, self._shards)
+            tz = account.prefer_timezone
+            rows[shard].append((account.account_number, account.first_name, account.last_Name,
+                                tz.name, tz.offset_hours, tz.offset_minutes, account.balance))
+            self._owners[account.account_number] = shard
+
+        for future in [executor.submit(_open_accounts, shard_rows)
+                       for executor, shard_rows in zip(self._executors, rows) if shard_rows]:
+            future.result()
+
+    def process(self, ops) -> list:
+        per_shard = [([], []) for _ in range(self._shards)]
+        positions = []
+        for account_number, *op in ops:
+            shard = self._owners.get(account_number)
+            if shard is None:
+                raise ValueError(f"Unknown account {account_number}")
+            Account.validate_transaction(*op)
+            shard_ops = per_shard[shard][0]
+            positions.append((shard, len(shard_ops)))
+            shard_ops.append((account_number, *op))
+
+        for (shard, _), transaction_id in zip(positions, itertools.islice(Account.transaction_counter, len(positions))):
+            per_shard[shard][1].append(transaction_id)
+
+        futures = {shard: self._executors[shard].submit(_apply, shard_ops, transaction_ids)
+                   for shard, (shard_ops, transaction_ids) in enumerate(per_shard) if shard_ops}
+        codes = {shard: future.result() for shard, future in futures.items()}
+
+        return [codes[shard][i] for shard, i in positions]
+
+    def balances(self) -> dict:
+        balances = {}
+        for future in [executor.submit(_balances) for executor in self._executors]:
+            balances.update(future.result())
+        return balances
+
+    def close(self) -> None:
+        for executor in self._executors:
+            executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"ShardedAccounts(shards={self._shards}, accounts={len(self._owners)})"
@@ -0,0 +1,68 @@
+import pytest
+import bank_account_project as ba
+import account_book as ab
+import concurrent_account as ca
+from account_book import AccountBook
+
+
+@pytest.fixture
+def accounts():
+    return [ba.Account(f"A400{i}", "Felipe", "Hdez", initial_balance=b)
+            for i, b in enumerate([0, 100, 12345.67, 0.1, 10 ** 9 + 0.3])]
+
+
+class Test_account_book:
+    def test_matches_scalar_pay_interest(self, accounts):
+        book = AccountBook(accounts)
+
+        book.pay_interest_all()
+        book.pay_interest_all()
+        for a in accounts:
+            a.pay_interest()
+            a.pay_interest()
+
+        assert list(book.balances) == [a.balance for a in accounts]
+
+    def test_codes(self, accounts):
+        book = AccountBook(accounts)
+        codes = book.pay_interest_all()
+        parsed = [ba.Account.parse_confirmation_code(c) for c in codes]
+
+        assert [p.transaction_code for p in parsed] == ["I"] * len(accounts)
+        assert [p.account_number for p in parsed] == [a.account_number for a in accounts]
+        ids = [int(p.transaction_id) for p in parsed]
+        assert ids == list(range(ids[0], ids[0] + len(accounts)))
+
+    def test_write_back(self, accounts):
+        book = AccountBook(accounts)
+        book.pay_interest_all()
+        book.write_back()
+
+        assert accounts[1].balance == book.balance("A4001") == 100.5
+
+    def test_duplicate_and_unknown(self, accounts):
+        book = AccountBook(accounts)
+        with pytest.raises(ValueError):
+            book.add(accounts[0])
+        with pytest.raises(ValueError):
+            book.balance("ZZZZZ")
+
+    def test_reserves_one_block_from_atomic_counter(self, accounts, monkeypatch):
+        counter = ca.AtomicCounter(1000)
+        monkeypatch.setattr(ba.Account, "transaction_counter", counter)
+        book = AccountBook(accounts)
+
+        codes = book.pay_interest_all()
+
+        ids = [int(ba.Account.parse_confirmation_code(c).transaction_id) for c in codes]
+        assert ids == list(range(1000, 1000 + len(accounts)))
+        assert next(counter) == 1000 + len(accounts)
+
+    def test_uses_utc_clock(self, accounts, monkeypatch):
+        class FixedClock:
+            def now(self):
+                return 0, "19700101000000"
+        monkeypatch.setattr(ab, "_utc_clock", FixedClock())
+        codes = AccountBook(accounts).pay_interest_all()
+
+        assert all(c.split("-")[2] == "19700101000000" for c in codes)
@@ -0,0 +1,73 @@
+import os
+
+import pytest
+import bank_account_project as ba
+from account_store import AccountStore, read_snapshot, write_snapshot
+
+
+@pytest.fixture
+def directory(tmp_path):
+    yield str(tmp_path / "store")
+    ba.Account.attach_ledger(None)
+
+
+class Test_account_store:
+    def test_snapshot_round_trip(self, tmp_path):
+        tz = ba.TimeZone("GMT-5", -5, 0)
+        accounts = [ba.Account("A400B", "Felipe", "Hdez", tz, 100.25), ba.Account("B400B", "Juan", "Perez")]
+        path = str(tmp_path / "snap.bin")
+        write_snapshot(path, accounts, 3, 120)
+
+        snapshot = read_snapshot(path)
+
+        assert (snapshot.generation, snapshot.last_transaction_id) == (3, 120)
+        assert snapshot.account_numbers == ["A400B", "B400B"]
+        assert snapshot.last_names == ["Hdez", "Perez"]
+        assert snapshot.tz_names == ["GMT-5", "UTC"]
+        assert list(snapshot.tz_hours) == [-5, 0]
+        assert list(snapshot.balances) == [100.25, 0.0]
+
+    def test_recover_from_snapshot_and_wal(self, directory):
+        store = AccountStore(directory)
+        accounts = store.recover()
+        a = ba.Account("A400B", "Felipe", "Hdez", ba.TimeZone("GMT-5", -5, 0))
+        store.register(a)
+        a.deposit(60000)
+        store.checkpoint([a])
+
+        b = ba.Account("B400B", "Juan", "Perez")
+        store.register(b)
+        b.deposit(70000)
+        a.withdraw(1000)
+        store.close()
+
+        recovered = AccountStore(directory).recover()
+
+        assert recovered["A400B"].balance == 59000
+        assert recovered["A400B"].prefer_timezone == ba.TimeZone("GMT-5", -5, 0)
+        assert recovered["B400B"].balance == 70000
+        assert recovered["B400B"].first_name == "Juan"
+
+    def test_checkpoint_removes_previous_generation(self, directory):
+        store = AccountStore(directory)
+        store.recover()
+        a = ba.Account("A400B", "Felipe", "Hdez")
+        store.checkpoint([a])
+        store.checkpoint([a])
+        store.close()
+
+        assert sorted(os.listdir(directory)) == ["snapshot-2.bin", "wal-2.bin"]
+
+    def test_transaction_ids_continue_after_recovery(self, directory):
+        store = AccountStore(directory)
+        store.recover()
+        a = ba.Account("A400B", "Felipe", "Hdez")
+        store.register(a)
+        last_id = int(a.deposit(60000).split("-")[-1])
+        store.checkpoint([a])
+        store.close()
+
+        ba.Account.transaction_counter = type(ba.Account.transaction_counter)(0)
+        accounts = AccountStore(directory).recover()
+
+        assert int(accounts["A400B"].deposit(60000).split("-")[-1]) > last_id
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+import bank_account_project as ba
+from async_account import AsyncAccount, AsyncAccountService
+
+
+class Test_async_account:
+    def test_burst_matches_sync_path(self):
+        async def main():
+            async_account = AsyncAccount(ba.Account("A400B", "Felipe", "Hdez"))
+            codes = await asyncio.gather(*(async_account.deposit(60000.1) for _ in range(50)),
+                                         async_account.withdraw(10 ** 9),
+                                         async_account.pay_interest())
+            await async_account.close()
+            return async_account.account, codes
+
+        account, codes = asyncio.run(main())
+        expected = ba.Account("A400C", "Felipe", "Hdez")
+        for _ in range(50):
+            expected.deposit(60000.1)
+        expected.withdraw(10 ** 9)
+        expected.pay_interest()
+
+        assert [c[0] for c in codes] == ["D"] * 50 + ["R", "I"]
+        assert len({c.split("-")[-1] for c in codes}) == 52
+        assert account.balance == expected.balance
+
+    def test_invalid_operation_raises_before_queueing(self):
+        async def main():
+            async_account = AsyncAccount(ba.Account("A400B", "Felipe", "Hdez"))
+            with pytest.raises(ValueError):
+                await async_account.deposit(10)
+            await async_account.close()
+            return async_account.account.balance
+
+        assert asyncio.run(main()) == 0
+
+    def test_service_routes_by_account(self):
+        async def main():
+            service = AsyncAccountService([ba.Account("A400B", "Felipe", "Hdez"), ba.Account("B400B", "Felipe", "Hdez")])
+            await asyncio.gather(service.deposit("A400B", 60000), service.deposit("B400B", 70000),
+                                 service.withdraw("B400B", 5000))
+            with pytest.raises(ValueError):
+                await service.deposit("ZZZZZ", 60000)
+            await service.close()
+            return service
+
+        service = asyncio.run(main())
+        assert service.get("A400B").account.balance == 60000
+        assert service.get("B400B").account.balance == 65000
+
+    def test_close_fails_queued_operations(self):
+        async def main():
+            async_account = AsyncAccount(ba.Account("A400B", "Felipe", "Hdez"))
+            await async_account.deposit(60000)
+            #queued while the worker has not had a turn yet, so close runs before they are applied
+            queued = [asyncio.ensure_future(async_account.deposit(60000)) for _ in range(3)]
+            await asyncio.sleep(0)
+            await async_account.close()
+            results = await asyncio.wait_for(asyncio.gather(*queued, return_exceptions=True), 1)
+            return async_account.account.balance, results
+
+        balance, results = asyncio.run(main())
+        assert len(results) == 3 and all(isinstance(r, RuntimeError) for r in results)
+        assert balance == 60000
+
+    def test_submit_after_close_raises(self):
+        async def main():
+            async_account = AsyncAccount(ba.Account("A400B", "Felipe", "Hdez"))
+            await async_account.deposit(60000)
+            await async_account.close()
+            with pytest.raises(RuntimeError):
+                await async_account.deposit(60000)
+            return async_account.account.balance
+
+        assert asyncio.run(main()) == 60000
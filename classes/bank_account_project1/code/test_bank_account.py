@@ -1,5 +1,5 @@
 import pytest
-from datetime import timedelta
+from datetime import timedelta, datetime
 import bank_account_project as ba
 
 class Test_banks_account:
@@ -48,4 +48,94 @@ class Test_banks_account:
         balance = -100
 
         with pytest.raises(ValueError):
-            a = ba.Account(account_number, first_name, last_name,tz, balance)
\ No newline at end of file
+            a = ba.Account(account_number, first_name, last_name,tz, balance)
+
+class Test_batch_transactions:
+    def test_apply_batch_matches_single_calls(self):
+        single = ba.Account("A400B", "Felipe", "Hdez", initial_balance=100)
+        batched = ba.Account("A400C", "Felipe", "Hdez", initial_balance=100)
+        ops = [("deposit", 60000), ("withdraw", 1000), ("interest",), ("withdraw", 10 ** 9)]
+
+        single.deposit(60000)
+        single.withdraw(1000)
+        single.pay_interest()
+        rejected = single.withdraw(10 ** 9)
+
+        codes = batched.apply_batch(ops)
+
+        assert len(codes) == 4
+        assert [c[0] for c in codes] == ["D", "W", "I", "R"]
+        assert rejected.startswith("R")
+        assert batched.balance == single.balance
+
+    def test_apply_batch_ids_are_consecutive(self):
+        a = ba.Account("A400B", "Felipe", "Hdez")
+        codes = a.apply_batch([("deposit", 60000)] * 3)
+        ids = [int(ba.Account.parse_confirmation_code(c).transaction_id) for c in codes]
+
+        assert ids == list(range(ids[0], ids[0] + 3))
+
+    @pytest.mark.parametrize("bad_op", [("deposit", 10), ("withdraw", -5), ("withdraw", "10"), ("transfer", 10)])
+    def test_apply_batch_invalid_leaves_balance(self, bad_op):
+        a = ba.Account("A400B", "Felipe", "Hdez", initial_balance=100)
+
+        with pytest.raises(ValueError):
+            a.apply_batch([("deposit", 60000), bad_op])
+        assert a.balance == 100
+
+    def test_process_transactions_keeps_order(self):
+        a = ba.Account("A400B", "Felipe", "Hdez")
+        b = ba.Account("B400B", "Felipe", "Hdez")
+        accounts = {a.account_number: a, b.account_number: b}
+        ops = [("A400B", "deposit", 60000), ("B400B", "deposit", 70000), ("A400B", "withdraw", 100)]
+
+        codes = ba.process_transactions(accounts, ops)
+        parsed = [ba.Account.parse_confirmation_code(c) for c in codes]
+
+        assert [p.account_number for p in parsed] == ["A400B", "B400B", "A400B"]
+        assert [int(p.transaction_id) for p in parsed] == sorted(int(p.transaction_id) for p in parsed)
+        assert a.balance == 59900
+        assert b.balance == 70000
+
+    def test_process_transactions_unknown_account(self):
+        a = ba.Account("A400B", "Felipe", "Hdez")
+
+        with pytest.raises(ValueError):
+            ba.process_transactions({a.account_number: a}, [("A400B", "deposit", 60000), ("ZZZZZ", "deposit", 60000)])
+        assert a.balance == 0
+
+
+class Test_timezone_registry:
+    def test_timezone_is_interned(self):
+        assert ba.TimeZone("GMT-5", -5, 0) is ba.TimeZone("GMT-5", -5, 0)
+        assert ba.TimeZone("GMT-5", -5, 0) is not ba.TimeZone("GMT-4", -4, 0)
+
+    def test_timezone_hash_and_repr(self):
+        tz = ba.TimeZone("GMT-5", -5, 0)
+
+        assert len({tz, ba.TimeZone("GMT-5", -5, 0)}) == 1
+        assert repr(tz) == "TimeZone(name='GMT-5', offset_hours=-5, offset_minutes=0)"
+
+    def test_timezone_has_no_dict(self):
+        with pytest.raises(AttributeError):
+            ba.TimeZone("UTC", 0, 0).__dict__
+
+    @pytest.mark.parametrize("hours,minutes,exception", [(1.5, 0, ValueError), (0, 60, ValueError), (15, 0, ValueError)])
+    def test_invalid_timezone(self, hours, minutes, exception):
+        with pytest.raises(exception):
+            ba.TimeZone("BAD", hours, minutes)
+
+    def test_timezone_pickle(self):
+        import pickle
+        tz = ba.TimeZone("GMT+2", 2, 0)
+        assert pickle.loads(pickle.dumps(tz)) is tz
+
+    def test_convert_many_matches_parse(self):
+        tz = ba.TimeZone("GMT-5", -5, 0)
+        codes = ["D-A400B-20240301010306-100", "W-A400B-20240301010306-101", "I-A400B-20240301235959-102"]
+        parsed = [ba.Account.parse_confirmation_code(c, tz) for c in codes]
+
+        from_stamps = ba.convert_many([c.split("-")[2] for c in codes], tz)
+        from_datetimes = ba.convert_many([datetime.fromisoformat(p.time_utc) for p in parsed], tz)
+
+        assert from_stamps == from_datetimes == [p.preferred_time for p in parsed]
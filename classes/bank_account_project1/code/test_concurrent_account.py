@@ -0,0 +1,49 @@
+import threading
+
+import pytest
+import bank_account_project as ba
+import concurrent_account as ca
+
+
+def hammer(account, n, method):
+    for _ in range(n):
+        getattr(account, method)(700)
+
+
+class Test_concurrent_account:
+    def test_atomic_counter(self):
+        counter = ca.AtomicCounter(10)
+        assert next(counter) == 10
+        assert counter.reserve(3) == range(11, 14)
+        assert next(counter) == 14
+
+    def test_enable_thread_safety_keeps_ids_increasing(self):
+        before = next(ba.Account.transaction_counter)
+        ca.enable_thread_safety()
+        ca.enable_thread_safety()
+
+        assert isinstance(ba.Account.transaction_counter, ca.AtomicCounter)
+        assert next(ba.Account.transaction_counter) > before
+
+    def test_same_account_same_stripe(self):
+        stripes = ca.LockStripes(8)
+        assert stripes.lock_for("A400B") is stripes.lock_for("A400B")
+
+    @pytest.mark.parametrize("method", ["withdraw", "withdraw_optimistic"])
+    def test_no_overdraft(self, method):
+        account = ca.SafeAccount("A400B", "Felipe", "Hdez", initial_balance=70000)
+        threads = [threading.Thread(target=hammer, args=(account, 200, method)) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert account.balance == 0
+        assert account.version == 1600
+
+    def test_apply_batch(self):
+        account = ca.SafeAccount("A400B", "Felipe", "Hdez")
+        codes = account.apply_batch([("deposit", 60000), ("withdraw", 100)])
+
+        assert [c[0] for c in codes] == ["D", "W"]
+        assert account.balance == 59900
@@ -0,0 +1,63 @@
+import pytest
+import bank_account_project as ba
+import confirmation_codec as cc
+
+
+@pytest.fixture
+def codes():
+    return ["D-A400B-20240301010306-100", "W-ABCDEFGHIJKLMNOP-20240229235959-101", "I-A400B-19991231000000-102"]
+
+
+class Test_confirmation_codec:
+    def test_round_trip(self, codes):
+        for code in codes:
+            packed = cc.encode(code)
+            assert len(packed) == cc.CODE.size
+            assert cc.decode(packed) == code
+
+    def test_round_trip_many(self, codes):
+        buffer = cc.encode_many(codes)
+        assert len(buffer) == cc.CODE.size * len(codes)
+        assert cc.decode_many(buffer) == codes
+
+    def test_base32(self, codes):
+        packed = cc.encode(codes[0])
+        text = cc.to_base32(packed)
+
+        assert "=" not in text
+        assert cc.from_base32(text) == packed
+        assert cc.from_base32(text.lower()) == packed
+
+    def test_to_confirmation_matches_parse(self, codes):
+        tz = ba.TimeZone("GMT-5", -5, 0)
+        for code in codes:
+            packed = cc.encode(code)
+            assert cc.to_confirmation(packed, tz) == ba.Account.parse_confirmation_code(code, tz)
+            assert cc.to_confirmation(packed) == ba.Account.parse_confirmation_code(code)
+
+    def test_generated_code(self):
+        code = ba.Account("A400B", "Felipe", "Hdez").deposit(60000)
+        assert cc.decode(cc.encode(code)) == code
+
+    @pytest.mark.parametrize("code", ["D-A400B-101", "D-A400B-2024-101", "D-ABCDEFGHIJKLMNOPQ-20240301010306-100",
+                                      "D-A400B-20241301010306-100", "D-A400B-20240332010306-100", "D-A400B-20230229010306-100",
+                                      "D-A400B-20240301250306-100", "D-A400B-20240301010306-0100", "D-A400B-20240301010306--1",
+                                      "D-A400B-20240301010306-1a"])
+    def test_invalid(self, code):
+        with pytest.raises(ValueError):
+            cc.encode(code)
+
+    def test_invalid_dates_match_parse(self):
+        for code in ["D-A400B-20241301010306-100", "D-A400B-20240332010306-100"]:
+            with pytest.raises(ValueError):
+                ba.Account.parse_confirmation_code(code)
+            with pytest.raises(ValueError):
+                cc.encode(code)
+
+    def test_zero_id_round_trip(self):
+        code = "D-A400B-20240301010306-0"
+        assert cc.decode(cc.encode(code)) == code
+
+    def test_invalid_buffer(self):
+        with pytest.raises(ValueError):
+            cc.decode_many(b"123")
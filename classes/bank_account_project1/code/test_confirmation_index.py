@@ -0,0 +1,64 @@
+from datetime import datetime
+
+import pytest
+import bank_account_project as ba
+from confirmation_index import ConfirmationIndex
+
+
+@pytest.fixture
+def codes():
+    return [
+        "D-A400B-20240301010306-100",
+        "W-B400B-20240301010359-101",
+        "I-A400B-20240301010400-102",
+        "R-A400B-20240302120000-104",
+        "D-B400B-20240302120001-103",
+    ]
+
+
+@pytest.fixture
+def index(codes):
+    return ConfirmationIndex(codes)
+
+
+class Test_confirmation_index:
+    def test_get(self, index):
+        assert index.get(102) == "I-A400B-20240301010400-102"
+        assert index.get(999) is None
+        assert 103 in index
+        assert len(index) == 5
+
+    def test_by_account(self, index):
+        assert index.by_account("B400B") == ["W-B400B-20240301010359-101", "D-B400B-20240302120001-103"]
+        assert index.by_account("ZZZZZ") == []
+
+    def test_by_transaction_range_is_sorted(self, index):
+        ids = [int(c.split("-")[-1]) for c in index.by_transaction_range(101, 104)]
+        assert ids == [101, 102, 103, 104]
+
+    def test_by_time_range(self, index):
+        codes = index.by_time_range(datetime(2024, 3, 1, 1, 3, 30), datetime(2024, 3, 2, 12, 0, 0))
+        assert codes == ["W-B400B-20240301010359-101", "I-A400B-20240301010400-102", "R-A400B-20240302120000-104"]
+
+    def test_by_time_range_inside_one_bucket(self):
+        #out of order and repeated stamps within one minute
+        seconds = [5, 1, 30, 30, 59, 0, 30, 12]
+        index = ConfirmationIndex(f"D-A400B-202403010103{s:02d}-{100 + i}" for i, s in enumerate(seconds))
+
+        codes = index.by_time_range(datetime(2024, 3, 1, 1, 3, 1), datetime(2024, 3, 1, 1, 3, 30))
+        assert [int(c[-3:]) - 100 for c in codes] == [1, 0, 7, 2, 3, 6]
+        assert index.by_time_range(datetime(2024, 3, 1, 1, 3, 31), datetime(2024, 3, 1, 1, 3, 58)) == []
+
+    @pytest.mark.parametrize("code", ["D-A400B-101", "D-A400B-2024-101", "D-A400B-20240301010306-100"])
+    def test_invalid_or_duplicate(self, index, code):
+        with pytest.raises(ValueError):
+            index.ingest(code)
+
+    def test_ingest_generated_codes(self):
+        a = ba.Account("A400B", "Felipe", "Hdez")
+        index = ConfirmationIndex()
+        code = a.deposit(60000)
+        index.ingest(code)
+
+        transaction_id = int(ba.Account.parse_confirmation_code(code).transaction_id)
+        assert index.get(transaction_id) == code
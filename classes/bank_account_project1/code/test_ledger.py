@@ -0,0 +1,100 @@
+import pytest
+import bank_account_project as ba
+from ledger import Ledger
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = Ledger(str(tmp_path / "ledger.bin"), commit_every=4, grow_by=2)
+    ba.Account.attach_ledger(ledger)
+    yield ledger
+    ba.Account.attach_ledger(None)
+    ledger.close()
+
+
+class Test_ledger:
+    def test_transactions_are_recorded(self, ledger):
+        a = ba.Account("A400B", "Felipe", "Hdez", initial_balance=100)
+        a.deposit(60000)
+        a.withdraw(10 ** 9)
+        a.withdraw(100)
+        a.pay_interest()
+        ledger.commit()
+
+        codes = [r[0] for r in ledger.records()]
+
+        assert codes == ["O", "D", "R", "W", "I"]
+        assert len(ledger) == 5
+        assert ledger.balances() == {"A400B": a.balance}
+
+    def test_batch_is_recorded(self, ledger):
+        a = ba.Account("A400B", "Felipe", "Hdez")
+        codes = a.apply_batch([("deposit", 60000), ("interest",), ("withdraw", 500)])
+        ledger.commit()
+
+        ids = [r[3] for r in ledger.records()][1:]
+
+        assert ids == [int(c.split("-")[-1]) for c in codes]
+        assert ledger.balances()["A400B"] == a.balance
+
+    def test_reopen_rebuilds_balances(self, tmp_path):
+        path = str(tmp_path / "ledger.bin")
+        with Ledger(path) as ledger:
+            ba.Account.attach_ledger(ledger)
+            a = ba.Account("A400B", "Felipe", "Hdez")
+            b = ba.Account("B400B", "Felipe", "Hdez")
+            a.deposit(60000)
+            b.deposit(70000)
+            b.withdraw(5000)
+            ba.Account.attach_ledger(None)
+
+        with Ledger(path) as reopened:
+            assert reopened.balances() == {"A400B": 60000, "B400B": 65000}
+            assert reopened.last_transaction_id == ledger.last_transaction_id
+
+    def test_uncommitted_records_are_not_visible(self, tmp_path):
+        path = str(tmp_path / "ledger.bin")
+        ledger = Ledger(path, commit_every=100)
+        ledger.append("D", "A400B", 0, 1, 60000)
+
+        assert list(ledger.records()) == []
+        ledger.commit()
+        assert list(ledger.records()) == [("D", "A400B", 0, 1, 60000.0)]
+        ledger.close()
+
+    def test_append_while_iterating_records(self, tmp_path):
+        with Ledger(str(tmp_path / "ledger.bin"), commit_every=1, grow_by=2) as ledger:
+            ledger.append("D", "A400B", 0, 1, 60000)
+            ledger.append("D", "A400B", 0, 2, 60000)
+            records = ledger.records()
+            first = next(records)
+            #the file is full, so this append remaps it while the iterator is open
+            ledger.append("W", "A400B", 0, 3, 100)
+            rest = list(records)
+
+            assert [first] + rest == [("D", "A400B", 0, 1, 60000.0), ("D", "A400B", 0, 2, 60000.0)]
+            assert len(list(ledger.records())) == 3
+
+    def test_records_across_blocks(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Ledger, "_RECORDS_PER_BLOCK", 3)
+        with Ledger(str(tmp_path / "ledger.bin"), commit_every=1000, grow_by=4) as ledger:
+            for transaction_id in range(1, 11):
+                ledger.append("D", "A400B", 0, transaction_id, 60000)
+            ledger.commit()
+            assert [record[3] for record in ledger.records()] == list(range(1, 11))
+
+    def test_attach_resumes_transaction_ids(self, tmp_path):
+        with Ledger(str(tmp_path / "ledger.bin")) as ledger:
+            ledger.append("D", "A400B", 0, 10 ** 6, 60000)
+            ba.Account.attach_ledger(ledger)
+            code = ba.Account("A400B", "Felipe", "Hdez").deposit(60000)
+            ba.Account.attach_ledger(None)
+
+        assert int(code.split("-")[-1]) > 10 ** 6
+
+    def test_invalid_file(self, tmp_path):
+        path = tmp_path / "not_a_ledger.bin"
+        path.write_bytes(b"x" * 64)
+
+        with pytest.raises(ValueError):
+            Ledger(str(path))
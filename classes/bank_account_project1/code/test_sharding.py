@@ -0,0 +1,47 @@
+import pytest
+import bank_account_project as ba
+from sharding import ShardedAccounts, shard_of
+
+
+@pytest.fixture
+def sharded():
+    with ShardedAccounts(2) as sharded:
+        yield sharded
+
+
+class Test_sharding:
+    def test_shard_of_is_stable(self):
+        assert shard_of("A400B", 4) == shard_of("A400B", 4)
+        assert 0 <= shard_of("A400B", 4) < 4
+
+    def test_process_matches_single_process(self, sharded):
+        numbers = [f"A400{i}" for i in range(6)]
+        sharded.open_accounts(ba.Account(n, "Felipe", "Hdez", initial_balance=100) for n in numbers)
+        local = {n: ba.Account(n, "Felipe", "Hdez", initial_balance=100) for n in numbers}
+        ops = [(n, "deposit", 60000) for n in numbers] + [(n, "withdraw", 30000 * (i + 1)) for i, n in enumerate(numbers)]
+
+        codes = sharded.process(ops)
+        ba.process_transactions(local, ops)
+
+        parsed = [ba.Account.parse_confirmation_code(c) for c in codes]
+        ids = [int(p.transaction_id) for p in parsed]
+        assert [p.account_number for p in parsed] == [op[0] for op in ops]
+        assert ids == sorted(ids) and len(set(ids)) == len(ids)
+        assert sharded.balances() == {n: a.balance for n, a in local.items()}
+
+    def test_ids_stay_monotonic_across_batches(self, sharded):
+        sharded.open_accounts([ba.Account("A400B", "Felipe", "Hdez"), ba.Account("B400B", "Felipe", "Hdez")])
+        first = sharded.process([("A400B", "deposit", 60000), ("B400B", "deposit", 60000)])
+        second = sharded.process([("B400B", "deposit", 60000), ("A400B", "deposit", 60000)])
+        ids = [int(c.split("-")[-1]) for c in first + second]
+
+        assert ids == sorted(ids)
+
+    def test_invalid(self, sharded):
+        sharded.open_accounts([ba.Account("A400B", "Felipe", "Hdez")])
+        with pytest.raises(ValueError):
+            sharded.process([("ZZZZZ", "deposit", 60000)])
+        with pytest.raises(ValueError):
+            sharded.process([("A400B", "deposit", 10)])
+        with pytest.raises(ValueError):
+            sharded.open_accounts([ba.Account("A400B", "Felipe", "Hdez")])
@@ -1 +1 @@
-__all__ = ["models", "utils"]
\ No newline at end of file
+__all__ = ["models", "utils", "analytics", "persistence", "importers"]
\ No newline at end of file
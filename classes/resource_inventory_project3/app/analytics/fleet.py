@@ -0,0 +1,86 @@
+"""Fleet-wide inventory aggregates over a ResourceTable"""
+
+from itertools import compress
+from operator import mul, sub
+
+from app.models.table import ResourceTable
+
+
+class FleetAnalytics:
+    """
+    **Summary:**
+
+    Answers fleet aggregate questions (free storage, free cores per socket, power of allocated CPUs, ...)
+    straight from the columns of a `ResourceTable`, with `map`/`sum` over whole `array` columns instead of
+    reading properties on one `Resource` object at a time.
+
+    Every result is cached together with the table `version`; any `claim`, `freeup`, `died`, `purchased`
+    or `append` on the table bumps the version, and the next call recomputes.
+
+    **Methods:**
+
+    * `total_free_storage_gb(self) -> int`: Sum of `available * capacity_gb` over storage rows.
+    * `free_cores_by_socket(self) -> dict`: `{socket: sum of available * cores}` over CPU rows.
+    * `allocated_power_watts(self) -> int`: Sum of `allocated * power_watts` over CPU rows.
+    * `available_by_category(self) -> dict`: `{category: sum of available}`.
+
+    **Notes:**
+
+    * To analyse `Resource` objects (e.g. an `InventoryPool`), load them into a table first: `FleetAnalytics(ResourceTable(pool))`.
+    """
+
+    def __init__(self, table: ResourceTable) -> None:
+        self._table = table
+        self._cache = {}
+
+    def _cached(self, key, compute):
+        version = self._table.version
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == version:
+            return hit[1]
+        value = compute()
+        self._cache[key] = (version, value)
+        return value
+
+    def _available(self):
+        #available per row, shared by every query of the same version
+        return self._cached("available", lambda: list(map(sub, self._table.column("total"), self._table.column("allocated"))))
+
+    def total_free_storage_gb(self) -> int:
+        #rows that are not storage have capacity 0, so they add nothing
+        return self._cached("free_storage_gb",
+                            lambda: sum(map(mul, self._available(), self._table.column("capacity_gb"))))
+
+    def allocated_power_watts(self) -> int:
+        return self._cached("allocated_power_watts",
+                            lambda: sum(map(mul, self._table.column("allocated"), self._table.column("power_watts"))))
+
+    def free_cores_by_socket(self) -> dict:
+        def compute():
+            free_cores = list(map(mul, self._available(), self._table.column("cores")))
+            return {socket: sum(compress(free_cores, mask)) for socket, mask in self._masks("socket").items()}
+        return self._cached("free_cores_by_socket", compute)
+
+    def available_by_category(self) -> dict:
+        def compute():
+            available = self._available()
+            return {category: sum(compress(available, mask)) for category, mask in self._masks("category").items()}
+        return self._cached("available_by_category", compute)
+
+    def _masks(self, column):
+        #group membership only changes when rows are added, so the masks are cached on the row count
+        key = ("masks", column)
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] == len(self._table):
+            return hit[1]
+
+        values = self._table.column(column)
+        masks = {}
+        for row, value in enumerate(values):
+            if value is not None:
+                masks.setdefault(value, bytearray(len(values)))[row] = 1
+        self._cache[key] = (len(self._table), masks)
+        return masks
+
+    def __repr__(self):
+        return f"FleetAnalytics({self._table!r})"
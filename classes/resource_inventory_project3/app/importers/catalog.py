@@ -0,0 +1,145 @@
+"""Streaming importer for hardware catalogs (CSV or JSON lines)"""
+
+from collections import namedtuple
+import csv
+from itertools import islice
+import json
+import os
+import time
+
+from app.models.table import CATEGORY_COLUMNS, ResourceTable, validate_columns
+from app.persistence.rows import from_row
+from app.utils.validators import validate_integer
+
+_INTEGER_COLUMNS = ("total", "allocated", "capacity_gb", "cores", "power_watts", "rpm")
+_ROW_COLUMNS = ("category", "name", "manufacturer", "total", "allocated", "capacity_gb",
+                "cores", "socket", "power_watts", "size", "rpm", "interface")
+
+
+class ImportReport(namedtuple("ImportReport", "rows seconds by_category")):
+    """Rows imported, seconds spent and `{category: rows}` of one import."""
+
+    __slots__ = ()
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.seconds if self.seconds else float("inf")
+
+
+def _records(path: str, fmt: str = None):
+    fmt = fmt or os.path.splitext(path)[1].lstrip(".").lower()
+    if fmt == "csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    elif fmt in ("jsonl", "ndjson"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        raise ValueError(f"Unknown catalog format {fmt}, must be csv or jsonl")
+
+
+def _to_int(value):
+    #CSV gives text, JSON already gives numbers (anything else is left as is for validation to reject)
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return value
+    return value
+
+
+def _chunk_columns(records, first_row):
+    """Splits a chunk of records into `{category: (rows, columns)}`, `rows` being the position of every row in the catalog."""
+    by_category = {}
+    for row, record in enumerate(records, first_row):
+        category = str(record.get("category", "")).lower()
+        if category not in CATEGORY_COLUMNS:
+            raise ValueError(f"row {row}: unknown category {record.get('category')!r}")
+        if category not in by_category:
+            specific = CATEGORY_COLUMNS[category][1]
+            names = ("name", "manufacturer", "total", "allocated") + specific
+            by_category[category] = ([], {name: [] for name in names})
+        rows, columns = by_category[category]
+        rows.append(row)
+        for name, values in columns.items():
+            values.append(record.get(name))
+
+    for rows, columns in by_category.values():
+        for name in _INTEGER_COLUMNS:
+            if name in columns:
+                columns[name] = list(map(_to_int, columns[name]))
+    return by_category
+
+
+def _validated_chunks(path, chunk_size, fmt):
+    validate_integer("chunk_size", chunk_size, min_value=1)
+    records = _records(path, fmt)
+    first_row = 0
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        by_category = _chunk_columns(chunk, first_row)
+        for category, (rows, columns) in by_category.items():
+            try:
+                validate_columns(category, columns, rows)
+            except (TypeError, ValueError) as ex:
+                raise type(ex)(f"{path}: {ex}") from None
+        yield len(chunk), by_category
+        first_row += len(chunk)
+
+
+def import_catalog(path: str, table: ResourceTable = None, chunk_size: int = 50_000, fmt: str = None):
+    """
+    Streams a catalog into a `ResourceTable`: the file is read `chunk_size` records at a time, each chunk is split
+    by category into columns, validated in bulk and appended with `ResourceTable.load_columns`, so only one chunk of
+    parsed records is in memory besides the table itself.
+
+    **Args:**
+
+    * `path (str)`: A `.csv` file with a header row, or a `.jsonl` file with one object per line. Every record has a `category`
+      (`cpu`, `hdd`, `sdd`, `storage` or `resource`) and the constructor arguments of that class.
+    * `table (ResourceTable, optional)`: The table to append to. A new table is created by default.
+    * `chunk_size (int, optional)`: Records per chunk. Defaults to 50000.
+    * `fmt (str, optional)`: `csv` or `jsonl`, guessed from the extension by default.
+
+    **Returns:**
+
+    * `(ResourceTable, ImportReport)`
+
+    **Raises:**
+
+    * `TypeError`, `ValueError`: On the first invalid chunk, naming the catalog row. Chunks before it stay imported.
+    """
+    table = ResourceTable() if table is None else table
+    start = time.perf_counter()
+    rows = 0
+    by_category = {}
+    for chunk_rows, chunk in _validated_chunks(path, chunk_size, fmt):
+        for category, (_, columns) in chunk.items():
+            table.load_columns(category, columns)
+            by_category[category] = by_category.get(category, 0) + len(columns["name"])
+        rows += chunk_rows
+    return table, ImportReport(rows, time.perf_counter() - start, by_category)
+
+
+def iter_catalog(path: str, chunk_size: int = 50_000, fmt: str = None):
+    """
+    Streams a catalog as `Resource` objects: yields one list of `CPU`/`HDD`/`SDD`/`Storage`/`Resource` objects per chunk,
+    in catalog order, after the chunk was validated in bulk. Memory stays bounded by `chunk_size` as long as the caller
+    does not keep every list.
+
+    **Raises:**
+
+    * `TypeError`, `ValueError`: Like `import_catalog`.
+    """
+    for chunk_rows, chunk in _validated_chunks(path, chunk_size, fmt):
+        resources = [None] * chunk_rows
+        first_row = min(rows[0] for rows, _ in chunk.values())
+        for category, (rows, columns) in chunk.items():
+            values = [columns.get(name) or [None] * len(rows) for name in _ROW_COLUMNS[1:]]
+            for row, *record in zip(rows, *values):
+                resources[row - first_row] = from_row((row, category, *record))
+        yield resources
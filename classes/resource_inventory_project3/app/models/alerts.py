@@ -0,0 +1,120 @@
+"""Low stock alerts"""
+
+import asyncio
+import heapq
+import inspect
+from itertools import count
+
+from app.models.inventory import Resource
+from app.utils.validators import validate_integer
+
+
+class LowStockWatcher:
+    """
+    **Summary:**
+
+    Fires a callback as soon as the `available` count of a watched resource drops below its threshold (and again when it
+    is restocked), without polling: the watcher subscribes to every watched resource, so only the resource that changed
+    is looked at. A heap ordered by `available - threshold` keeps the resources closest to their threshold at hand.
+
+    **Methods:**
+
+    * `__init__(self, callback=None, loop: asyncio.AbstractEventLoop = None)`: `callback(resource, crossing, available)` is called
+      with `crossing` `"low"` or `"restocked"`. With `loop`, the callback is scheduled on that event loop instead (thread safe);
+      a coroutine function is run as a task there.
+    * `watch(self, resource: Resource, threshold: int) -> None`: Starts watching a resource, or changes its threshold.
+      A resource that is already below the threshold fires `"low"` right away.
+    * `unwatch(self, resource: Resource) -> None`: Stops watching a resource.
+    * `low(self) -> list`: The watched resources currently below their threshold.
+    * `nearest(self, k: int) -> list`: The `k` watched resources with the smallest `available - threshold`, as `(resource, margin)` pairs.
+
+    **Notes:**
+
+    * Each update is O(log n): the new margin is pushed on the heap and the old entry is left behind and skipped later
+      (the heap is rebuilt when stale entries outnumber the live ones).
+    * Changes made through the `total`/`allocated` setters are not seen, they do not notify subscribers.
+
+    **Raises:**
+
+    * `ValueError`: If a threshold is negative or an unwatched resource is unwatched.
+    """
+
+    def __init__(self, callback=None, loop: asyncio.AbstractEventLoop = None) -> None:
+        self._callback = callback
+        self._loop = loop
+        self._thresholds = {}
+        self._entries = {}
+        self._heap = []
+        self._low = {}
+        self._sequence = count()
+
+    def watch(self, resource: Resource, threshold: int) -> None:
+        validate_integer("threshold", threshold, min_value=0)
+        if resource not in self._thresholds:
+            resource.subscribe(self._resource_changed)
+        self._thresholds[resource] = threshold
+        self._update(resource)
+
+    def unwatch(self, resource: Resource) -> None:
+        if self._thresholds.pop(resource, None) is None:
+            raise ValueError(f"{resource} is not watched")
+        resource.unsubscribe(self._resource_changed)
+        del self._entries[resource]
+        self._low.pop(resource, None)
+
+    def _resource_changed(self, resource, event, n):
+        self._update(resource)
+
+    def _update(self, resource):
+        available = resource.available
+        margin = available - self._thresholds[resource]
+
+        entry = [margin, next(self._sequence), resource]
+        self._entries[resource] = entry
+        heapq.heappush(self._heap, entry)
+        if len(self._heap) > 2 * len(self._entries) + 64:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+        if margin < 0:
+            if resource not in self._low:
+                self._low[resource] = None
+                self._fire(resource, "low", available)
+        elif resource in self._low:
+            del self._low[resource]
+            self._fire(resource, "restocked", available)
+
+    def _fire(self, resource, crossing, available):
+        if self._callback is None:
+            return
+        if self._loop is None:
+            self._callback(resource, crossing, available)
+        elif inspect.iscoroutinefunction(self._callback):
+            asyncio.run_coroutine_threadsafe(self._callback(resource, crossing, available), self._loop)
+        else:
+            self._loop.call_soon_threadsafe(self._callback, resource, crossing, available)
+
+    def low(self) -> list:
+        return list(self._low)
+
+    def nearest(self, k: int) -> list:
+        validate_integer("k", k, min_value=0)
+        heap, entries = self._heap, self._entries
+        found = []
+        while heap and len(found) < k:
+            entry = heapq.heappop(heap)
+            if entries.get(entry[2]) is entry:
+                found.append(entry)
+        #the live entries go back, the stale ones popped on the way are gone for good
+        for entry in found:
+            heapq.heappush(heap, entry)
+        return [(resource, margin) for margin, _, resource in found]
+
+    def __len__(self):
+        return len(self._thresholds)
+
+    def __contains__(self, resource):
+        return resource in self._thresholds
+
+    def __repr__(self):
+        return f"LowStockWatcher(watched={len(self._thresholds)}, low={len(self._low)})"
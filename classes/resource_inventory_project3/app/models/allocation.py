@@ -0,0 +1,83 @@
+"""Atomic multi-resource allocation"""
+
+from app.models.inventory import Resource
+
+
+def _merge_lines(bill_of_materials) -> dict:
+    """Validates every line item in one pass and adds up repeated resources."""
+    if isinstance(bill_of_materials, dict):
+        bill_of_materials = bill_of_materials.items()
+
+    quantities = {}
+    for resource, quantity in bill_of_materials:
+        if not isinstance(resource, Resource):
+            raise TypeError(f"{resource!r} is not a Resource")
+        if not isinstance(quantity, int):
+            raise TypeError(f"quantity of {resource} must be an integer")
+        if quantity < 1:
+            raise ValueError(f"quantity of {resource} can not be less than 1")
+        quantities[resource] = quantities.get(resource, 0) + quantity
+    return quantities
+
+
+def allocate(bill_of_materials) -> dict:
+    """
+    Claims every line of a bill of materials, or none of them.
+
+    **Args:**
+
+    * `bill_of_materials`: A dict `{resource: quantity}` or an iterable of `(resource, quantity)` pairs. A resource may appear more than once.
+
+    **Returns:**
+
+    * `dict`: The merged `{resource: quantity}` that was claimed, which can be handed back to `release`.
+
+    **Raises:**
+
+    * `TypeError`: If a line is not a `Resource` or its quantity is not an integer.
+    * `ValueError`: If a quantity is less than 1 or more than the resource has available. Nothing is claimed in that case.
+
+    **Example:**
+
+    ```python
+    build = allocate({cpu: 1, ssd: 1, hdd: 2})
+    ...
+    release(build)
+    ```
+    """
+    quantities = _merge_lines(bill_of_materials)
+
+    for resource, quantity in quantities.items():
+        if quantity > resource._total - resource._allocated:
+            raise ValueError(f"quantity of {resource} can not be greather than {resource.available}")
+
+    #everything was checked above, so applying can not fail half way
+    for resource, quantity in quantities.items():
+        resource._allocated += quantity
+        if resource._observers:
+            resource._notify("claim", quantity)
+
+    return quantities
+
+
+def release(bill_of_materials) -> dict:
+    """
+    Frees every line of a bill of materials, or none of them (the inverse of `allocate`).
+
+    **Raises:**
+
+    * `TypeError`: If a line is not a `Resource` or its quantity is not an integer.
+    * `ValueError`: If a quantity is less than 1 or more than the resource has allocated. Nothing is freed in that case.
+    """
+    quantities = _merge_lines(bill_of_materials)
+
+    for resource, quantity in quantities.items():
+        if quantity > resource._allocated:
+            raise ValueError(f"quantity of {resource} can not be greather than {resource.allocated}")
+
+    for resource, quantity in quantities.items():
+        resource._allocated -= quantity
+        if resource._observers:
+            resource._notify("freeup", quantity)
+
+    return quantities
@@ -0,0 +1,119 @@
+"""Thread-safe inventory mutations: per-resource lock stripes and optimistic claims"""
+
+import threading
+
+from app.models import allocation
+from app.models.inventory import Resource
+from app.utils.validators import validate_integer
+
+
+class ConcurrentInventory:
+    """
+    **Summary:**
+
+    Serializes the mutations of each resource so many threads (e.g. build workers) can share the same `Resource` objects.
+    Every resource maps to one lock of a fixed pool (lock striping, since slotted resources can not carry a lock of their own),
+    so memory stays bounded while unrelated resources rarely contend. `claim`'s check that `allocated` stays at or below
+    `total` runs under that lock, so it holds under contention.
+
+    **Methods:**
+
+    * `__init__(self, stripes: int = 1024)`: Creates the lock pool.
+    * `lock_for(self, resource: Resource) -> threading.Lock`: Returns the lock guarding a resource.
+    * `claim`, `freeup`, `died`, `purchased` `(self, resource: Resource, n: int) -> None`: Call the `Resource` method under the resource's lock.
+    * `try_claim(self, resource: Resource, n: int) -> bool`: Like `claim`, but returns False instead of raising when fewer than `n` are available.
+    * `claim_optimistic(self, resource: Resource, n: int) -> bool`: Reads `allocated` without the lock and commits the claim
+      only if it did not change in between (compare-and-swap emulated with the lock), retrying otherwise.
+      Returns False when fewer than `n` are available.
+    * `allocate(self, bill_of_materials) -> dict` and `release(self, bill_of_materials) -> dict`: `app.models.allocation.allocate`/`release`
+      with the locks of every line held, taken in a fixed order so two bills never deadlock.
+
+    **Notes:**
+
+    * Subscriber callbacks run while the resource's lock is held; they must not mutate resources through the same `ConcurrentInventory`.
+
+    **Raises:**
+
+    * The same `TypeError`/`ValueError` as the `Resource` methods.
+    """
+
+    def __init__(self, stripes: int = 1024) -> None:
+        validate_integer("stripes", stripes, min_value=1)
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def _stripe(self, resource):
+        return hash(resource) % len(self._locks)
+
+    def lock_for(self, resource: Resource):
+        return self._locks[self._stripe(resource)]
+
+    def claim(self, resource: Resource, n: int) -> None:
+        with self.lock_for(resource):
+            resource.claim(n)
+
+    def freeup(self, resource: Resource, n: int) -> None:
+        with self.lock_for(resource):
+            resource.freeup(n)
+
+    def died(self, resource: Resource, n: int) -> None:
+        with self.lock_for(resource):
+            resource.died(n)
+
+    def purchased(self, resource: Resource, n: int) -> None:
+        with self.lock_for(resource):
+            resource.purchased(n)
+
+    def try_claim(self, resource: Resource, n: int) -> bool:
+        resource._validate_num(n)
+        with self.lock_for(resource):
+            if resource._total - resource._allocated < n:
+                return False
+            resource._allocated += n
+            if resource._observers:
+                resource._notify("claim", n)
+        return True
+
+    def _compare_and_claim(self, resource, expected_allocated, n):
+        with self.lock_for(resource):
+            if resource._allocated != expected_allocated or expected_allocated + n > resource._total:
+                return False
+            resource._allocated = expected_allocated + n
+            if resource._observers:
+                resource._notify("claim", n)
+            return True
+
+    def claim_optimistic(self, resource: Resource, n: int) -> bool:
+        resource._validate_num(n)
+        while True:
+            allocated = resource._allocated
+            if resource._total - allocated < n:
+                return False
+            if self._compare_and_claim(resource, allocated, n):
+                return True
+
+    def _locks_of(self, bill_of_materials):
+        stripes = sorted({self._stripe(resource) for resource in bill_of_materials})
+        return [self._locks[stripe] for stripe in stripes]
+
+    def _with_locks(self, operation, bill_of_materials):
+        quantities = allocation._merge_lines(bill_of_materials)
+        locks = self._locks_of(quantities)
+        for lock in locks:
+            lock.acquire()
+        try:
+            return operation(quantities)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+    def allocate(self, bill_of_materials) -> dict:
+        return self._with_locks(allocation.allocate, bill_of_materials)
+
+    def release(self, bill_of_materials) -> dict:
+        return self._with_locks(allocation.release, bill_of_materials)
+
+    def __len__(self):
+        return len(self._locks)
+
+    def __repr__(self):
+        return f"ConcurrentInventory(stripes={len(self._locks)})"
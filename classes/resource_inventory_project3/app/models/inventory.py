@@ -1,6 +1,6 @@
 """Inventory moodels"""
 
-from app.utils.validators import validate_integer
+from app.utils.validators import validate_integer, compile_integer_validator
 
 class Resource:
     """
@@ -21,27 +21,44 @@ class Resource:
 
     * `__init__(self, name: str, manufacturer: str, total: int, allocated: int) -> None`  
     Initializes a `Resource` object with the given name, manufacturer, total quantity, and allocated quantity.
-    * `claim(self, num_inv_to_claim: int) -> None`: Allocates a specified number of resources to the allocated pool. (argument must be a positive integer)
+    * `claim(self, num_inv_to_claim: int) -> None`: Allocates a specified number of resources to the allocated pool. (argument must be a positive integer, and cannot exceed the currently available amount)
     * `freeup(self, num_to_free: int) -> None`: Releases a specified number of resources from the allocated pool back to the available pool. (argument must be a positive integer, and cannot exceed the currently allocated amount)
     * `died(self, num_of_dies: int) -> None`: Reduces the total and allocated quantities by a specified number, representing resource loss. (argument must be a non-negative integer, and cannot exceed the currently allocated amount)
     * `purchased(self, num_purchases: int) -> None`: Increases the total quantity of the resource by a specified number, representing a purchase. (argument must be a positive integer)
+    * `subscribe(self, callback) -> None`: Registers `callback(resource, event, n)`, called after every `claim`, `freeup`, `died` and `purchased` (`event` is the method name).
+    * `unsubscribe(self, callback) -> None`: Removes a registered callback.
 
     **Notes:**
 
-    * The `validate_integer` function (assumed to exist elsewhere) is used internally to validate integer arguments and raise appropriate exceptions for invalid values.
+    * The `validate_integer` function (assumed to exist elsewhere) is used internally to validate integer arguments and raise appropriate exceptions for invalid values. Checks with fixed bounds use validators built once per class with `compile_integer_validator`.
 
     **Str and Repr:**
 
     * `__str__(self) -> str`: Returns the resource name.
     * `__repr__(self) -> str`: Returns a detailed string representation of the resource, including name, category, manufacturer, total quantity, and allocated quantity.
+
+    **Threads:**
+
+    * The counters are not guarded. When several threads mutate the same resources, go through `app.models.concurrent.ConcurrentInventory`.
+
+    **Memory:**
+
+    * The whole hierarchy uses `__slots__`, so instances carry no `__dict__`. For columnar storage of millions of SKUs see `app.models.table.ResourceTable`.
 """
 
+    __slots__ = ("_observers", "_name", "_manufacturer", "_total", "_allocated")
+
+    #checks whose bounds never change are compiled once for the class
+    _validate_total = staticmethod(compile_integer_validator("total", min_value=0))
+    _validate_num = staticmethod(compile_integer_validator("num", min_value=1))
+
     def __init__(self, name:str, manufacturer:str,total:int, allocated:int) -> None:
 
+        self._observers = None
         self._name = name
         self._manufacturer = manufacturer
 
-        if validate_integer("total", total, min_value=0):
+        if self._validate_total(total):
             self._total = total
         
         if validate_integer("allocate", allocated, min_value=0, max_value=total):
@@ -88,25 +105,43 @@ class Resource:
         return f"{self.name} ({self.category}-{self.manufacturer}) : total={self.total}, allocated={self.allocated}"
     
 
+    def subscribe(self, callback) -> None:
+        if self._observers is None:
+            self._observers = []
+        self._observers.append(callback)
+
+    def unsubscribe(self, callback) -> None:
+        if self._observers:
+            self._observers.remove(callback)
+
+    def _notify(self, event: str, n: int) -> None:
+        if self._observers:
+            for callback in self._observers:
+                callback(self, event, n)
+
     def claim(self, num_inv_to_claim: int):
         
-        if validate_integer("num", num_inv_to_claim,min_value=1):
+        if validate_integer("num", num_inv_to_claim, min_value=1, max_value=self.available):
             self._allocated += num_inv_to_claim
+            self._notify("claim", num_inv_to_claim)
 
     def freeup(self, num_to_free: int):
 
         if validate_integer("num", num_to_free,min_value=1, max_value=self.allocated):
             self._allocated -= num_to_free
+            self._notify("freeup", num_to_free)
 
     def died(self, num_of_dies: int):
 
         if validate_integer("num", num_of_dies, max_value=self.allocated):
             self._total -= num_of_dies
             self._allocated -= num_of_dies
+            self._notify("died", num_of_dies)
 
     def purchased(self,num_purchases: int):
-        if validate_integer("num", num_purchases, min_value=1):
-            self.total += 1
+        if self._validate_num(num_purchases):
+            self._total += num_purchases
+            self._notify("purchased", num_purchases)
 
         
 class CPU(Resource):
@@ -129,7 +164,7 @@ class CPU(Resource):
 
     **Notes:**
 
-    * The `validate_integer` function (assumed to exist elsewhere) is used internally to validate integer arguments and raise appropriate exceptions for invalid values.
+    * The `validate_integer` function (assumed to exist elsewhere) is used internally to validate integer arguments and raise appropriate exceptions for invalid values. Checks with fixed bounds use validators built once per class with `compile_integer_validator`.
 
     **Str Repr:**
 
@@ -137,17 +172,22 @@ class CPU(Resource):
 
     """
 
+    __slots__ = ("_cores", "_socket", "_power_watts")
+
+    _validate_cores = staticmethod(compile_integer_validator("cores", min_value=2, max_value=64))
+    _validate_power_watts = staticmethod(compile_integer_validator("power_watts", min_value=10, max_value=1000))
+
     def __init__(self, name: str, manufacturer: str, total: int, allocated: int,
                        cores: int, socket:str, power_watts: int) -> None:
         
         super().__init__(name, manufacturer, total, allocated)
 
-        if validate_integer("cores",cores, min_value=2, max_value=64):
+        if self._validate_cores(cores):
             self._cores = cores
 
         self._socket = socket
 
-        if validate_integer("power_watts", power_watts, min_value=10, max_value=1000):
+        if self._validate_power_watts(power_watts):
             self._power_watts = power_watts
 
 
@@ -191,11 +231,15 @@ class Storage(Resource):
     * `__repr__(self) -> str`: Returns a string representation of the storage resource, indicating its category and capacity in gigabytes.
 
     """
+
+    __slots__ = ("_capacity_gb",)
+
+    _validate_capacity_gb = staticmethod(compile_integer_validator("capacity_gb", min_value=250))
     
     def __init__(self, name: str, manufacturer: str, total: int, allocated: int, capacity_gb:int) -> None:
         super().__init__(name, manufacturer, total, allocated)
 
-        if validate_integer("capacity_gb", capacity_gb, min_value=250):
+        if self._validate_capacity_gb(capacity_gb):
             self._capacity_gb = capacity_gb
 
         
@@ -233,17 +277,20 @@ class HDD(Storage):
 
     """
 
+    __slots__ = ("_size", "_rpm")
+
+    ALLOW_SIZES = ('2.5"', '3.5"')
+    _validate_rpm = staticmethod(compile_integer_validator("rpm", min_value=1000, max_value=5000))
+
     def __init__(self, name: str, manufacturer: str, total: int, allocated: int, capacity_gb: int,
                  size: str, rpm: int)-> None:
         super().__init__(name, manufacturer, total, allocated, capacity_gb)
 
-        allow_sizes = ['2.5"', '3.5"']
-
-        if size not in allow_sizes:
-            raise ValueError(f"Invalid HDD size. Must be on of {','.join(allow_sizes)}")
+        if size not in HDD.ALLOW_SIZES:
+            raise ValueError(f"Invalid HDD size. Must be on of {','.join(HDD.ALLOW_SIZES)}")
         self._size = size
 
-        if validate_integer("rpm", rpm, min_value=1000, max_value=5000):
+        if self._validate_rpm(rpm):
             self._rpm = rpm
 
     
@@ -284,6 +331,8 @@ class SDD(Storage):
     * `__repr__(self) -> str`: Returns a string representation of the SDD resource, inheriting from the `Storage` class representation and adding the interface information.
     """
 
+    __slots__ = ("_interface",)
+
     def __init__(self, name: str, manufacturer: str, total: int, allocated: int, capacity_gb: int,interface: str)-> None:
         super().__init__(name, manufacturer, total, allocated, capacity_gb)
 
@@ -0,0 +1,172 @@
+"""Indexed pool of inventory resources"""
+
+from bisect import bisect_left, bisect_right, insort
+
+from app.models.inventory import Resource, Storage
+
+
+class InventoryPool:
+    """
+    **Summary:**
+
+    A collection of `Resource` objects with secondary indexes, so filtered queries such as
+    "all AM4 CPUs with available > 0" or "SSDs by interface" do not have to scan every resource.
+
+    **Indexes:**
+
+    * Hash indexes on `category`, `manufacturer`, `socket` and `interface` (resources without the attribute are not indexed on it).
+    * A sorted list of `(capacity_gb, position)` for capacity ranges.
+    * The set of resources with `available > 0`, kept up to date incrementally: the pool subscribes to every resource,
+      so each `claim`, `freeup`, `died` and `purchased` only touches the resource that changed.
+
+    **Methods:**
+
+    * `__init__(self, resources=())`: Builds the pool from existing resources.
+    * `add(self, resource: Resource) -> None`: Adds and indexes a resource.
+    * `extend(self, resources) -> None`: Adds many resources, sorting the capacity index once instead of once per resource.
+    * `remove(self, resource: Resource) -> None`: Removes a resource and its index entries.
+    * `find(self, category=None, manufacturer=None, socket=None, interface=None, min_capacity_gb=None, max_capacity_gb=None, available=None) -> list`
+      Returns the resources matching every given filter, in the order they were added. `available=True` keeps resources with `available > 0`, `available=False` the others.
+
+    **Raises:**
+
+    * `ValueError`: If a resource is added twice or removed without being in the pool.
+    """
+
+    INDEXED_ATTRIBUTES = ("category", "manufacturer", "socket", "interface")
+
+    def __init__(self, resources=()) -> None:
+        self._positions = {}
+        self._by_position = {}
+        self._next_position = 0
+        self._indexes = {attr: {} for attr in self.INDEXED_ATTRIBUTES}
+        self._capacities = []
+        self._available = {}
+        self._attributes_by_type = {}
+
+        self.extend(resources)
+
+    def add(self, resource: Resource) -> None:
+        capacity = self._add(resource)
+        if capacity is not None:
+            insort(self._capacities, capacity)
+
+    def extend(self, resources) -> None:
+        #the capacity entries are sorted once at the end instead of one O(n) insort per Storage
+        capacities = []
+        try:
+            for resource in resources:
+                capacity = self._add(resource)
+                if capacity is not None:
+                    capacities.append(capacity)
+        finally:
+            #resources indexed before a failure keep their capacity entry too
+            if capacities:
+                self._capacities.extend(capacities)
+                self._capacities.sort()
+
+    def _add(self, resource):
+        #indexes a resource everywhere but in the capacity list, and returns its capacity entry (None if it is no Storage)
+        if resource in self._positions:
+            raise ValueError(f"{resource} is already in the pool")
+
+        position = self._positions[resource] = self._next_position
+        self._by_position[position] = resource
+        self._next_position += 1
+
+        #dicts are used as insertion ordered sets
+        for attr in self._indexed_attributes(resource):
+            self._indexes[attr].setdefault(getattr(resource, attr), {})[resource] = None
+
+        if resource.available > 0:
+            self._available[resource] = None
+
+        resource.subscribe(self._resource_changed)
+
+        return (resource.capacity_gb, position) if isinstance(resource, Storage) else None
+
+    def remove(self, resource: Resource) -> None:
+        position = self._positions.pop(resource, None)
+        if position is None:
+            raise ValueError(f"{resource} is not in the pool")
+        del self._by_position[position]
+
+        resource.unsubscribe(self._resource_changed)
+
+        for attr in self._indexed_attributes(resource):
+            index = self._indexes[attr]
+            value = getattr(resource, attr)
+            bucket = index[value]
+            del bucket[resource]
+            if not bucket:
+                del index[value]
+
+        if isinstance(resource, Storage):
+            del self._capacities[bisect_left(self._capacities, (resource.capacity_gb, position))]
+
+        self._available.pop(resource, None)
+
+    def _indexed_attributes(self, resource):
+        #which indexed attributes a class has is looked up once per class, not once per resource
+        cls = type(resource)
+        attributes = self._attributes_by_type.get(cls)
+        if attributes is None:
+            attributes = self._attributes_by_type[cls] = tuple(a for a in self.INDEXED_ATTRIBUTES if hasattr(cls, a))
+        return attributes
+
+    def _resource_changed(self, resource, event, n):
+        if resource.available > 0:
+            self._available[resource] = None
+        else:
+            self._available.pop(resource, None)
+
+    def find(self, category=None, manufacturer=None, socket=None, interface=None,
+             min_capacity_gb=None, max_capacity_gb=None, available=None) -> list:
+        candidates = []
+        for attr, value in zip(self.INDEXED_ATTRIBUTES, (category, manufacturer, socket, interface)):
+            if value is not None:
+                candidates.append(self._indexes[attr].get(value, {}))
+        if available:
+            candidates.append(self._available)
+        candidates.sort(key=len)
+
+        by_capacity = min_capacity_gb is not None or max_capacity_gb is not None
+        if by_capacity:
+            low = 0 if min_capacity_gb is None else bisect_left(self._capacities, (min_capacity_gb, -1))
+            high = (len(self._capacities) if max_capacity_gb is None
+                    else bisect_right(self._capacities, (max_capacity_gb, self._next_position)))
+
+        #walk the smallest candidate (an index bucket or the capacity slice) and probe the others
+        if by_capacity and (not candidates or high - low < len(candidates[0])):
+            smallest = [self._by_position[position] for _, position in self._capacities[low:high]]
+            others = candidates
+            by_capacity = False
+        elif candidates:
+            smallest, others = candidates[0], candidates[1:]
+        else:
+            smallest, others = self._positions, []
+
+        matches = [r for r in smallest if all(r in other for other in others)]
+
+        if by_capacity:
+            low_gb = float("-inf") if min_capacity_gb is None else min_capacity_gb
+            high_gb = float("inf") if max_capacity_gb is None else max_capacity_gb
+            matches = [r for r in matches if isinstance(r, Storage) and low_gb <= r.capacity_gb <= high_gb]
+
+        if available is False:
+            matches = [r for r in matches if r not in self._available]
+
+        matches.sort(key=self._positions.__getitem__)
+        return matches
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __iter__(self):
+        return iter(self._positions)
+
+    def __contains__(self, resource):
+        return resource in self._positions
+
+    def __repr__(self):
+        return f"InventoryPool(resources={len(self._positions)})"
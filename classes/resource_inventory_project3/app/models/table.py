@@ -0,0 +1,362 @@
+"""Columnar (struct-of-arrays) resource storage"""
+
+from array import array
+from operator import gt
+import sys
+
+from app.models.inventory import Resource, CPU, Storage, HDD, SDD
+from app.utils.validators import validate_integer, validate_many
+
+#the kind column stores the position of the class in this tuple
+_KINDS = (Resource, CPU, Storage, HDD, SDD)
+_KIND_CODES = {cls: code for code, cls in enumerate(_KINDS)}
+#largest value of the array('q') columns
+_INT64_MAX = 2 ** 63 - 1
+#the class and the specific columns (besides name, manufacturer, total and allocated) of each category
+CATEGORY_COLUMNS = {
+    "resource": (Resource, ()),
+    "cpu": (CPU, ("cores", "socket", "power_watts")),
+    "storage": (Storage, ("capacity_gb",)),
+    "hdd": (HDD, ("capacity_gb", "size", "rpm")),
+    "sdd": (SDD, ("capacity_gb", "interface")),
+}
+
+
+def validate_columns(category: str, columns: dict, rows=None):
+    """
+    Validates rows of one category given as columns (`{"name": [...], "total": [...], ...}`), with the same rules as the
+    class constructors but one `validate_many` pass per column, plus the range of the table's integer columns.
+    Errors name `rows[i]` for the value at position `i` (the position itself by default). Returns the class of the category.
+
+    **Raises:**
+
+    * `TypeError`: If a numeric value is not an integer.
+    * `ValueError`: If the category is unknown, a column is missing or has another length, or a value is out of range.
+    """
+    try:
+        cls, specific = CATEGORY_COLUMNS[category]
+    except KeyError:
+        raise ValueError(f"Unknown category {category}, must be one of {', '.join(CATEGORY_COLUMNS)}") from None
+
+    required = ("name", "manufacturer", "total", "allocated") + specific
+    missing = [c for c in required if c not in columns]
+    if missing:
+        raise ValueError(f"Missing columns for {category}: {', '.join(missing)}")
+    n = len(columns["name"])
+    if any(len(columns[c]) != n for c in required):
+        raise ValueError("All columns must have the same length")
+    rows = range(n) if rows is None else rows
+
+    total, allocated = columns["total"], columns["allocated"]
+    validate_many("total", total, min_value=0, max_value=_INT64_MAX, rows=rows)
+    validate_many("allocate", allocated, min_value=0, max_value=_INT64_MAX, rows=rows)
+    if any(map(gt, allocated, total)):
+        row, t = next((row, t) for row, a, t in zip(rows, allocated, total) if a > t)
+        raise ValueError(f"allocate at row {row} can not be greather than {t}")
+
+    if cls is CPU:
+        validate_many("cores", columns["cores"], min_value=2, max_value=64, rows=rows)
+        validate_many("power_watts", columns["power_watts"], min_value=10, max_value=1000, rows=rows)
+    if issubclass(cls, Storage):
+        validate_many("capacity_gb", columns["capacity_gb"], min_value=250, max_value=_INT64_MAX, rows=rows)
+    if cls is HDD:
+        if not set(columns["size"]) <= set(HDD.ALLOW_SIZES):
+            row = next(row for row, size in zip(rows, columns["size"]) if size not in HDD.ALLOW_SIZES)
+            raise ValueError(f"Invalid HDD size at row {row}. Must be on of {','.join(HDD.ALLOW_SIZES)}")
+        validate_many("rpm", columns["rpm"], min_value=1000, max_value=5000, rows=rows)
+
+    return cls
+
+
+class ResourceTable:
+    """
+    **Summary:**
+
+    Stores many resources as columns instead of objects: the counters and numeric attributes live in typed
+    `array` columns and the text attributes in lists whose repeated values share one string object.
+    Rows are read and mutated through lightweight view objects that expose the same interface as
+    `CPU`, `HDD`, `SDD`, `Storage` and `Resource`.
+
+    **Columns:**
+
+    * `array('q')`: `total`, `allocated`, `capacity_gb`.
+    * `array('i')`: `cores`, `power_watts`, `rpm` (0 when the row has no such attribute).
+    * `array('b')`: the row kind (which class the row represents).
+    * lists: `name`, `manufacturer`, `socket`, `size`, `interface` (`None` when the row has no such attribute).
+
+    **Methods:**
+
+    * `append(self, resource: Resource) -> int`: Copies a resource into a new row and returns the row number.
+    * `extend(self, resources) -> None`: Appends many resources.
+    * `load_columns(self, category: str, columns: dict, rows=None) -> range`: Appends rows of one category given as columns, validated
+      in bulk with `validate_columns` (nothing is appended if a row is invalid, errors name `rows[i]`). Returns the new row numbers.
+    * `__getitem__(self, row: int) -> ResourceView`: Returns a view of a row (`CPUView`, `HDDView`, `SDDView`, ...).
+    * `materialize(self, row: int) -> Resource`: Builds a regular `CPU`/`HDD`/`SDD`/... object with the row's current values.
+    * `column(self, name: str)`: Returns a whole column (the live `array`/list, treat it as read-only). `category` is built from the kind column.
+    * `nbytes (self) -> int`: Bytes used by the columns (not counting the shared strings). (property)
+    * `version (self) -> int`: Incremented on every counter change, so cached aggregates know when to recompute. (property)
+    """
+
+    _COLUMNS = ("total", "allocated", "capacity_gb", "cores", "power_watts", "rpm",
+                "name", "manufacturer", "socket", "size", "interface")
+
+    def __init__(self, resources=()) -> None:
+        self._kind = array("b")
+        self._total = array("q")
+        self._allocated = array("q")
+        self._capacity_gb = array("q")
+        self._cores = array("i")
+        self._power_watts = array("i")
+        self._rpm = array("i")
+        self._name = []
+        self._manufacturer = []
+        self._socket = []
+        self._size = []
+        self._interface = []
+        self._strings = {}
+        self._version = 0
+
+        self.extend(resources)
+
+    def _intern(self, value):
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def append(self, resource: Resource) -> int:
+        kind = _KIND_CODES.get(type(resource))
+        if kind is None:
+            raise TypeError(f"{type(resource).__name__} can not be stored in a ResourceTable")
+
+        is_cpu = isinstance(resource, CPU)
+        is_storage = isinstance(resource, Storage)
+
+        self._kind.append(kind)
+        self._total.append(resource.total)
+        self._allocated.append(resource.allocated)
+        self._capacity_gb.append(resource.capacity_gb if is_storage else 0)
+        self._cores.append(resource.cores if is_cpu else 0)
+        self._power_watts.append(resource.power_watts if is_cpu else 0)
+        self._rpm.append(resource.rpm if isinstance(resource, HDD) else 0)
+        self._name.append(self._intern(resource.name))
+        self._manufacturer.append(self._intern(resource.manufacturer))
+        self._socket.append(self._intern(resource.socket) if is_cpu else None)
+        self._size.append(self._intern(resource.size) if isinstance(resource, HDD) else None)
+        self._interface.append(self._intern(resource.interface) if isinstance(resource, SDD) else None)
+        self._version += 1
+
+        return len(self._kind) - 1
+
+    def extend(self, resources) -> None:
+        for resource in resources:
+            self.append(resource)
+
+    def load_columns(self, category: str, columns: dict, rows=None) -> range:
+        cls = validate_columns(category, columns, rows)
+        specific = CATEGORY_COLUMNS[category][1]
+
+        first = len(self._kind)
+        n = len(columns["name"])
+        zeros = [0] * n
+        nones = [None] * n
+        #columns the category does not have are ignored, like in `append`
+        specific_column = lambda name, default: columns[name] if name in specific else default
+        intern = self._intern
+
+        #every new piece is built before any column grows, so a failure can not leave the columns with different lengths
+        new = {
+            "kind": array("b", [_KIND_CODES[cls]]) * n,
+            "total": array("q", columns["total"]),
+            "allocated": array("q", columns["allocated"]),
+            "capacity_gb": array("q", specific_column("capacity_gb", zeros)),
+            "cores": array("i", specific_column("cores", zeros)),
+            "power_watts": array("i", specific_column("power_watts", zeros)),
+            "rpm": array("i", specific_column("rpm", zeros)),
+            "name": list(map(intern, columns["name"])),
+            "manufacturer": list(map(intern, columns["manufacturer"])),
+            "socket": list(map(intern, specific_column("socket", nones))),
+            "size": list(map(intern, specific_column("size", nones))),
+            "interface": list(map(intern, specific_column("interface", nones))),
+        }
+        for name, values in new.items():
+            getattr(self, f"_{name}").extend(values)
+        self._version += 1
+
+        return range(first, first + n)
+
+    def __len__(self):
+        return len(self._kind)
+
+    def __getitem__(self, row: int):
+        if not -len(self._kind) <= row < len(self._kind):
+            raise IndexError("ResourceTable index out of range")
+        row %= len(self._kind)
+        return _VIEWS[self._kind[row]](self, row)
+
+    def __iter__(self):
+        for row in range(len(self._kind)):
+            yield _VIEWS[self._kind[row]](self, row)
+
+    def materialize(self, row: int) -> Resource:
+        view = self[row]
+        cls = _KINDS[self._kind[view.row]]
+        args = [view.name, view.manufacturer, view.total, view.allocated]
+        if cls is CPU:
+            args += [view.cores, view.socket, view.power_watts]
+        elif cls is HDD:
+            args += [view.capacity_gb, view.size, view.rpm]
+        elif cls is SDD:
+            args += [view.capacity_gb, view.interface]
+        elif cls is Storage:
+            args.append(view.capacity_gb)
+        return cls(*args)
+
+    def column(self, name: str):
+        if name == "category":
+            categories = [cls.__name__.lower() for cls in _KINDS]
+            return [categories[kind] for kind in self._kind]
+        if name not in self._COLUMNS:
+            raise ValueError(f"Unknown column {name}, must be one of {', '.join(self._COLUMNS)}")
+        return getattr(self, f"_{name}")
+
+    @property
+    def version(self):
+        return self._version
+
+    @property
+    def nbytes(self):
+        arrays = (self._kind, self._total, self._allocated, self._capacity_gb, self._cores, self._power_watts, self._rpm)
+        lists = (self._name, self._manufacturer, self._socket, self._size, self._interface)
+        return sum(a.itemsize * len(a) for a in arrays) + sum(sys.getsizeof(l) for l in lists)
+
+    def __repr__(self):
+        return f"ResourceTable(rows={len(self._kind)}, nbytes={self.nbytes})"
+
+
+class ResourceView:
+    """
+    **Summary:**
+
+    A row of a `ResourceTable` with the same properties and methods as `Resource`
+    (`claim`, `freeup`, `died` and `purchased` validate exactly like `Resource` and write to the table columns).
+    """
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: ResourceTable, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    @property
+    def row(self):
+        return self._row
+
+    @property
+    def name(self):
+        return self._table._name[self._row]
+
+    @property
+    def manufacturer(self):
+        return self._table._manufacturer[self._row]
+
+    @property
+    def total(self):
+        return self._table._total[self._row]
+
+    @property
+    def allocated(self):
+        return self._table._allocated[self._row]
+
+    @property
+    def available(self):
+        return self._table._total[self._row] - self._table._allocated[self._row]
+
+    @property
+    def category(self):
+        return _KINDS[self._table._kind[self._row]].__name__.lower()
+
+    def claim(self, num_inv_to_claim: int):
+        if validate_integer("num", num_inv_to_claim, min_value=1, max_value=self.available):
+            self._table._allocated[self._row] += num_inv_to_claim
+            self._table._version += 1
+
+    def freeup(self, num_to_free: int):
+        if validate_integer("num", num_to_free, min_value=1, max_value=self.allocated):
+            self._table._allocated[self._row] -= num_to_free
+            self._table._version += 1
+
+    def died(self, num_of_dies: int):
+        if validate_integer("num", num_of_dies, max_value=self.allocated):
+            self._table._total[self._row] -= num_of_dies
+            self._table._allocated[self._row] -= num_of_dies
+            self._table._version += 1
+
+    def purchased(self, num_purchases: int):
+        if validate_integer("num", num_purchases, min_value=1):
+            self._table._total[self._row] += num_purchases
+            self._table._version += 1
+
+    def __str__(self) -> str:
+        return self.name
+
+    def __repr__(self) -> str:
+        return f"{self.name} ({self.category}-{self.manufacturer}) : total={self.total}, allocated={self.allocated}"
+
+
+class CPUView(ResourceView):
+    __slots__ = ()
+
+    @property
+    def cores(self):
+        return self._table._cores[self._row]
+
+    @property
+    def socket(self):
+        return self._table._socket[self._row]
+
+    @property
+    def power_watts(self):
+        return self._table._power_watts[self._row]
+
+    def __repr__(self) -> str:
+        return f"{self.category}: {self.name} ({self.socket} - x{self.cores})"
+
+
+class StorageView(ResourceView):
+    __slots__ = ()
+
+    @property
+    def capacity_gb(self):
+        return self._table._capacity_gb[self._row]
+
+    def __repr__(self):
+        return f"({self.category}: {self.capacity_gb})"
+
+
+class HDDView(StorageView):
+    __slots__ = ()
+
+    @property
+    def size(self):
+        return self._table._size[self._row]
+
+    @property
+    def rpm(self):
+        return self._table._rpm[self._row]
+
+    def __repr__(self):
+        return f"{super().__repr__()} ({self.size}, {self.rpm} rpm)"
+
+
+class SDDView(StorageView):
+    __slots__ = ()
+
+    @property
+    def interface(self):
+        return self._table._interface[self._row]
+
+    def __repr__(self):
+        return f"{super().__repr__()} ({self.interface}"
+
+
+_VIEWS = (ResourceView, CPUView, StorageView, HDDView, SDDView)
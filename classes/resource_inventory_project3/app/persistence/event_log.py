@@ -0,0 +1,287 @@
+"""Append-only, memory-mapped log of inventory mutations"""
+
+import json
+import mmap
+import os
+import struct
+import time
+
+from app.models.inventory import Resource
+from app.persistence.rows import to_row, from_row
+
+
+class EventLog:
+    """
+    **Summary:**
+
+    Records every `claim`, `freeup`, `died` and `purchased` of the tracked resources as a fixed-width binary event
+    in an mmap-backed file, so the inventory can be rebuilt as it was at any point in time.
+    Events are made durable in batches: every `commit_every` events (or when `commit` is called) the event count is
+    written to the header and the file is fsynced once for the whole batch.
+
+    **Files:**
+
+    * `<path>`: The events. `R` registers a resource with its counters, `S` is a compacted state, `C`/`F`/`D`/`P` are
+      `claim`/`freeup`/`died`/`purchased`.
+    * `<path>.resources`: One JSON line per tracked resource with its descriptive attributes (name, category, socket, ...).
+
+    **Record layout:**
+
+    * `epoch_ns (int64)`: UTC epoch nanoseconds, never decreasing along the log (so a point in time is found by binary search).
+    * `resource_id (int64)`: The id given by `track`.
+    * `event (1 byte)`: `R`, `S`, `C`, `F`, `D` or `P`.
+    * `a (int64)`, `b (int64)`: `total` and `allocated` for `R`/`S`, the quantity and 0 otherwise.
+
+    **Methods:**
+
+    * `__init__(self, path: str, commit_every: int = 4096, grow_by: int = 65536, compact_every: int = None, retain_seconds: float = None)`:
+      Opens (or creates) the log. With `compact_every`, a commit that finds that many events after the last compaction
+      compacts everything older than `retain_seconds` (all of it when `retain_seconds` is None).
+    * `track(self, resource: Resource) -> int`: Registers a resource, subscribes to it and returns its id.
+    * `replay(self, at: float = None) -> dict`: Rebuilds `{resource_id: Resource}` as it was at epoch seconds `at` (now by default). The objects are not tracked.
+    * `restore(self) -> dict`: Like `replay()`, but the rebuilt resources are tracked again under their ids (to continue after a restart).
+    * `commit(self) -> None`: Makes every recorded event durable.
+    * `compact(self, until: float = None) -> int`: Folds the events up to epoch seconds `until` (everything by default) into one `S` record per resource.
+      Returns how many records were removed. History before `until` can no longer be replayed.
+    * `compacted_until (self) -> float`: The oldest point in time that can still be replayed. (property)
+    * `close(self) -> None`: Commits and closes the log.
+
+    **Raises:**
+
+    * `ValueError`: If the file is not an event log, a resource is tracked twice, or `replay` asks for compacted history.
+    """
+
+    MAGIC = b"INVEVTS1"
+    #magic, committed events, next resource id, compacted until (epoch ns)
+    HEADER = struct.Struct("<8sqqq")
+    RECORD = struct.Struct("<qqcqq")
+
+    EVENTS = {"claim": b"C", "freeup": b"F", "died": b"D", "purchased": b"P"}
+    _REGISTER = b"R"
+    _STATE = b"S"
+
+    def __init__(self, path: str, commit_every: int = 4096, grow_by: int = 65536,
+                 compact_every: int = None, retain_seconds: float = None) -> None:
+        if commit_every < 1 or grow_by < 1:
+            raise ValueError("commit_every and grow_by must be positive")
+
+        self._path = path
+        self._commit_every = commit_every
+        self._grow_by = grow_by
+        self._compact_every = compact_every
+        self._retain_seconds = retain_seconds
+
+        self._ids = {}
+        self._pending_definitions = []
+        self._open()
+
+    def _open(self):
+        new_file = not os.path.exists(self._path) or os.path.getsize(self._path) == 0
+        self._file = open(self._path, "w+b" if new_file else "r+b")
+
+        if new_file:
+            self._file.truncate(self.HEADER.size + self._grow_by * self.RECORD.size)
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            self.HEADER.pack_into(self._mm, 0, self.MAGIC, 0, 1, 0)
+            self._count, self._next_id, self._compacted_until = 0, 1, 0
+        else:
+            self._mm = mmap.mmap(self._file.fileno(), 0)
+            magic, self._count, self._next_id, self._compacted_until = self.HEADER.unpack_from(self._mm, 0)
+            if magic != self.MAGIC:
+                self._mm.close()
+                self._file.close()
+                raise ValueError(f"{self._path} is not an inventory event log")
+
+        self._committed = self._count
+        self._capacity = (len(self._mm) - self.HEADER.size) // self.RECORD.size
+        self._last_epoch = self._epoch_at(self._count - 1) if self._count else self._compacted_until
+        self._compacted_count = self._count
+
+    @property
+    def path(self):
+        return self._path
+
+    @property
+    def compacted_until(self):
+        return self._compacted_until / 1e9
+
+    def __len__(self):
+        return self._count
+
+    def _epoch_at(self, position):
+        return self.RECORD.unpack_from(self._mm, self.HEADER.size + position * self.RECORD.size)[0]
+
+    def _append(self, resource_id, event, a, b=0):
+        if self._count == self._capacity:
+            self._grow()
+
+        #the wall clock may step back, the log never does
+        epoch = time.time_ns()
+        if epoch < self._last_epoch:
+            epoch = self._last_epoch
+        self._last_epoch = epoch
+
+        self.RECORD.pack_into(self._mm, self.HEADER.size + self._count * self.RECORD.size, epoch, resource_id, event, a, b)
+        self._count += 1
+
+        if self._count - self._committed >= self._commit_every:
+            self.commit()
+
+    def _grow(self):
+        self._mm.flush()
+        self._mm.close()
+        self._capacity += self._grow_by
+        self._file.truncate(self.HEADER.size + self._capacity * self.RECORD.size)
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+
+    def track(self, resource: Resource) -> int:
+        if resource in self._ids:
+            raise ValueError(f"{resource} is already tracked")
+
+        resource_id = self._next_id
+        self._next_id += 1
+        self._pending_definitions.append(json.dumps(to_row(resource_id, resource)))
+        self._append(resource_id, self._REGISTER, resource.total, resource.allocated)
+        self._ids[resource] = resource_id
+        resource.subscribe(self._resource_changed)
+        return resource_id
+
+    def _resource_changed(self, resource, event, n):
+        self._append(self._ids[resource], self.EVENTS[event], n)
+
+    def commit(self) -> None:
+        if self._count == self._committed and not self._pending_definitions:
+            return
+
+        #the definitions go to disk before the events that refer to them, and the events before the header
+        if self._pending_definitions:
+            with open(f"{self._path}.resources", "a", encoding="utf-8") as f:
+                f.write("\n".join(self._pending_definitions) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending_definitions.clear()
+
+        self._mm.flush()
+        self.HEADER.pack_into(self._mm, 0, self.MAGIC, self._count, self._next_id, self._compacted_until)
+        self._mm.flush(0, self.HEADER.size)
+        os.fsync(self._file.fileno())
+        self._committed = self._count
+
+        if self._compact_every and self._count - self._compacted_count >= self._compact_every:
+            self.compact(None if self._retain_seconds is None else time.time() - self._retain_seconds)
+
+    def _position_after(self, epoch_ns):
+        #first committed record newer than epoch_ns
+        low, high = 0, self._committed
+        while low < high:
+            middle = (low + high) // 2
+            if self._epoch_at(middle) <= epoch_ns:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _counters(self, end):
+        counters = {}
+        register, state = self._REGISTER, self._STATE
+        claim, freeup, died, purchased = (self.EVENTS[e] for e in ("claim", "freeup", "died", "purchased"))
+
+        view = memoryview(self._mm)[self.HEADER.size:self.HEADER.size + end * self.RECORD.size]
+        try:
+            for _, resource_id, event, a, b in self.RECORD.iter_unpack(view):
+                if event == claim:
+                    counters[resource_id][1] += a
+                elif event == freeup:
+                    counters[resource_id][1] -= a
+                elif event == died:
+                    values = counters[resource_id]
+                    values[0] -= a
+                    values[1] -= a
+                elif event == purchased:
+                    counters[resource_id][0] += a
+                elif event == register or event == state:
+                    counters[resource_id] = [a, b]
+        finally:
+            view.release()
+        return counters
+
+    def _definitions(self):
+        definitions = {}
+        path = f"{self._path}.resources"
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    row = json.loads(line)
+                    definitions[row[0]] = row
+        return definitions
+
+    def replay(self, at: float = None) -> dict:
+        self.commit()
+        if at is None:
+            end = self._committed
+        else:
+            at_ns = int(at * 1e9)
+            if at_ns < self._compacted_until:
+                raise ValueError(f"History before {self.compacted_until} was compacted")
+            end = self._position_after(at_ns)
+
+        definitions = self._definitions()
+        resources = {}
+        for resource_id, (total, allocated) in self._counters(end).items():
+            row = definitions[resource_id]
+            row[4], row[5] = total, allocated
+            resources[resource_id] = from_row(row)
+        return resources
+
+    def restore(self) -> dict:
+        resources = self.replay()
+        for resource_id, resource in resources.items():
+            self._ids[resource] = resource_id
+            resource.subscribe(self._resource_changed)
+        return resources
+
+    def compact(self, until: float = None) -> int:
+        self.commit()
+        until_ns = self._last_epoch if until is None else int(until * 1e9)
+        if until_ns <= self._compacted_until:
+            return 0
+
+        cut = self._position_after(until_ns)
+        counters = self._counters(cut)
+        kept = self._committed - cut
+
+        tmp_path = f"{self._path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, len(counters) + kept, self._next_id, until_ns))
+            f.write(b"".join(self.RECORD.pack(until_ns, resource_id, self._STATE, total, allocated)
+                             for resource_id, (total, allocated) in counters.items()))
+            start = self.HEADER.size + cut * self.RECORD.size
+            f.write(self._mm[start:start + kept * self.RECORD.size])
+            f.flush()
+            os.fsync(f.fileno())
+
+        self._mm.close()
+        self._file.close()
+        os.replace(tmp_path, self._path)
+        self._open()
+
+        return cut - len(counters)
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        self.commit()
+        for resource in self._ids:
+            resource.unsubscribe(self._resource_changed)
+        self._ids.clear()
+        self._mm.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"EventLog(path='{self._path}', events={self._count}, resources={self._next_id - 1})"
@@ -0,0 +1,34 @@
+"""Flat row representation of inventory resources, shared by the persistence backends"""
+
+from app.models.inventory import Resource, CPU, Storage, HDD, SDD
+
+_CLASSES = {cls.__name__.lower(): cls for cls in (Resource, CPU, Storage, HDD, SDD)}
+
+
+def to_row(resource_id: int, resource: Resource) -> tuple:
+    """Flattens a resource into `(id, category, name, manufacturer, total, allocated, capacity_gb, cores, socket, power_watts, size, rpm, interface)`, with `None` for attributes the class does not have."""
+    is_cpu = isinstance(resource, CPU)
+    is_hdd = isinstance(resource, HDD)
+    return (resource_id, resource.category, resource.name, resource.manufacturer, resource.total, resource.allocated,
+            resource.capacity_gb if isinstance(resource, Storage) else None,
+            resource.cores if is_cpu else None,
+            resource.socket if is_cpu else None,
+            resource.power_watts if is_cpu else None,
+            resource.size if is_hdd else None,
+            resource.rpm if is_hdd else None,
+            resource.interface if isinstance(resource, SDD) else None)
+
+
+def from_row(row: tuple) -> Resource:
+    """Builds the `Resource` subclass named by the category of a row made by `to_row`."""
+    _, category, name, manufacturer, total, allocated, capacity_gb, cores, socket, power_watts, size, rpm, interface = row
+    cls = _CLASSES[category]
+    if cls is CPU:
+        return CPU(name, manufacturer, total, allocated, cores, socket, power_watts)
+    if cls is HDD:
+        return HDD(name, manufacturer, total, allocated, capacity_gb, size, rpm)
+    if cls is SDD:
+        return SDD(name, manufacturer, total, allocated, capacity_gb, interface)
+    if cls is Storage:
+        return Storage(name, manufacturer, total, allocated, capacity_gb)
+    return Resource(name, manufacturer, total, allocated)
@@ -0,0 +1,171 @@
+"""SQLite persistence for inventory resources"""
+
+import sqlite3
+
+from app.models.inventory import Resource
+from app.persistence.rows import to_row, from_row
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS resources (
+    id INTEGER PRIMARY KEY,
+    category TEXT NOT NULL,
+    name TEXT NOT NULL,
+    manufacturer TEXT NOT NULL,
+    total INTEGER NOT NULL,
+    allocated INTEGER NOT NULL,
+    capacity_gb INTEGER,
+    cores INTEGER,
+    socket TEXT,
+    power_watts INTEGER,
+    size TEXT,
+    rpm INTEGER,
+    interface TEXT
+)
+"""
+_COLUMNS = "id, category, name, manufacturer, total, allocated, capacity_gb, cores, socket, power_watts, size, rpm, interface"
+
+
+class SQLiteInventoryStore:
+    """
+    **Summary:**
+
+    Keeps `Resource`/`CPU`/`Storage`/`HDD`/`SDD` objects in a local SQLite file so inventory state survives restarts.
+
+    * New resources are written in bulk with `executemany`.
+    * Opening a store reads nothing but the row count: objects are hydrated lazily, one page of rows at a time, the first time an id is accessed.
+    * The store subscribes to every resource it hands out or saves, so `flush` only writes the `total`/`allocated` of resources
+      changed since the last flush (by `claim`, `freeup`, `died`, `purchased` or `allocate`/`release`).
+
+    **Methods:**
+
+    * `__init__(self, path: str, page_size: int = 1024)`: Opens (or creates) the store.
+    * `add(self, resources) -> range`: Saves new resources and returns their ids.
+    * `__getitem__(self, resource_id: int) -> Resource`: Returns the resource with that id, hydrating its page if needed.
+    * `__iter__(self)`: Yields every resource in id order, page by page.
+    * `id_of(self, resource: Resource) -> int`: The id of a resource that was saved or loaded by this store.
+    * `flush(self) -> int`: Writes the dirty resources and commits. Returns how many rows were written.
+    * `close(self) -> None`: Flushes and closes the database.
+    * `dirty (self) -> int`: Number of resources waiting for a flush. (property)
+    * `loaded (self) -> int`: Number of resources hydrated so far. (property)
+
+    **Notes:**
+
+    * Changes made through the `total`/`allocated` setters are not tracked, they do not notify subscribers.
+
+    **Raises:**
+
+    * `KeyError`: If an id is not in the store.
+    * `ValueError`: If a resource is added twice.
+    """
+
+    def __init__(self, path: str, page_size: int = 1024) -> None:
+        self._path = path
+        self._page_size = page_size
+        self._connection = sqlite3.connect(path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.execute(_SCHEMA)
+        self._connection.commit()
+
+        self._next_id = self._connection.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM resources").fetchone()[0]
+        self._count = self._connection.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+        self._loaded = {}
+        self._ids = {}
+        self._dirty = {}
+
+    def _track(self, resource_id: int, resource: Resource) -> None:
+        self._loaded[resource_id] = resource
+        self._ids[resource] = resource_id
+        resource.subscribe(self._resource_changed)
+
+    def _resource_changed(self, resource, event, n):
+        self._dirty[resource] = None
+
+    def add(self, resources) -> range:
+        resources = list(resources)
+        for resource in resources:
+            if resource in self._ids:
+                raise ValueError(f"{resource} is already in the store")
+
+        first = self._next_id
+        self._connection.executemany(f"INSERT INTO resources ({_COLUMNS}) VALUES ({', '.join('?' * 13)})",
+                                     (to_row(resource_id, r) for resource_id, r in enumerate(resources, first)))
+        self._connection.commit()
+
+        for resource_id, resource in enumerate(resources, first):
+            self._track(resource_id, resource)
+        self._next_id += len(resources)
+        self._count += len(resources)
+
+        return range(first, self._next_id)
+
+    def _load_page(self, first_id: int) -> None:
+        rows = self._connection.execute(f"SELECT {_COLUMNS} FROM resources WHERE id >= ? AND id < ? ORDER BY id",
+                                        (first_id, first_id + self._page_size)).fetchall()
+        for row in rows:
+            if row[0] not in self._loaded:
+                self._track(row[0], from_row(row))
+
+    def __getitem__(self, resource_id: int) -> Resource:
+        resource = self._loaded.get(resource_id)
+        if resource is None:
+            self._load_page(resource_id - (resource_id - 1) % self._page_size)
+            resource = self._loaded.get(resource_id)
+            if resource is None:
+                raise KeyError(resource_id)
+        return resource
+
+    def __iter__(self):
+        for first_id in range(1, self._next_id, self._page_size):
+            self._load_page(first_id)
+            for resource_id in range(first_id, min(first_id + self._page_size, self._next_id)):
+                resource = self._loaded.get(resource_id)
+                if resource is not None:
+                    yield resource
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, resource_id):
+        try:
+            self[resource_id]
+        except KeyError:
+            return False
+        return True
+
+    def id_of(self, resource: Resource) -> int:
+        return self._ids[resource]
+
+    def flush(self) -> int:
+        if not self._dirty:
+            return 0
+        ids = self._ids
+        self._connection.executemany("UPDATE resources SET total = ?, allocated = ? WHERE id = ?",
+                                     ((r.total, r.allocated, ids[r]) for r in self._dirty))
+        self._connection.commit()
+        written = len(self._dirty)
+        self._dirty.clear()
+        return written
+
+    @property
+    def dirty(self):
+        return len(self._dirty)
+
+    @property
+    def loaded(self):
+        return len(self._loaded)
+
+    def close(self) -> None:
+        self.flush()
+        for resource in self._ids:
+            resource.unsubscribe(self._resource_changed)
+        self._connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"SQLiteInventoryStore(path='{self._path}', resources={self._count}, loaded={len(self._loaded)})"
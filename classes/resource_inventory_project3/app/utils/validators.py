@@ -54,4 +54,111 @@ def validate_integer(
     return True
 
 
-    
\ No newline at end of file
+def compile_integer_validator(arg_name: str, min_value: int = None, max_value: int = None):
+    """
+        Builds a validator specialized for one field, equivalent to `validate_integer(arg_name, value, min_value, max_value)`.
+
+        The bounds and error messages are fixed when the validator is built, so each call only does the
+        checks that apply to that field (no `None` tests on the bounds). Build it once, e.g. as a class attribute.
+
+        **Args:**
+
+        * `arg_name (str)`: The name used in the error messages.
+        * `min_value (int, optional)`: The minimum allowed value (inclusive). Defaults to None.
+        * `max_value (int, optional)`: The maximum allowed value (inclusive). Defaults to None.
+
+        **Returns:**
+
+        * A function `validator(arg_value) -> True` raising the same `TypeError`/`ValueError` as `validate_integer`.
+
+        **Example:**
+
+        ```python
+        validate_cores = compile_integer_validator("cores", 2, 64)
+        validate_cores(8)    # True
+        validate_cores(128)  # ValueError: cores can not be greather than 64
+        ```
+    """
+    type_error = f"{arg_name} must be an integer"
+    min_error = f"{arg_name} can not be less than {min_value}"
+    max_error = f"{arg_name} can not be greather than {max_value}"
+
+    if min_value is None and max_value is None:
+        def validator(arg_value):
+            if not isinstance(arg_value, int):
+                raise TypeError(type_error)
+            return True
+
+    elif max_value is None:
+        def validator(arg_value):
+            if not isinstance(arg_value, int):
+                raise TypeError(type_error)
+            if arg_value < min_value:
+                raise ValueError(min_error)
+            return True
+
+    elif min_value is None:
+        def validator(arg_value):
+            if not isinstance(arg_value, int):
+                raise TypeError(type_error)
+            if arg_value > max_value:
+                raise ValueError(max_error)
+            return True
+
+    else:
+        def validator(arg_value):
+            if not isinstance(arg_value, int):
+                raise TypeError(type_error)
+            if arg_value < min_value:
+                raise ValueError(min_error)
+            if arg_value > max_value:
+                raise ValueError(max_error)
+            return True
+
+    validator.__name__ = f"validate_{arg_name}"
+    return validator
+
+
+def validate_many(arg_name: str, values, min_value: int = None, max_value: int = None, rows=None) -> bool:
+    """
+        Validates a whole column of values (e.g. during a bulk load) with the rules of `validate_integer`.
+
+        The checks run over the column with builtins (`map`, `min`, `max`) instead of one Python call per value;
+        the position of the offending value is only searched for once a check has failed.
+
+        **Args:**
+
+        * `arg_name (str)`: The name of the column being validated.
+        * `values (sequence)`: The values to validate (a list, tuple or `array`).
+        * `min_value (int, optional)`: The minimum allowed value (inclusive). Defaults to None.
+        * `max_value (int, optional)`: The maximum allowed value (inclusive). Defaults to None.
+        * `rows (sequence, optional)`: The row number to report for each position (e.g. the row in the file the column
+          was read from). Defaults to the position itself.
+
+        **Raises:**
+
+        * `TypeError`: If a value is not an integer. The message includes its row.
+        * `ValueError`: If a value is outside the specified range. The message includes its row.
+
+        **Returns:**
+
+        * True
+    """
+    if not values:
+        return True
+
+    rows = range(len(values)) if rows is None else rows
+
+    if not all(issubclass(t, int) for t in set(map(type, values))):
+        row = next(row for row, value in zip(rows, values) if not isinstance(value, int))
+        raise TypeError(f"{arg_name} at row {row} must be an integer")
+
+    if min_value is not None and min(values) < min_value:
+        row = next(row for row, value in zip(rows, values) if value < min_value)
+        raise ValueError(f"{arg_name} at row {row} can not be less than {min_value}")
+
+    if max_value is not None and max(values) > max_value:
+        row = next(row for row, value in zip(rows, values) if value > max_value)
+        raise ValueError(f"{arg_name} at row {row} can not be greather than {max_value}")
+
+    return True
@@ -0,0 +1,51 @@
+"""
+Benchmark of allocate/release against a loop of Resource.claim/freeup
+command line: python -m benchmarks.bench_allocation -n 100000 (this should be executed on the root directory)
+"""
+
+import argparse
+import time
+
+from app.models import inventory as i
+from app.models.allocation import allocate, release
+
+
+def build_parts():
+    return [
+        i.CPU("Ryzen 7 2700", "AMD", 10 ** 9, 0, 8, "AM4", 65),
+        i.SDD("970 EVO", "Samsung", 10 ** 9, 0, 500, "PCIe NVMe 3.0 x4"),
+        i.HDD("Barracuda", "Seagate", 10 ** 9, 0, 2000, '3.5"', 5000),
+    ]
+
+
+def claim_loop(n):
+    cpu, ssd, hdd = build_parts()
+    bom = [(cpu, 1), (ssd, 1), (hdd, 2)]
+    start = time.perf_counter()
+    for _ in range(n):
+        for resource, quantity in bom:
+            resource.claim(quantity)
+        for resource, quantity in bom:
+            resource.freeup(quantity)
+    return time.perf_counter() - start
+
+
+def atomic(n):
+    cpu, ssd, hdd = build_parts()
+    bom = [(cpu, 1), (ssd, 1), (hdd, 2)]
+    start = time.perf_counter()
+    for _ in range(n):
+        release(allocate(bom))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--builds", type=int, default=100000, help="Number of builds to claim and release")
+    args = parser.parse_args()
+
+    loop_elapsed = claim_loop(args.builds)
+    atomic_elapsed = atomic(args.builds)
+
+    print(f"claim loop : {args.builds / loop_elapsed:,.0f} builds/s (no rollback)")
+    print(f"allocate   : {args.builds / atomic_elapsed:,.0f} builds/s (all or nothing)")
@@ -0,0 +1,68 @@
+"""
+64 threads claiming and freeing a few hot SKUs: unguarded Resource.claim against ConcurrentInventory
+command line: python -m benchmarks.bench_contention -t 64 -s 4 (this should be executed on the root directory)
+"""
+
+import argparse
+import sys
+import threading
+import time
+
+from app.models import inventory as i
+from app.models.concurrent import ConcurrentInventory
+
+
+def run(label, threads, hot, operations, claim, freeup):
+    overshoots = []
+
+    def worker():
+        for n in range(operations):
+            resource = hot[n % len(hot)]
+            try:
+                if claim(resource) is False:
+                    continue
+            except ValueError:
+                continue
+            if resource.allocated > resource.total:
+                overshoots.append(resource)
+            freeup(resource)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+
+    consistent = all(0 <= r.allocated <= r.total for r in hot)
+    print(f"{label:<18}: {threads * operations / elapsed:12,.0f} ops/s, "
+          f"overshoots seen={len(overshoots)}, final counters valid={consistent}")
+
+
+def unguarded_freeup(resource):
+    try:
+        resource.freeup(1)
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-t", "--threads", type=int, default=64, help="Number of threads")
+    parser.add_argument("-s", "--skus", type=int, default=4, help="Number of hot SKUs")
+    parser.add_argument("-n", "--operations", type=int, default=5000, help="Claims per thread")
+    parser.add_argument("--switch-interval", type=float, default=1e-5, help="sys.setswitchinterval, smaller provokes more races")
+    args = parser.parse_args()
+
+    sys.setswitchinterval(args.switch_interval)
+    inventory = ConcurrentInventory()
+
+    def hot():
+        return [i.Resource(f"hot {n}", "Acme", args.threads // 2, 0) for n in range(args.skus)]
+
+    run("unguarded", args.threads, hot(), args.operations, lambda r: r.claim(1), unguarded_freeup)
+    run("locked", args.threads, hot(), args.operations,
+        lambda r: inventory.try_claim(r, 1), lambda r: inventory.freeup(r, 1))
+    run("optimistic (CAS)", args.threads, hot(), args.operations,
+        lambda r: inventory.claim_optimistic(r, 1), lambda r: inventory.freeup(r, 1))
@@ -0,0 +1,45 @@
+"""
+Recording, replaying and compacting inventory events
+command line: python -m benchmarks.bench_event_log -n 1000000 (this should be executed on the root directory)
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from app.models import inventory as i
+from app.persistence.event_log import EventLog
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<24}: {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--events", type=int, default=1_000_000, help="Number of claim/freeup events")
+    parser.add_argument("-r", "--resources", type=int, default=1000, help="Number of resources")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        resources = [i.CPU(f"Ryzen {n}", "AMD", 10, 0, 8, "AM4", 65) for n in range(args.resources)]
+
+        with EventLog(os.path.join(directory, "events.log")) as log:
+            for resource in resources:
+                log.track(resource)
+
+            def record():
+                for n in range(args.events // 2):
+                    resource = resources[n % args.resources]
+                    resource.claim(1)
+                    resource.freeup(1)
+
+            timed(f"record {args.events:,} events", record)
+            timed("commit", log.commit)
+            timed("replay (full history)", log.replay)
+            timed("compact", log.compact)
+            timed("replay (compacted)", log.replay)
@@ -0,0 +1,69 @@
+"""
+Importing a generated hardware catalog chunk by chunk, reporting rows/sec and peak memory
+command line: python -m benchmarks.bench_import -n 5000000 --format csv (this should be executed on the root directory)
+"""
+
+import argparse
+import csv
+import json
+import os
+import resource
+import tempfile
+import time
+
+from app.importers.catalog import import_catalog, iter_catalog
+
+FIELDS = ["category", "name", "manufacturer", "total", "allocated", "capacity_gb", "cores", "socket",
+          "power_watts", "size", "rpm", "interface"]
+
+
+def make_record(n):
+    if n % 3 == 0:
+        return {"category": "cpu", "name": f"Ryzen {n % 100}", "manufacturer": "AMD", "total": 10, "allocated": n % 10,
+                "cores": 8, "socket": "AM4", "power_watts": 65}
+    if n % 3 == 1:
+        return {"category": "hdd", "name": f"Barracuda {n % 100}", "manufacturer": "Seagate", "total": 10,
+                "allocated": n % 10, "capacity_gb": 2000, "size": '3.5"', "rpm": 5000}
+    return {"category": "sdd", "name": f"970 EVO {n % 100}", "manufacturer": "Samsung", "total": 10,
+            "allocated": n % 10, "capacity_gb": 500, "interface": "PCIe NVMe 3.0 x4"}
+
+
+def write_catalog(path, rows, fmt):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        if fmt == "csv":
+            writer = csv.DictWriter(f, FIELDS)
+            writer.writeheader()
+            writer.writerows(make_record(n) for n in range(rows))
+        else:
+            f.writelines(json.dumps(make_record(n)) + "\n" for n in range(rows))
+
+
+def peak_mib():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--rows", type=int, default=5_000_000, help="Catalog rows")
+    parser.add_argument("-c", "--chunk-size", type=int, default=50_000, help="Records per chunk")
+    parser.add_argument("--format", choices=("csv", "jsonl"), default="csv")
+    parser.add_argument("--objects", action="store_true", help="Stream Resource objects instead of filling a ResourceTable")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, f"catalog.{args.format}")
+        write_catalog(path, args.rows, args.format)
+        print(f"catalog      : {os.path.getsize(path) / 2 ** 20:,.1f} MiB, {args.rows:,} rows")
+        before = peak_mib()
+
+        if args.objects:
+            start = time.perf_counter()
+            rows = sum(len(chunk) for chunk in iter_catalog(path, args.chunk_size))
+            seconds = time.perf_counter() - start
+        else:
+            table, report = import_catalog(path, chunk_size=args.chunk_size)
+            rows, seconds = report.rows, report.seconds
+            print(f"table        : {table.nbytes / 2 ** 20:,.1f} MiB of columns")
+
+        print(f"rows/sec     : {rows / seconds:,.0f} ({seconds:.2f}s)")
+        print(f"peak RSS     : {peak_mib():,.1f} MiB (before import {before:,.1f} MiB)")
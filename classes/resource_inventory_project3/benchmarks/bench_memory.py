@@ -0,0 +1,36 @@
+"""
+Memory used per million resources: slotted objects against a ResourceTable
+command line: python -m benchmarks.bench_memory -n 1000000 (this should be executed on the root directory)
+"""
+
+import argparse
+import tracemalloc
+
+from app.models import inventory as i
+from app.models.table import ResourceTable
+
+
+def make_cpu(n):
+    return i.CPU(f"Ryzen {n % 100}", "AMD", 10, n % 10, 8, "AM4", 65)
+
+
+def measure(build):
+    tracemalloc.start()
+    kept = build()
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return used, kept
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--records", type=int, default=1_000_000, help="Number of resources")
+    args = parser.parse_args()
+
+    objects_bytes, _ = measure(lambda: [make_cpu(n) for n in range(args.records)])
+    table_bytes, table = measure(lambda: ResourceTable(make_cpu(n) for n in range(args.records)))
+
+    scale = 1_000_000 / args.records / 2 ** 20
+    print(f"objects : {objects_bytes * scale:,.1f} MiB per million")
+    print(f"table   : {table_bytes * scale:,.1f} MiB per million")
+    print(f"saved   : {(objects_bytes - table_bytes) * scale:,.1f} MiB per million")
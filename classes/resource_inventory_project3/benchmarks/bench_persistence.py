@@ -0,0 +1,51 @@
+"""
+Saving, reopening and flushing a SQLiteInventoryStore
+command line: python -m benchmarks.bench_persistence -n 1000000 (this should be executed on the root directory)
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from app.models import inventory as i
+from app.persistence.sqlite_store import SQLiteInventoryStore
+
+
+def make_resource(n):
+    if n % 3 == 0:
+        return i.CPU(f"Ryzen {n % 100}", "AMD", 10, n % 10, 8, "AM4", 65)
+    if n % 3 == 1:
+        return i.HDD(f"Barracuda {n % 100}", "Seagate", 10, n % 10, 2000, '3.5"', 5000)
+    return i.SDD(f"970 EVO {n % 100}", "Samsung", 10, n % 10, 500, "PCIe NVMe 3.0 x4")
+
+
+def timed(label, fn):
+    start = time.perf_counter()
+    result = fn()
+    print(f"{label:<28}: {time.perf_counter() - start:8.3f}s")
+    return result
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", "--records", type=int, default=1_000_000, help="Number of resources")
+    parser.add_argument("--dirty", type=float, default=0.01, help="Fraction of resources changed before the flush")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "inventory.db")
+        resources = [make_resource(n) for n in range(args.records)]
+
+        with SQLiteInventoryStore(path) as store:
+            timed("add (executemany)", lambda: store.add(resources))
+        del resources
+
+        store = timed("reopen", lambda: SQLiteInventoryStore(path))
+        timed("first access", lambda: store[args.records // 2])
+        changed = range(1, args.records + 1, max(1, int(1 / args.dirty)))
+        for resource_id in changed:
+            store[resource_id].purchased(1)
+        timed(f"flush ({len(changed):,} dirty)", store.flush)
+        timed("iterate (hydrate all)", lambda: sum(1 for _ in store))
+        store.close()
@@ -0,0 +1,90 @@
+"""
+**Test Suite for the `LowStockWatcher` Class (from `app.models.alerts`):**
+
+* `test_crossings`: `"low"` fires once when `available` drops below the threshold and `"restocked"` once when it recovers.
+* `test_watch_below_threshold`: Watching a resource that is already low fires right away; changing the threshold re-evaluates it.
+* `test_nearest`: Resources closest to their threshold come first and follow updates.
+* `test_unwatch`: An unwatched resource stops firing.
+* `test_async_loop`: With an event loop, plain and coroutine callbacks run on the loop.
+"""
+
+import asyncio
+
+import pytest
+
+from app.models import inventory as i
+from app.models.alerts import LowStockWatcher
+
+
+@pytest.fixture
+def resources():
+    return [i.Resource(f"r{n}", "Acme", 10, 0) for n in range(4)]
+
+
+class Test_LowStockWatcher:
+    def test_crossings(self, resources):
+        events = []
+        watcher = LowStockWatcher(lambda r, crossing, available: events.append((r.name, crossing, available)))
+        watcher.watch(resources[0], 3)
+
+        resources[0].claim(7)
+        assert events == []
+        resources[0].claim(1)
+        resources[0].claim(1)
+        resources[0].died(1)
+        assert events == [("r0", "low", 2)]
+        assert watcher.low() == [resources[0]]
+
+        resources[0].purchased(2)
+        assert events[-1] == ("r0", "restocked", 3)
+        assert watcher.low() == []
+
+    def test_watch_below_threshold(self, resources):
+        events = []
+        watcher = LowStockWatcher(lambda r, crossing, available: events.append(crossing))
+        resources[1].claim(9)
+        watcher.watch(resources[1], 2)
+        assert events == ["low"]
+        watcher.watch(resources[1], 1)
+        assert events == ["low", "restocked"]
+        with pytest.raises(ValueError):
+            watcher.watch(resources[2], -1)
+
+    def test_nearest(self, resources):
+        watcher = LowStockWatcher()
+        for resource, threshold in zip(resources, (1, 5, 8, 3)):
+            watcher.watch(resource, threshold)
+        assert [(r.name, m) for r, m in watcher.nearest(2)] == [("r2", 2), ("r1", 5)]
+
+        resources[3].claim(6)
+        assert [(r.name, m) for r, m in watcher.nearest(2)] == [("r3", 1), ("r2", 2)]
+        assert len(watcher.nearest(10)) == 4
+
+    def test_unwatch(self, resources):
+        events = []
+        watcher = LowStockWatcher(lambda *args: events.append(args))
+        watcher.watch(resources[0], 5)
+        watcher.unwatch(resources[0])
+        resources[0].claim(10)
+        assert events == []
+        assert resources[0] not in watcher
+        assert watcher.nearest(1) == []
+        with pytest.raises(ValueError):
+            watcher.unwatch(resources[0])
+
+    def test_async_loop(self, resources):
+        async def main():
+            loop = asyncio.get_running_loop()
+            plain, coroutine = [], []
+
+            async def on_crossing(r, crossing, available):
+                coroutine.append(crossing)
+
+            LowStockWatcher(lambda r, crossing, available: plain.append(crossing), loop).watch(resources[0], 5)
+            LowStockWatcher(on_crossing, loop).watch(resources[0], 5)
+            resources[0].claim(6)
+            assert plain == coroutine == []
+            await asyncio.sleep(0.01)
+            return plain, coroutine
+
+        assert asyncio.run(main()) == (["low"], ["low"])
@@ -0,0 +1,67 @@
+"""
+**Test Suite for `allocate` / `release` (from `app.models.allocation`):**
+
+* `test_allocate_and_release`: A whole bill of materials is claimed and then freed.
+* `test_allocate_is_all_or_nothing`: When one line can not be claimed, no line is claimed.
+* `test_invalid_lines`: Type and value errors are raised before anything changes.
+* `test_duplicate_lines`: Repeated resources are added up before checking availability.
+
+**Fixtures:**
+
+* `parts`: A CPU, an SSD and an HDD.
+"""
+
+import pytest
+
+from app.models import inventory as i
+from app.models.allocation import allocate, release
+
+
+@pytest.fixture
+def parts():
+    return (i.CPU("Ryzen 7 2700", "AMD", 5, 0, 8, "AM4", 65),
+            i.SDD("970 EVO", "Samsung", 4, 1, 500, "PCIe NVMe 3.0 x4"),
+            i.HDD("Barracuda", "Seagate", 2, 1, 2000, '3.5"', 5000))
+
+
+class Test_allocation:
+    def test_allocate_and_release(self, parts):
+        cpu, ssd, hdd = parts
+        build = allocate({cpu: 1, ssd: 1, hdd: 1})
+
+        assert (cpu.allocated, ssd.allocated, hdd.allocated) == (1, 2, 2)
+
+        release(build)
+        assert (cpu.allocated, ssd.allocated, hdd.allocated) == (0, 1, 1)
+
+    def test_allocate_is_all_or_nothing(self, parts):
+        cpu, ssd, hdd = parts
+        with pytest.raises(ValueError):
+            allocate([(cpu, 1), (ssd, 1), (hdd, 2)])
+
+        assert (cpu.allocated, ssd.allocated, hdd.allocated) == (0, 1, 1)
+
+    def test_release_is_all_or_nothing(self, parts):
+        cpu, ssd, hdd = parts
+        with pytest.raises(ValueError):
+            release([(ssd, 1), (cpu, 1)])
+
+        assert ssd.allocated == 1
+
+    @pytest.mark.parametrize("quantity, exception", [(1.5, TypeError), (0, ValueError), (-1, ValueError)])
+    def test_invalid_lines(self, parts, quantity, exception):
+        cpu, ssd, _ = parts
+        with pytest.raises(exception):
+            allocate([(cpu, 1), (ssd, quantity)])
+        assert cpu.allocated == 0
+
+    def test_not_a_resource(self):
+        with pytest.raises(TypeError):
+            allocate([("cpu", 1)])
+
+    def test_duplicate_lines(self, parts):
+        cpu, _, _ = parts
+        with pytest.raises(ValueError):
+            allocate([(cpu, 3), (cpu, 3)])
+        assert allocate([(cpu, 2), (cpu, 3)]) == {cpu: 5}
+        assert cpu.available == 0
@@ -0,0 +1,87 @@
+"""
+**Test Suite for the catalog importer (from `app.importers.catalog`):**
+
+* `test_import_csv`: A CSV catalog lands in a `ResourceTable` with the right classes and values, across several chunks.
+* `test_import_jsonl`: The same catalog as JSON lines gives the same table.
+* `test_iter_catalog`: Objects come back per chunk, in catalog order.
+* `test_invalid_row`: Errors name the catalog row, not the row inside the chunk.
+* `test_unknown_format`: Only csv and jsonl are accepted.
+"""
+
+import csv
+import json
+
+import pytest
+
+from app.importers.catalog import import_catalog, iter_catalog
+from app.models import inventory as i
+
+RECORDS = [
+    {"category": "cpu", "name": "Ryzen 7 2700", "manufacturer": "AMD", "total": 5, "allocated": 1,
+     "cores": 8, "socket": "AM4", "power_watts": 65},
+    {"category": "hdd", "name": "Barracuda", "manufacturer": "Seagate", "total": 10, "allocated": 0,
+     "capacity_gb": 2000, "size": '3.5"', "rpm": 5000},
+    {"category": "SDD", "name": "970 EVO", "manufacturer": "Samsung", "total": 4, "allocated": 1,
+     "capacity_gb": 500, "interface": "PCIe NVMe 3.0 x4"},
+    {"category": "cpu", "name": "Core i9-9900K", "manufacturer": "Intel", "total": 3, "allocated": 3,
+     "cores": 8, "socket": "LGA1151", "power_watts": 95},
+    {"category": "resource", "name": "Cable", "manufacturer": "Acme", "total": 100, "allocated": 7},
+]
+FIELDS = ["category", "name", "manufacturer", "total", "allocated", "capacity_gb", "cores", "socket",
+          "power_watts", "size", "rpm", "interface"]
+
+
+def write_csv(path, records):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    return str(path)
+
+
+def write_jsonl(path, records):
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(json.dumps(record) + "\n" for record in records)
+    return str(path)
+
+
+class Test_catalog:
+    def test_import_csv(self, tmp_path):
+        table, report = import_catalog(write_csv(tmp_path / "catalog.csv", RECORDS), chunk_size=2)
+        assert (report.rows, report.by_category) == (5, {"cpu": 2, "hdd": 1, "sdd": 1, "resource": 1})
+        assert report.rows_per_second > 0
+        assert sorted(table.column("category")) == sorted(r["category"].lower() for r in RECORDS)
+        by_name = {view.name: view for view in table}
+        assert by_name["Barracuda"].rpm == 5000
+        assert by_name["Core i9-9900K"].available == 0
+        assert by_name["970 EVO"].interface == "PCIe NVMe 3.0 x4"
+
+    def test_import_jsonl(self, tmp_path):
+        csv_table, _ = import_catalog(write_csv(tmp_path / "catalog.csv", RECORDS), chunk_size=2)
+        jsonl_table, _ = import_catalog(write_jsonl(tmp_path / "catalog.jsonl", RECORDS), chunk_size=2)
+        assert [repr(view) for view in jsonl_table] == [repr(view) for view in csv_table]
+
+    def test_iter_catalog(self, tmp_path):
+        chunks = list(iter_catalog(write_jsonl(tmp_path / "catalog.jsonl", RECORDS), chunk_size=3))
+        assert [len(chunk) for chunk in chunks] == [3, 2]
+        resources = [r for chunk in chunks for r in chunk]
+        assert [type(r) for r in resources] == [i.CPU, i.HDD, i.SDD, i.CPU, i.Resource]
+        assert [r.name for r in resources] == [r["name"] for r in RECORDS]
+
+    @pytest.mark.parametrize("change, exception, message", [
+        ({"rpm": 9000}, ValueError, "rpm at row 6"),
+        ({"total": "lots"}, TypeError, "total at row 6"),
+        ({"category": "gpu"}, ValueError, "row 6"),
+        ({"capacity_gb": 2 ** 63}, ValueError, "capacity_gb at row 6"),
+    ])
+    def test_invalid_row(self, tmp_path, change, exception, message):
+        records = RECORDS + [RECORDS[0], {**RECORDS[1], **change}]
+        with pytest.raises(exception) as ex:
+            import_catalog(write_csv(tmp_path / "catalog.csv", records), chunk_size=4)
+        assert message in str(ex.value)
+
+    def test_unknown_format(self, tmp_path):
+        path = tmp_path / "catalog.xml"
+        path.write_text("")
+        with pytest.raises(ValueError):
+            import_catalog(str(path))
@@ -0,0 +1,99 @@
+"""
+**Test Suite for the `ConcurrentInventory` Class (from `app.models.concurrent`):**
+
+* `test_claim_checks_available`: `Resource.claim` refuses to go past `total`.
+* `test_hammered_claims_never_exceed_total`: Many threads claiming the same resources (locked, `try_claim` and optimistic) never go past `total`.
+* `test_try_claim`: Returns False without claiming when not enough is available.
+* `test_allocate_under_contention`: Concurrent bills of materials over shared resources neither deadlock nor overshoot.
+"""
+
+import sys
+import threading
+
+import pytest
+
+from app.models import inventory as i
+from app.models.concurrent import ConcurrentInventory
+
+
+@pytest.fixture(autouse=True)
+def frequent_switches():
+    #switching threads very often makes races show up in a short test
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def hammer(threads, target):
+    workers = [threading.Thread(target=target) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+class Test_ConcurrentInventory:
+    def test_claim_checks_available(self):
+        resource = i.Resource("Cable", "Acme", 5, 3)
+        with pytest.raises(ValueError):
+            resource.claim(3)
+        resource.claim(2)
+        assert resource.allocated == 5
+
+    @pytest.mark.parametrize("method", ["claim", "try_claim", "claim_optimistic"])
+    def test_hammered_claims_never_exceed_total(self, method):
+        inventory = ConcurrentInventory(stripes=4)
+        hot = [i.Resource(f"hot {n}", "Acme", 500, 0) for n in range(3)]
+        claimed = []
+
+        def worker():
+            count = 0
+            for n in range(400):
+                resource = hot[n % len(hot)]
+                try:
+                    if getattr(inventory, method)(resource, 1) is not False:
+                        count += 1
+                except ValueError:
+                    pass
+            claimed.append(count)
+
+        hammer(16, worker)
+
+        assert all(r.allocated == r.total == 500 for r in hot)
+        assert sum(claimed) == 1500
+
+    def test_try_claim(self):
+        inventory = ConcurrentInventory()
+        resource = i.Resource("Cable", "Acme", 5, 4)
+        assert inventory.try_claim(resource, 2) is False
+        assert inventory.claim_optimistic(resource, 2) is False
+        assert resource.allocated == 4
+        with pytest.raises(ValueError):
+            inventory.try_claim(resource, 0)
+
+    def test_allocate_under_contention(self):
+        inventory = ConcurrentInventory(stripes=8)
+        cpu = i.CPU("Ryzen 7 2700", "AMD", 100, 0, 8, "AM4", 65)
+        hdd = i.HDD("Barracuda", "Seagate", 300, 0, 2000, '3.5"', 5000)
+        builds = []
+
+        def worker(bill):
+            for _ in range(50):
+                try:
+                    builds.append(inventory.allocate(bill))
+                except ValueError:
+                    pass
+
+        workers = [threading.Thread(target=worker, args=(bill,))
+                   for bill in [{cpu: 1, hdd: 2}, [(hdd, 1), (cpu, 1), (hdd, 1)]] * 8]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        assert len(builds) == 100
+        assert (cpu.allocated, hdd.allocated) == (100, 200)
+        for bill in builds:
+            inventory.release(bill)
+        assert (cpu.allocated, hdd.allocated) == (0, 0)
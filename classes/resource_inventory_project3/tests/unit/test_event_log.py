@@ -0,0 +1,127 @@
+"""
+**Test Suite for the `EventLog` Class (from `app.persistence.event_log`):**
+
+* `test_replay_latest`: Replaying the whole log rebuilds every subclass with its current counters.
+* `test_replay_point_in_time`: Replaying at a past instant ignores later events and later resources.
+* `test_restore_and_continue`: After reopening, restored resources keep being recorded under their ids.
+* `test_compact`: Compaction removes records, keeps the current state and refuses to replay compacted history.
+* `test_auto_compact`: `compact_every` compacts on commit.
+* `test_track_twice`: Tracking a resource twice raises `ValueError`.
+"""
+
+import time
+
+import pytest
+
+from app.models import inventory as i
+from app.models.allocation import allocate
+from app.persistence.event_log import EventLog
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "events.log")
+
+
+def make_cpu():
+    return i.CPU("Ryzen 7 2700", "AMD", 5, 0, 8, "AM4", 65)
+
+
+def make_ssd():
+    return i.SDD("970 EVO", "Samsung", 4, 1, 500, "PCIe NVMe 3.0 x4")
+
+
+class Test_EventLog:
+    def test_replay_latest(self, path):
+        cpu, ssd = make_cpu(), make_ssd()
+        with EventLog(path, commit_every=2) as log:
+            assert log.track(cpu) == 1
+            assert log.track(ssd) == 2
+            cpu.claim(3)
+            cpu.freeup(1)
+            cpu.died(1)
+            ssd.purchased(6)
+            allocate({cpu: 1, ssd: 2})
+
+        with EventLog(path) as log:
+            replayed = log.replay()
+        assert repr(replayed[1]) == repr(cpu)
+        assert (replayed[1].total, replayed[1].allocated) == (4, 2)
+        assert isinstance(replayed[2], i.SDD)
+        assert (replayed[2].total, replayed[2].allocated, replayed[2].interface) == (10, 3, "PCIe NVMe 3.0 x4")
+
+    def test_replay_point_in_time(self, path):
+        cpu, ssd = make_cpu(), make_ssd()
+        with EventLog(path) as log:
+            log.track(cpu)
+            cpu.claim(2)
+            time.sleep(0.01)
+            before = time.time()
+            time.sleep(0.01)
+            cpu.claim(2)
+            log.track(ssd)
+
+            past = log.replay(at=before)
+            assert list(past) == [1]
+            assert past[1].allocated == 2
+            assert log.replay()[1].allocated == 4
+
+    def test_restore_and_continue(self, path):
+        cpu = make_cpu()
+        with EventLog(path) as log:
+            log.track(cpu)
+            cpu.claim(1)
+
+        with EventLog(path) as log:
+            restored = log.restore()
+            restored[1].claim(2)
+            assert log.track(make_ssd()) == 2
+
+        with EventLog(path) as log:
+            replayed = log.replay()
+        assert replayed[1].allocated == 3
+        assert replayed[2].name == "970 EVO"
+
+    def test_compact(self, path):
+        cpu, ssd = make_cpu(), make_ssd()
+        with EventLog(path) as log:
+            log.track(cpu)
+            log.track(ssd)
+            start = time.time()
+            for _ in range(50):
+                cpu.claim(1)
+                cpu.freeup(1)
+            ssd.claim(1)
+
+            assert len(log) == 103
+            assert log.compact() == 101
+            assert len(log) == 2
+            with pytest.raises(ValueError):
+                log.replay(at=start)
+
+            cpu.claim(4)
+            replayed = log.replay()
+            assert replayed[1].allocated == 4
+            assert replayed[2].allocated == 2
+            assert log.compact(until=start) == 0
+
+        with EventLog(path) as log:
+            assert len(log) == 3
+            assert log.replay()[1].allocated == 4
+
+    def test_auto_compact(self, path):
+        cpu = make_cpu()
+        with EventLog(path, commit_every=10, compact_every=20) as log:
+            log.track(cpu)
+            for _ in range(15):
+                cpu.claim(1)
+                cpu.freeup(1)
+            assert len(log) < 20
+            assert log.replay()[1].allocated == 0
+
+    def test_track_twice(self, path):
+        cpu = make_cpu()
+        with EventLog(path) as log:
+            log.track(cpu)
+            with pytest.raises(ValueError):
+                log.track(cpu)
@@ -0,0 +1,53 @@
+"""
+**Test Suite for the `FleetAnalytics` Class (from `app.analytics.fleet`):**
+
+* `test_aggregates`: Every aggregate matches the same computation done over the `Resource` objects.
+* `test_cache_invalidation`: Results are cached until a counter changes, then recomputed.
+"""
+
+import pytest
+
+from app.models import inventory as i
+from app.models.table import ResourceTable
+from app.analytics.fleet import FleetAnalytics
+
+
+@pytest.fixture
+def resources():
+    return [
+        i.CPU("Ryzen 7 2700", "AMD", 5, 1, 8, "AM4", 65),
+        i.CPU("Ryzen 5 3600", "AMD", 3, 3, 6, "AM4", 65),
+        i.CPU("Core i9-9900K", "Intel", 4, 2, 8, "LGA1151", 95),
+        i.HDD("Barracuda", "Seagate", 10, 4, 2000, '3.5"', 5000),
+        i.SDD("970 EVO", "Samsung", 4, 1, 500, "PCIe NVMe 3.0 x4"),
+    ]
+
+
+@pytest.fixture
+def table(resources):
+    return ResourceTable(resources)
+
+
+class Test_FleetAnalytics:
+    def test_aggregates(self, table, resources):
+        analytics = FleetAnalytics(table)
+        storage = [r for r in resources if isinstance(r, i.Storage)]
+        cpus = [r for r in resources if isinstance(r, i.CPU)]
+
+        assert analytics.total_free_storage_gb() == sum(r.available * r.capacity_gb for r in storage)
+        assert analytics.allocated_power_watts() == sum(r.allocated * r.power_watts for r in cpus)
+        assert analytics.free_cores_by_socket() == {"AM4": 32, "LGA1151": 16}
+        assert analytics.available_by_category() == {"cpu": 6, "hdd": 6, "sdd": 3}
+
+    def test_cache_invalidation(self, table, resources):
+        analytics = FleetAnalytics(table)
+        first = analytics.free_cores_by_socket()
+
+        assert analytics.free_cores_by_socket() is first
+
+        table[0].claim(4)
+        assert analytics.free_cores_by_socket() == {"AM4": 0, "LGA1151": 16}
+
+        table.append(i.CPU("Ryzen 9 5950X", "AMD", 2, 0, 16, "AM4", 105))
+        assert analytics.free_cores_by_socket()["AM4"] == 32
+        assert analytics.allocated_power_watts() == 5 * 65 + 3 * 65 + 2 * 95
@@ -67,4 +67,21 @@ class Test_resourcer():
         resource.claim(n)
 
         assert resource.total == original_total
-        assert resource.allocated == original_allocated + n
\ No newline at end of file
+        assert resource.allocated == original_allocated + n
+
+    def test_purchased(self, resource):
+        resource.purchased(3)
+
+        assert resource.total == 103
+        assert resource.allocated == 50
+
+    def test_subscribe(self, resource):
+        events = []
+        callback = lambda r, event, n: events.append((r, event, n))
+        resource.subscribe(callback)
+        resource.claim(2)
+        resource.freeup(1)
+        resource.unsubscribe(callback)
+        resource.claim(1)
+
+        assert events == [(resource, "claim", 2), (resource, "freeup", 1)]
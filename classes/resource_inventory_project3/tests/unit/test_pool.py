@@ -0,0 +1,95 @@
+"""
+**Test Suite for the `InventoryPool` Class (from `app.models.pool`):**
+
+* `test_find_by_index`: Filters on the hash indexes (category, manufacturer, socket, interface).
+* `test_find_available_is_incremental`: The `available > 0` index follows `claim`, `freeup`, `died` and `purchased`.
+* `test_find_by_capacity`: Capacity range queries, alone and combined with other filters.
+* `test_remove`: A removed resource disappears from every index and stops being tracked.
+* `test_extend`: Bulk adds sort the capacity index like one `add` at a time, also when a duplicate stops them half way.
+
+**Fixtures:**
+
+* `resources`: A few CPUs, HDDs and SSDs.
+* `pool`: An `InventoryPool` holding `resources`.
+"""
+
+import pytest
+
+from app.models import inventory as i
+from app.models.pool import InventoryPool
+
+
+@pytest.fixture
+def resources():
+    return {
+        "ryzen": i.CPU("Ryzen 7 2700", "AMD", 5, 0, 8, "AM4", 65),
+        "threadripper": i.CPU("Threadripper 2990WX", "AMD", 2, 2, 32, "sTR4", 250),
+        "intel": i.CPU("Core i9-9900K", "Intel", 3, 1, 8, "LGA1151", 95),
+        "barracuda": i.HDD("Barracuda", "Seagate", 10, 0, 2000, '3.5"', 5000),
+        "evo": i.SDD("970 EVO", "Samsung", 4, 1, 500, "PCIe NVMe 3.0 x4"),
+        "mx": i.SDD("MX500", "Crucial", 6, 6, 1000, "SATA III"),
+    }
+
+
+@pytest.fixture
+def pool(resources):
+    return InventoryPool(resources.values())
+
+
+class Test_InventoryPool:
+    def test_find_by_index(self, pool, resources):
+        assert pool.find(category="cpu", manufacturer="AMD") == [resources["ryzen"], resources["threadripper"]]
+        assert pool.find(socket="AM4") == [resources["ryzen"]]
+        assert pool.find(interface="SATA III") == [resources["mx"]]
+        assert pool.find(category="gpu") == []
+        assert len(pool.find()) == 6
+
+    def test_find_available_is_incremental(self, pool, resources):
+        assert pool.find(category="cpu", available=True) == [resources["ryzen"], resources["intel"]]
+        assert pool.find(category="sdd", available=False) == [resources["mx"]]
+
+        resources["ryzen"].claim(5)
+        resources["threadripper"].freeup(1)
+        resources["mx"].purchased(2)
+
+        assert pool.find(category="cpu", available=True) == [resources["threadripper"], resources["intel"]]
+        assert pool.find(category="sdd", available=True) == [resources["evo"], resources["mx"]]
+
+        resources["threadripper"].claim(1)
+        assert pool.find(category="cpu", available=True) == [resources["intel"]]
+
+        resources["ryzen"].died(2)
+        assert pool.find(category="cpu", available=True) == [resources["intel"]]
+
+    def test_find_by_capacity(self, pool, resources):
+        assert pool.find(min_capacity_gb=1000) == [resources["barracuda"], resources["mx"]]
+        assert pool.find(max_capacity_gb=600) == [resources["evo"]]
+        assert pool.find(category="sdd", min_capacity_gb=400, max_capacity_gb=1000) == [resources["evo"], resources["mx"]]
+        assert pool.find(manufacturer="AMD", max_capacity_gb=5000) == []
+
+    def test_remove(self, pool, resources):
+        pool.remove(resources["ryzen"])
+
+        assert resources["ryzen"] not in pool
+        assert pool.find(socket="AM4") == []
+        assert len(pool) == 5
+        with pytest.raises(ValueError):
+            pool.remove(resources["ryzen"])
+
+    def test_add_twice(self, pool, resources):
+        with pytest.raises(ValueError):
+            pool.add(resources["evo"])
+
+    def test_extend(self, resources):
+        one_by_one = InventoryPool()
+        for resource in resources.values():
+            one_by_one.add(resource)
+        bulk = InventoryPool()
+        bulk.add(resources["mx"])
+        extra = i.SDD("860 EVO", "Samsung", 1, 0, 250, "SATA III")
+        with pytest.raises(ValueError):
+            bulk.extend([resources["evo"], extra, resources["mx"], resources["barracuda"]])
+
+        assert bulk.find(min_capacity_gb=0) == [resources["mx"], resources["evo"], extra]
+        assert bulk.find(max_capacity_gb=300) == [extra]
+        assert InventoryPool(resources.values()).find(min_capacity_gb=0) == one_by_one.find(min_capacity_gb=0)
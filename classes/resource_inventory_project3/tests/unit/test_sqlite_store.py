@@ -0,0 +1,92 @@
+"""
+**Test Suite for the `SQLiteInventoryStore` Class (from `app.persistence.sqlite_store`):**
+
+* `test_round_trip`: Every subclass comes back with the same attributes after reopening the store.
+* `test_lazy_hydration`: Opening a store hydrates nothing, accessing an id hydrates only its page.
+* `test_flush_writes_only_dirty`: Only resources changed since the last flush are written.
+* `test_add_twice`: Adding a resource twice raises `ValueError`.
+* `test_unknown_id`: Unknown ids raise `KeyError`.
+"""
+
+import pytest
+
+from app.models import inventory as i
+from app.persistence.sqlite_store import SQLiteInventoryStore
+
+
+@pytest.fixture
+def resources():
+    return [
+        i.CPU("Ryzen 7 2700", "AMD", 5, 1, 8, "AM4", 65),
+        i.HDD("Barracuda", "Seagate", 10, 0, 2000, '3.5"', 5000),
+        i.SDD("970 EVO", "Samsung", 4, 1, 500, "PCIe NVMe 3.0 x4"),
+        i.Storage("Generic", "Acme", 3, 0, 250),
+        i.Resource("Cable", "Acme", 100, 7),
+    ]
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "inventory.db")
+
+
+class Test_SQLiteInventoryStore:
+    def test_round_trip(self, path, resources):
+        with SQLiteInventoryStore(path) as store:
+            ids = store.add(resources)
+        assert list(ids) == [1, 2, 3, 4, 5]
+
+        with SQLiteInventoryStore(path) as store:
+            assert len(store) == 5
+            loaded = list(store)
+        assert [type(r) for r in loaded] == [type(r) for r in resources]
+        assert [repr(r) for r in loaded] == [repr(r) for r in resources]
+        assert loaded[0].power_watts == 65
+        assert loaded[1].rpm == 5000
+        assert loaded[4].allocated == 7
+
+    def test_lazy_hydration(self, path):
+        with SQLiteInventoryStore(path) as store:
+            store.add(i.Resource(f"r{n}", "Acme", 1, 0) for n in range(10))
+
+        with SQLiteInventoryStore(path, page_size=4) as store:
+            assert store.loaded == 0
+            assert store[6].name == "r5"
+            assert store.loaded == 4
+            assert 7 in store
+            assert store.loaded == 4
+
+    def test_flush_writes_only_dirty(self, path, resources):
+        with SQLiteInventoryStore(path) as store:
+            store.add(resources)
+            assert store.flush() == 0
+            resources[0].claim(2)
+            resources[0].freeup(1)
+            resources[1].purchased(5)
+            assert store.dirty == 2
+            assert store.flush() == 2
+            assert store.dirty == 0
+
+        with SQLiteInventoryStore(path) as store:
+            assert store[1].allocated == 2
+            assert store[2].total == 15
+            store[2].died(0)
+            store[5].claim(3)
+
+        with SQLiteInventoryStore(path) as store:
+            assert store[5].allocated == 10
+
+    def test_add_twice(self, path, resources):
+        with SQLiteInventoryStore(path) as store:
+            store.add(resources[:1])
+            with pytest.raises(ValueError):
+                store.add(resources[:1])
+            assert len(store) == 1
+
+    def test_unknown_id(self, path, resources):
+        with SQLiteInventoryStore(path) as store:
+            store.add(resources)
+            with pytest.raises(KeyError):
+                store[42]
+            assert 42 not in store
+            assert store.id_of(resources[2]) == 3
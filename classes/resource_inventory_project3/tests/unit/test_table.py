@@ -0,0 +1,126 @@
+"""
+**Test Suite for the `ResourceTable` Class (from `app.models.table`):**
+
+* `test_views_match_objects`: Every view exposes the same attribute values as the object it was built from.
+* `test_view_mutations`: `claim`/`freeup`/`died`/`purchased` on a view write to the columns and bump `version`.
+* `test_view_validation`: Views raise the same exceptions as `Resource`.
+* `test_materialize`: A row can be turned back into a regular object.
+* `test_slots`: The resource classes carry no `__dict__`.
+* `test_load_columns`: Rows loaded from columns read like appended objects.
+* `test_load_columns_validation`: Invalid columns raise with the row and load nothing.
+* `test_load_columns_overflow`: Values beyond the 64 bit columns are rejected before any column grows.
+* `test_load_columns_rows`: Errors name the row given for each position.
+"""
+
+import pytest
+
+from app.models import inventory as i
+from app.models.table import ResourceTable, CPUView, HDDView, SDDView
+
+
+@pytest.fixture
+def resources():
+    return [
+        i.CPU("Ryzen 7 2700", "AMD", 5, 1, 8, "AM4", 65),
+        i.HDD("Barracuda", "Seagate", 10, 0, 2000, '3.5"', 5000),
+        i.SDD("970 EVO", "Samsung", 4, 1, 500, "PCIe NVMe 3.0 x4"),
+    ]
+
+
+@pytest.fixture
+def table(resources):
+    return ResourceTable(resources)
+
+
+ATTRIBUTES = {
+    CPUView: ("name", "manufacturer", "total", "allocated", "available", "category", "cores", "socket", "power_watts"),
+    HDDView: ("name", "manufacturer", "total", "allocated", "category", "capacity_gb", "size", "rpm"),
+    SDDView: ("name", "manufacturer", "total", "allocated", "category", "capacity_gb", "interface"),
+}
+
+
+class Test_ResourceTable:
+    def test_views_match_objects(self, table, resources):
+        assert len(table) == 3
+        for view, resource in zip(table, resources):
+            for attr in ATTRIBUTES[type(view)]:
+                assert getattr(view, attr) == getattr(resource, attr)
+            assert repr(view) == repr(resource)
+            assert str(view) == str(resource)
+
+    def test_view_mutations(self, table):
+        cpu = table[0]
+        version = table.version
+        cpu.claim(2)
+        cpu.freeup(1)
+        cpu.purchased(3)
+        cpu.died(1)
+
+        assert (cpu.total, cpu.allocated) == (7, 1)
+        assert table.version == version + 4
+
+    @pytest.mark.parametrize("method, value, exception", [("claim", 1.5, TypeError), ("claim", 0, ValueError),
+                                                         ("freeup", 5, ValueError), ("purchased", -1, ValueError)])
+    def test_view_validation(self, table, method, value, exception):
+        with pytest.raises(exception):
+            getattr(table[-1], method)(value)
+
+    def test_materialize(self, table, resources):
+        for row, resource in enumerate(resources):
+            rebuilt = table.materialize(row)
+            assert type(rebuilt) is type(resource)
+            assert repr(rebuilt) == repr(resource)
+
+    def test_index_error(self, table):
+        with pytest.raises(IndexError):
+            table[3]
+
+    def test_slots(self, resources):
+        for resource in resources:
+            assert not hasattr(resource, "__dict__")
+
+    def test_column(self, table):
+        assert list(table.column("total")) == [5, 10, 4]
+        assert table.column("category") == ["cpu", "hdd", "sdd"]
+        assert table.column("socket") == ["AM4", None, None]
+        with pytest.raises(ValueError):
+            table.column("kind")
+
+    def test_load_columns(self, table, resources):
+        rows = table.load_columns("hdd", {"name": ["Barracuda"], "manufacturer": ["Seagate"], "total": [10],
+                                          "allocated": [0], "capacity_gb": [2000], "size": ['3.5"'], "rpm": [5000],
+                                          "cores": [99]})
+        assert rows == range(3, 4)
+        assert repr(table[3]) == repr(resources[1])
+        assert table.column("cores")[3] == 0
+
+    @pytest.mark.parametrize("category, columns, exception, message", [
+        ("gpu", {}, ValueError, "Unknown category"),
+        ("resource", {"name": ["a"], "manufacturer": ["b"], "total": [1]}, ValueError, "allocated"),
+        ("resource", {"name": ["a", "b"], "manufacturer": ["c", "d"], "total": [1, 2], "allocated": [0, 3]}, ValueError, "row 1"),
+        ("resource", {"name": ["a", "b"], "manufacturer": ["c", "d"], "total": [1, "2"], "allocated": [0, 0]}, TypeError, "row 1"),
+        ("cpu", {"name": ["a"], "manufacturer": ["b"], "total": [1], "allocated": [0], "cores": [1], "socket": ["AM4"],
+                 "power_watts": [65]}, ValueError, "cores at row 0"),
+        ("resource", {"name": ["a", "b"], "manufacturer": ["c", "d"], "total": [1, 2 ** 63], "allocated": [0, 0]},
+         ValueError, "total at row 1"),
+        ("storage", {"name": ["a"], "manufacturer": ["b"], "total": [1], "allocated": [0], "capacity_gb": [2 ** 64]},
+         ValueError, "capacity_gb at row 0"),
+    ])
+    def test_load_columns_validation(self, table, category, columns, exception, message):
+        with pytest.raises(exception) as ex:
+            table.load_columns(category, columns)
+        assert message in str(ex.value)
+        assert len(table) == 3
+
+    def test_load_columns_overflow(self, table):
+        with pytest.raises(ValueError):
+            table.load_columns("hdd", {"name": ["a"], "manufacturer": ["b"], "total": [2 ** 63], "allocated": [0],
+                                       "capacity_gb": [2000], "size": ['3.5"'], "rpm": [5000]})
+        lengths = {len(table.column(name)) for name in ResourceTable._COLUMNS}
+        assert lengths == {3} and len(table) == 3
+
+    def test_load_columns_rows(self, table):
+        with pytest.raises(ValueError) as ex:
+            table.load_columns("resource", {"name": ["a", "b"], "manufacturer": ["c", "d"], "total": [1, 2],
+                                            "allocated": [0, 3]}, rows=[40, 41])
+        assert "row 41" in str(ex.value)
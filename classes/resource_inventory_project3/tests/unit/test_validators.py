@@ -10,10 +10,12 @@ Tests for the `validate_integer` function within the `app.utils.validators` modu
 * `test_type_error`: Asserts that the function raises a `TypeError` when a non-integer value is provided.
 * `test_min_err_msg`: Verifies that the function raises a `ValueError` with the expected message when the argument value is below the minimum allowed value.
 * `test_max_err_msg`: Verifies that the function raises a `ValueError` with the expected message when the argument value is above the maximum allowed value.
+
+Tests for `compile_integer_validator` (same results and messages as `validate_integer`) and `validate_many` (errors report the row).
 """
 import pytest
 
-from app.utils.validators import validate_integer
+from app.utils.validators import validate_integer, compile_integer_validator, validate_many
 
 class Test_Integer_Validator:
     def test_valid(self):
@@ -37,3 +39,47 @@ class Test_Integer_Validator:
         assert "100" in str(ex.value)
 
 
+class Test_Compiled_Validator:
+    @pytest.mark.parametrize("min_value, max_value", [(None, None), (0, None), (None, 20), (0, 20)])
+    @pytest.mark.parametrize("value", [-5, 0, 10, 20, 25, 1.5, "10"])
+    def test_same_as_validate_integer(self, value, min_value, max_value):
+        validator = compile_integer_validator("arg", min_value, max_value)
+        try:
+            expected = validate_integer("arg", value, min_value, max_value)
+        except (TypeError, ValueError) as ex:
+            with pytest.raises(type(ex)) as compiled_ex:
+                validator(value)
+            assert str(compiled_ex.value) == str(ex)
+        else:
+            assert validator(value) == expected
+
+    def test_name(self):
+        assert compile_integer_validator("cores", 2, 64).__name__ == "validate_cores"
+
+
+class Test_Validate_Many:
+    def test_valid(self):
+        assert validate_many("arg", [0, 5, 10], 0, 10)
+        assert validate_many("arg", [])
+
+    def test_type_error(self):
+        with pytest.raises(TypeError) as ex:
+            validate_many("arg", [1, 2, 1.5])
+        assert "row 2" in str(ex.value)
+
+    def test_min_err_msg(self):
+        with pytest.raises(ValueError) as ex:
+            validate_many("arg", [100, 10, 200], min_value=100)
+        assert "row 1" in str(ex.value)
+        assert "100" in str(ex.value)
+
+    def test_max_err_msg(self):
+        with pytest.raises(ValueError) as ex:
+            validate_many("arg", [1, 2, 300], max_value=100)
+        assert "row 2" in str(ex.value)
+        assert "100" in str(ex.value)
+
+    def test_rows(self):
+        with pytest.raises(ValueError) as ex:
+            validate_many("arg", [1, 2, 300], max_value=100, rows=range(10, 13))
+        assert "row 12" in str(ex.value)
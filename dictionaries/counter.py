@@ -1,5 +1,8 @@
 #Cobine data from multiple sources into a single result
-from collections import Counter
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import os
 
 def combinning_dicts(*dicts : dict) -> dict:
 
@@ -13,12 +16,80 @@ def combinning_dicts(*dicts : dict) -> dict:
     return dict(sorted(unsorted_c.items(), key = lambda tup: tup[1], reverse=True))
 
 
+def _count_chunk(dicts: list) -> Counter:
+    partial = Counter()
+    for d in dicts:
+        partial.update(d)
+    return partial
+
+
+def merge_counts(sources, top_k: int = None, workers: int = None, chunk_size: int = 64, max_pending: int = None) -> dict:
+    """
+        Scalable version of `combinning_dicts` for thousands of large frequency dicts (e.g. one per shard).
+
+        The sources are consumed lazily and folded into one running total, so only the combined counts are kept, never the sources.
+        With workers, the sources are read `chunk_size` dicts at a time and each chunk is counted in a worker process.
+        The parent folds the partial counters into the total oldest first, and reading stops while `max_pending` of them are in flight.
+        Each partial counter crosses the process boundary once and the total never does.
+
+        Args:
+            sources: An iterable (a generator is fine) of `{key: count}` dicts.
+            top_k (int): Only keep the `top_k` largest counts, picked with a heap instead of sorting every key. Defaults to all of them.
+            workers (int): Worker processes. Defaults to the number of CPUs; 0 merges in this process.
+            chunk_size (int): Dicts counted per task. Defaults to 64.
+            max_pending (int): Chunks in flight at most. Defaults to twice the number of workers.
+
+        Returns:
+            dict: The combined counts sorted by count, largest first (ties keep the order of first appearance), or None when there are no sources.
+
+        Examples:
+            >>> merge_counts(iter([d1, d2, d3]), top_k=3, workers=0)
+            {'python': 17, 'javascript': 15, 'java': 13}
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    if top_k is not None and top_k < 0:
+        raise ValueError("top_k can not be negative")
+
+    total = Counter()
+    empty = True
+
+    if workers == 0:
+        for d in sources:
+            total.update(d)
+            empty = False
+    else:
+        workers = workers or os.cpu_count() or 1
+        max_pending = max_pending or 2 * workers
+        sources = iter(sources)
+        chunks = iter(lambda: list(islice(sources, chunk_size)), [])
+        with ProcessPoolExecutor(workers) as pool:
+            pending = deque()
+            for chunk in chunks:
+                #oldest first, so keys keep their order of first appearance
+                if len(pending) >= max_pending:
+                    total.update(pending.popleft().result())
+                pending.append(pool.submit(_count_chunk, chunk))
+                empty = False
+            while pending:
+                total.update(pending.popleft().result())
+
+    if empty:
+        return None
+    #most_common uses heapq.nlargest when a number is given, and a full sort otherwise
+    return dict(total.most_common(top_k))
+
+
 d1 = {'python': 10, 'java': 3, 'c#': 8, 'javascript': 15}
 d2 = {'java': 10, 'c++': 10, 'c#': 4, 'go': 9, 'python': 6}
 d3 = {'erlang': 5, 'haskell': 2, 'python': 1, 'pascal': 1}
 
-consolidated_dict = combinning_dicts(d1,d2,d3)
+if __name__ == "__main__":
+    consolidated_dict = combinning_dicts(d1,d2,d3)
+
+    print(consolidated_dict)
 
-print(consolidated_dict)
+    #{'python': 17, 'javascript': 15, 'java': 13, 'c#': 12, 'c++': 10, 'go': 9, 'erlang': 5, 'haskell': 2, 'pascal': 1}
 
-#{'python': 17, 'javascript': 15, 'java': 13, 'c#': 12, 'c++': 10, 'go': 9, 'erlang': 5, 'haskell': 2, 'pascal': 1}
\ No newline at end of file
+    print(merge_counts(iter([d1, d2, d3]), workers=2, chunk_size=1))
+    print(merge_counts(iter([d1, d2, d3]), top_k=3, workers=0))
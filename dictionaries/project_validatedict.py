@@ -87,6 +87,114 @@ def extract_values(some_dict:dict) -> list:
         
 
 
+def walk(some_dict: dict):
+    """
+        Lazily yields every entry of a dictionary, including nested dictionaries, as `(path, key, value)` triples.
+
+        Unlike `extract_keys`, it does not recurse and builds no list: it keeps one iterator per open level, so it works
+        on arbitrarily deep documents and the caller can stop at any point (e.g. at the first mismatch) without the rest
+        of the document being visited. Entries come in the same order as `extract_keys`.
+
+        `path` is the list of keys leading to the dictionary that holds `key`. It is one list updated in place while walking
+        (so each step costs the same at any depth): copy it, e.g. `tuple(path)`, to keep it after the next step.
+
+        Args:
+            some_dict (dict): The dictionary to walk.
+
+        Yields:
+            tuple: `(path, key, value)`, `value` being a nested dictionary or a single value.
+
+        Examples:
+            >>> my_dict = {'a': 1, 'b': {'c': 2, 'd': {'e': 3}}}
+            >>> [(tuple(path), key) for path, key, _ in walk(my_dict)]
+            [((), 'a'), ((), 'b'), (('b',), 'c'), (('b',), 'd'), (('b', 'd'), 'e')]
+    """
+    path = []
+    stack = [iter(some_dict.items())]
+    while stack:
+        for key, value in stack[-1]:
+            yield path, key, value
+            if isinstance(value, dict):
+                path.append(key)
+                stack.append(iter(value.items()))
+                break
+        else:
+            stack.pop()
+            if path:
+                path.pop()
+
+
+def iter_keys(some_dict: dict):
+    """
+        Generator version of `extract_keys`: yields the same keys, in the same order, without recursion.
+
+        Examples:
+            >>> list(iter_keys({'a': 1, 'b': {'c': 2, 'd': {'e': 3}}}))
+            ['a', 'b', 'c', 'd', 'e']
+    """
+    return (key for _, key, _ in walk(some_dict))
+
+
+def iter_values(some_dict: dict):
+    """
+        Generator version of `extract_values`: yields the single (non dict) values, in document order.
+
+        Examples:
+            >>> list(iter_values({'a': 1, 'b': {'c': 2, 'd': {'e': 3}}}))
+            [1, 2, 3]
+    """
+    return (value for _, _, value in walk(some_dict) if not isinstance(value, dict))
+
+
+def first_mismatch(data, template):
+    """
+        Walks a payload and a template together and stops at the first difference, without visiting the rest of the payload.
+
+        Args:
+            data: The data dictionary to be checked.
+            template: The template dictionary (keys mapped to types or nested templates).
+
+        Returns:
+            Union[str, None]: The first error, with the dotted path of the key (`Missing Key = ...`, `Extra Key = ...` or
+            `Data type mismatch at ...`), or None when the payload matches the template.
+
+        Examples:
+            >>> first_mismatch({'a': 1, 'b': {'c': 'x'}}, {'a': int, 'b': {'c': int}})
+            'Data type mismatch at b.c: expected int, got str'
+            >>> first_mismatch({'a': 1}, {'a': int})
+    """
+    if not isinstance(data, dict):
+        return f"Data type mismatch at <root>: expected dict, got {type(data).__name__}"
+
+    #the dotted path is only built for the error, the walk itself keeps one list of keys
+    path = []
+    dotted = lambda key: ".".join(map(str, path + [key]))
+    stack = [(template, iter(template.items()), data)]
+    while stack:
+        level, items, current = stack[-1]
+        for key, expected in items:
+            if key not in current:
+                return f"Missing Key = {dotted(key)}"
+            value = current[key]
+            if isinstance(expected, dict):
+                if not isinstance(value, dict):
+                    return f"Data type mismatch at {dotted(key)}: expected dict, got {type(value).__name__}"
+                path.append(key)
+                stack.append((expected, iter(expected.items()), value))
+                break
+            if not isinstance(value, expected):
+                return f"Data type mismatch at {dotted(key)}: expected {expected.__name__}, got {type(value).__name__}"
+        else:
+            #every expected key of this level is there, anything else is extra
+            if len(current) != len(level):
+                return f"Extra Key = {dotted(next(key for key in current if key not in level))}"
+            stack.pop()
+            if path:
+                path.pop()
+    return None
+
+
+
 def match_keys(data, template):
     """
         Checks if the keys in a given data dictionary match the keys in a template dictionary.
@@ -113,7 +221,8 @@ def match_keys(data, template):
             True
     """
 
-    data_keys, template_keys = set(extract_keys(data)), set(extract_keys(template))
+    #iter_keys yields the same keys as extract_keys without recursion, so deep payloads do not hit the recursion limit
+    data_keys, template_keys = set(iter_keys(data)), set(iter_keys(template))
 
     missing_error_msg = " "
     extra_error_msg = " "
@@ -189,6 +298,98 @@ def match_values_types(data, template):
 
 
 
+class Schema:
+    """
+        A template compiled once into a validation plan indexed by dotted path.
+
+        Unlike `match_keys` + `match_values_types`, which flatten both dictionaries on every call (losing where a key lives),
+        a `Schema` walks the template a single time when it is built. Validating a payload is then one traversal of the payload
+        that checks the keys and the value types of each level together, and reports full dotted paths.
+
+        Args:
+            template (dict): Keys mapped to a type (the expected type of the value) or to a nested template dict.
+
+        Raises:
+            TypeError: If a template value is neither a type nor a dict.
+
+        Methods:
+            validate(data) -> list: The errors found in `data`, an empty list when it matches the template. Missing keys come
+            first, then extra keys, then type mismatches, each group in document order.
+            is_valid(data) -> bool: True when `validate` finds no error.
+
+        Examples:
+            >>> schema = Schema({'a': int, 'b': {'c': str}})
+            >>> schema.validate({'a': 1, 'b': {'c': 'x'}})
+            []
+            >>> schema.validate({'a': '1', 'b': {'d': 'x'}})
+            ['Missing Key = b.c', 'Extra Key = b.d', 'Data type mismatch at a: expected int, got str']
+    """
+
+    def __init__(self, template: dict) -> None:
+        if not isinstance(template, dict):
+            raise TypeError("template must be a dict")
+        self.template = template
+        self._levels = []
+        self._compile(template, "")
+
+    def _compile(self, template, prefix):
+        #the levels are numbered in document order (a level, then each nested level in template order), every level being
+        #(expected keys, [(key, dotted path, expected type, number of the nested level or None)], prefix)
+        number = len(self._levels)
+        self._levels.append(None)
+        entries = []
+        for key, expected in template.items():
+            path = f"{prefix}{key}"
+            if isinstance(expected, dict):
+                entries.append((key, path, dict, self._compile(expected, f"{path}.")))
+            elif isinstance(expected, type):
+                entries.append((key, path, expected, None))
+            else:
+                raise TypeError(f"template value at {path} must be a type or a dict, got {expected!r}")
+        self._levels[number] = (frozenset(template), entries, prefix)
+        return number
+
+    def validate(self, data: dict) -> list:
+        if not isinstance(data, dict):
+            return [f"Data type mismatch at <root>: expected dict, got {type(data).__name__}"]
+
+        missing, extra, mismatched = [], [], []
+        #the payload dict found for every level, None when it is missing or not a dict; a level is always checked after
+        #the one holding it, so one pass over the levels in document order needs no stack
+        currents = [None] * len(self._levels)
+        currents[0] = data
+        for (keys, entries, prefix), current in zip(self._levels, currents):
+            if current is None:
+                continue
+
+            same_keys = current.keys() == keys
+            if not same_keys:
+                #in payload order, a set difference would depend on the hash seed
+                extra.extend(f"{prefix}{key}" for key in current if key not in keys)
+
+            for key, path, expected, nested in entries:
+                if not same_keys and key not in current:
+                    missing.append(path)
+                    continue
+                value = current[key]
+                if not isinstance(value, expected):
+                    mismatched.append(f"Data type mismatch at {path}: expected {expected.__name__}, got {type(value).__name__}")
+                elif nested is not None:
+                    currents[nested] = value
+
+        return ([f"Missing Key = {path}" for path in missing]
+                + [f"Extra Key = {path}" for path in extra]
+                + mismatched)
+
+    def is_valid(self, data: dict) -> bool:
+        return not self.validate(data)
+
+    def __repr__(self):
+        return f"Schema(keys={len(self._levels[0][0])})"
+
+
+
+
 eric = {
     'user_id': 101,
     'name': {
@@ -226,9 +427,23 @@ michael = {
     }
 }
 
-print(match_keys(eric, template))
+if __name__ == "__main__":
+    print(match_keys(eric, template))
+
+    print(match_values_types(eric,template))
+
+    schema = Schema(template)
+    print(schema.validate(eric))
+    print(schema.validate(michael))
+
+    print(first_mismatch(eric, template))
+    print(first_mismatch(michael, template))
 
-print(match_values_types(eric,template))
+    #a document far deeper than the recursion limit
+    deep = value = {}
+    for _ in range(100_000):
+        value['child'] = value = {}
+    print(sum(1 for _ in iter_keys(deep)))
 
 
 
@@ -0,0 +1,161 @@
+"""
+Streaming validation of JSON-lines payloads against a template.
+
+Payloads are read lazily from a file (or any iterator of lines), grouped in chunks, and each chunk is validated in a worker
+process with a `Schema` compiled once per worker. Results come back in input order, one per record, while only a bounded number
+of chunks is in flight, so memory stays flat no matter how big the input is.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import json
+import os
+import time
+
+from project_validatedict import Schema
+
+
+_worker_schema = None
+
+
+def _init_worker(template):
+    global _worker_schema
+    _worker_schema = Schema(template)
+
+
+def _validate_lines(lines, schema=None):
+    schema = schema or _worker_schema
+    results = []
+    for line in lines:
+        try:
+            record = json.loads(line)
+        except ValueError as ex:
+            results.append([f"Invalid JSON: {ex}"])
+        else:
+            results.append(schema.validate(record))
+    return results
+
+
+class StreamValidator:
+    """
+        Validates JSON-lines payloads against a template across a pool of processes.
+
+        Args:
+            template (dict): The template, compiled into a `Schema` in every worker.
+            chunk_size (int): Lines sent to a worker at a time. Defaults to 5000.
+            workers (int): Worker processes. Defaults to the number of CPUs; 0 validates in this process.
+            max_pending (int): Chunks in flight at most. Defaults to twice the number of workers.
+
+        Attributes:
+            records (int): Records validated so far.
+            invalid (int): Records with at least one error.
+            seconds (float): Time spent in `validate`.
+            records_per_second (float): `records / seconds`.
+
+        Methods:
+            validate(source) -> iterator: Yields `(line_number, errors)` for every non blank line of `source` (a path or an iterator of lines),
+            in input order. `errors` is an empty list for a valid record.
+            close(): Stops the worker processes.
+
+        Examples:
+            >>> lines = ['{"id": 1}', '', '{"id": "2"}', '{"id": 3']
+            >>> with StreamValidator({'id': int}, workers=0) as validator:
+            ...     for line_number, errors in validator.validate(lines):
+            ...         if errors:
+            ...             print(line_number, errors)
+            3 ['Data type mismatch at id: expected int, got str']
+            4 ["Invalid JSON: Expecting ',' delimiter: line 1 column 9 (char 8)"]
+            >>> validator.records, validator.invalid
+            (3, 2)
+
+            A path is read line by line: `validator.validate("payloads.jsonl")`.
+    """
+
+    def __init__(self, template: dict, chunk_size: int = 5000, workers: int = None, max_pending: int = None) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self._schema = Schema(template)
+        self._chunk_size = chunk_size
+        self._workers = (os.cpu_count() or 1) if workers is None else workers
+        self._max_pending = max_pending or 2 * max(self._workers, 1)
+        self._executor = (ProcessPoolExecutor(self._workers, initializer=_init_worker, initargs=(template,))
+                          if self._workers else None)
+        self.records = 0
+        self.invalid = 0
+        self.seconds = 0.0
+
+    @property
+    def records_per_second(self):
+        return self.records / self.seconds if self.seconds else 0.0
+
+    def _chunks(self, source):
+        numbered = ((n, line) for n, line in enumerate(source, 1) if line.strip())
+        while chunk := list(islice(numbered, self._chunk_size)):
+            yield [n for n, _ in chunk], [line for _, line in chunk]
+
+    def _results(self, chunks):
+        if self._executor is None:
+            for line_numbers, lines in chunks:
+                yield line_numbers, _validate_lines(lines, self._schema)
+            return
+
+        pending = deque()
+        for line_numbers, lines in chunks:
+            pending.append((line_numbers, self._executor.submit(_validate_lines, lines)))
+            if len(pending) >= self._max_pending:
+                line_numbers, future = pending.popleft()
+                yield line_numbers, future.result()
+        while pending:
+            line_numbers, future = pending.popleft()
+            yield line_numbers, future.result()
+
+    def validate(self, source):
+        if isinstance(source, str):
+            with open(source, encoding="utf-8") as f:
+                yield from self.validate(f)
+            return
+
+        start = time.perf_counter()
+        try:
+            for line_numbers, results in self._results(self._chunks(source)):
+                self.records += len(results)
+                self.invalid += sum(1 for errors in results if errors)
+                #the time the caller spends between records is not the validator's
+                self.seconds += time.perf_counter() - start
+                start = None
+                yield from zip(line_numbers, results)
+                start = time.perf_counter()
+        finally:
+            if start is not None:
+                self.seconds += time.perf_counter() - start
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"StreamValidator(workers={self._workers}, records={self.records}, invalid={self.invalid})"
+
+
+if __name__ == "__main__":
+    from project_validatedict import template, eric, michael
+
+    n = 200_000
+    lines = (json.dumps(eric if i % 2 else michael) for i in range(n))
+
+    with StreamValidator(template) as validator:
+        first_errors = None
+        for line_number, errors in validator.validate(lines):
+            if errors and first_errors is None:
+                first_errors = (line_number, errors)
+
+    print(first_errors)
+    print(validator)
+    print(f"{validator.records_per_second:,.0f} records/sec")
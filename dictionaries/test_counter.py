@@ -0,0 +1,75 @@
+from concurrent.futures import ThreadPoolExecutor
+import random
+
+import pytest
+import counter
+from counter import merge_counts, combinning_dicts, d1, d2, d3
+
+
+@pytest.fixture
+def sources():
+    rng = random.Random(7)
+    words = [f"w{i}" for i in range(50)]
+    return [{word: rng.randint(1, 5) for word in rng.sample(words, 10)} for _ in range(200)]
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    """Thread pool standing in for the process pool, recording how many chunks were in flight at most."""
+    peak = 0
+
+    def __init__(self, workers):
+        super().__init__(workers)
+        self._in_flight = 0
+
+    def submit(self, fn, *args):
+        future = super().submit(fn, *args)
+        self._in_flight += 1
+        RecordingExecutor.peak = max(RecordingExecutor.peak, self._in_flight)
+        result = future.result
+
+        def fetched(*a):
+            self._in_flight -= 1
+            return result(*a)
+        future.result = fetched
+        return future
+
+
+class Test_merge_counts:
+    def test_matches_combinning_dicts(self):
+        assert merge_counts(iter([d1, d2, d3]), workers=0) == combinning_dicts(d1, d2, d3)
+        assert list(merge_counts([d1, d2, d3], workers=0)) == list(combinning_dicts(d1, d2, d3))
+
+    def test_top_k_order_and_ties(self):
+        #c++ and java tie at 10, c++ appeared first
+        assert merge_counts([{'c++': 10, 'go': 1}, {'java': 10, 'rust': 30}], top_k=3, workers=0) == \
+            {'rust': 30, 'c++': 10, 'java': 10}
+        assert list(merge_counts([{'b': 1, 'a': 1}, {'c': 1}], top_k=2, workers=0)) == ['b', 'a']
+        assert merge_counts([d1], top_k=0, workers=0) == {}
+        assert merge_counts([d1], top_k=100, workers=0) == combinning_dicts(d1)
+
+    def test_empty(self):
+        assert merge_counts([], workers=0) is None
+        assert merge_counts(iter([]), workers=1) is None
+        assert merge_counts([{}], workers=0) == {}
+
+    def test_pool_matches_in_process(self, sources):
+        expected = merge_counts(iter(sources), workers=0)
+        for top_k in (None, 5):
+            result = merge_counts(iter(sources), top_k=top_k, workers=2, chunk_size=7, max_pending=3)
+            assert list(result.items()) == list(expected.items())[:top_k]
+
+    def test_max_pending_back_pressure(self, sources, monkeypatch):
+        monkeypatch.setattr(counter, "ProcessPoolExecutor", RecordingExecutor)
+        RecordingExecutor.peak = 0
+        consumed = []
+
+        result = merge_counts((consumed.append(d) or d for d in sources), workers=2, chunk_size=5, max_pending=3)
+
+        assert len(consumed) == len(sources)
+        assert 0 < RecordingExecutor.peak <= 3
+        assert result == merge_counts(sources, workers=0)
+
+    @pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"top_k": -1}])
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            merge_counts([d1], workers=0, **kwargs)
@@ -0,0 +1,131 @@
+import os
+import subprocess
+import sys
+
+import pytest
+from project_validatedict import (Schema, template, eric, michael, walk, iter_keys, iter_values, first_mismatch,
+                                  extract_keys, extract_values)
+
+
+def nested(depth, leaf):
+    """`{'child': {'child': ... {'leaf': leaf}}}` with `depth` levels of 'child'."""
+    data = value = {}
+    for _ in range(depth):
+        value['child'] = value = {}
+    value['leaf'] = leaf
+    return data
+
+
+class Test_schema:
+    def test_valid(self):
+        schema = Schema({'a': int, 'b': {'c': str}})
+        assert schema.validate({'a': 1, 'b': {'c': 'x'}}) == []
+        assert schema.is_valid({'a': 1, 'b': {'c': 'x'}})
+
+    def test_missing_and_extra_keys(self):
+        schema = Schema({'a': int, 'b': {'c': str, 'd': int}})
+        assert schema.validate({'a': 1, 'b': {'c': 'x', 'e': 2}, 'f': 3}) == \
+            ['Missing Key = b.d', 'Extra Key = f', 'Extra Key = b.e']
+
+    def test_type_mismatch(self):
+        schema = Schema({'a': int, 'b': {'c': str}})
+        assert schema.validate({'a': '1', 'b': {'c': 2}}) == \
+            ['Data type mismatch at a: expected int, got str', 'Data type mismatch at b.c: expected str, got int']
+        assert not schema.is_valid({'a': '1', 'b': {'c': 'x'}})
+
+    def test_errors_in_document_order(self):
+        schema = Schema({'a': {'x': int, 'y': int}, 'b': {'x': int}, 'c': {'x': {'z': int}}})
+        data = {'q': 1, 'p': 2, 'a': {'x': 's', 'y': 's', 'r': 3}, 'b': {'x': 's', 'o': 4}, 'c': {'x': {'z': 's'}}}
+        assert schema.validate(data) == [
+            'Extra Key = q', 'Extra Key = p', 'Extra Key = a.r', 'Extra Key = b.o',
+            'Data type mismatch at a.x: expected int, got str', 'Data type mismatch at a.y: expected int, got str',
+            'Data type mismatch at b.x: expected int, got str', 'Data type mismatch at c.x.z: expected int, got str']
+
+    def test_errors_do_not_depend_on_hash_seed(self):
+        script = ("from project_validatedict import Schema; "
+                  "print(Schema({'a': int}).validate({'a': 1, 'k1': 1, 'k2': 2, 'k3': 3, 'k4': 4, 'k5': 5}))")
+        outputs = {subprocess.run([sys.executable, "-c", script], env={**os.environ, "PYTHONHASHSEED": str(seed)},
+                                  cwd=os.path.dirname(os.path.abspath(__file__)), capture_output=True, text=True,
+                                  check=True).stdout
+                   for seed in range(1, 6)}
+        assert outputs == {str([f"Extra Key = k{i}" for i in range(1, 6)]) + "\n"}
+
+    def test_nested_level_not_a_dict(self):
+        schema = Schema({'b': {'c': str}})
+        assert schema.validate({'b': 'x'}) == ['Data type mismatch at b: expected dict, got str']
+
+    @pytest.mark.parametrize("data", [None, 42, "x", ['a']])
+    def test_root_not_a_dict(self, data):
+        assert Schema({'a': int}).validate(data) == \
+            [f"Data type mismatch at <root>: expected dict, got {type(data).__name__}"]
+
+    def test_empty(self):
+        assert Schema({}).validate({}) == []
+        assert Schema({}).validate({'a': 1}) == ['Extra Key = a']
+        assert Schema({'a': int}).validate({}) == ['Missing Key = a']
+
+    @pytest.mark.parametrize("bad_template", [None, [int], "int"])
+    def test_template_not_a_dict(self, bad_template):
+        with pytest.raises(TypeError):
+            Schema(bad_template)
+
+    def test_template_value_not_a_type(self):
+        with pytest.raises(TypeError) as ex:
+            Schema({'a': {'b': 'int'}})
+        assert "a.b" in str(ex.value)
+
+    def test_demo_payloads(self):
+        schema = Schema(template)
+        assert schema.validate(eric) == ['Missing Key = bio.birthplace.city']
+        assert schema.validate(michael) == ['Data type mismatch at bio.dob.month: expected int, got str']
+
+
+class Test_iterators:
+    def test_same_order_as_extract(self):
+        for data in (template, eric, michael):
+            assert list(iter_keys(data)) == extract_keys(data)
+            assert sorted(map(repr, iter_values(data))) == sorted(map(repr, extract_values(data)))
+
+    def test_walk_paths(self):
+        assert [(tuple(path), key) for path, key, _ in walk({'a': 1, 'b': {'c': 2, 'd': {}}, 'e': 3})] == \
+            [((), 'a'), ((), 'b'), (('b',), 'c'), (('b',), 'd'), ((), 'e')]
+
+    def test_empty(self):
+        assert list(walk({})) == []
+        assert list(iter_keys({})) == []
+        assert list(iter_values({})) == []
+        assert list(iter_values({'a': {}, 'b': {'c': {}}})) == []
+
+    def test_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 5
+        data = nested(depth, 42)
+        assert sum(1 for _ in iter_keys(data)) == depth + 1
+        assert list(iter_values(data)) == [42]
+        #the path list is shared, so it is read while walking
+        assert [(len(path), value) for path, key, value in walk(data) if key == 'leaf'] == [(depth, 42)]
+
+    def test_stops_early(self):
+        keys = iter_keys(nested(10, 1))
+        assert [next(keys), next(keys)] == ['child', 'child']
+
+
+class Test_first_mismatch:
+    def test_match(self):
+        assert first_mismatch({'a': 1, 'b': {'c': 'x'}}, {'a': int, 'b': {'c': str}}) is None
+        assert first_mismatch({}, {}) is None
+
+    def test_errors(self):
+        assert first_mismatch(eric, template) == 'Missing Key = bio.birthplace.city'
+        assert first_mismatch(michael, template) == 'Data type mismatch at bio.dob.month: expected int, got str'
+        assert first_mismatch({'a': 1, 'b': 2}, {'a': int}) == 'Extra Key = b'
+        assert first_mismatch({'a': 1}, {}) == 'Extra Key = a'
+        assert first_mismatch({}, {'a': int}) == 'Missing Key = a'
+        assert first_mismatch({'a': 1}, {'a': {'b': int}}) == 'Data type mismatch at a: expected dict, got int'
+        assert first_mismatch([], {}) == 'Data type mismatch at <root>: expected dict, got list'
+
+    def test_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 5
+        assert first_mismatch(nested(depth, 1), nested(depth, int)) is None
+        error = first_mismatch(nested(depth, 'x'), nested(depth, int))
+        assert error.endswith('child.leaf: expected int, got str')
+        assert error.count('child') == depth
@@ -0,0 +1,57 @@
+import json
+
+import pytest
+from stream_validate import StreamValidator
+
+TEMPLATE = {'id': int, 'name': {'first': str}}
+
+
+@pytest.fixture
+def lines():
+    return [json.dumps({'id': 1, 'name': {'first': 'Eric'}}),
+            '{"id": 2, "name": ',
+            '',
+            json.dumps({'id': '3', 'name': {'first': 'John'}}),
+            'not json at all',
+            json.dumps({'id': 4, 'name': {'first': 'Terry'}})]
+
+
+class Test_stream_validator:
+    def test_in_process(self, lines):
+        with StreamValidator(TEMPLATE, chunk_size=2, workers=0) as validator:
+            results = list(validator.validate(iter(lines)))
+
+        assert [n for n, _ in results] == [1, 2, 4, 5, 6]
+        assert results[0] == (1, [])
+        assert results[1][1][0].startswith("Invalid JSON")
+        assert results[2] == (4, ['Data type mismatch at id: expected int, got str'])
+        assert results[3][1][0].startswith("Invalid JSON")
+        assert results[4] == (6, [])
+        assert (validator.records, validator.invalid) == (5, 3)
+
+    def test_pool_matches_in_process(self, lines):
+        with StreamValidator(TEMPLATE, chunk_size=2, workers=0) as validator:
+            expected = list(validator.validate(iter(lines * 20)))
+        with StreamValidator(TEMPLATE, chunk_size=3, workers=2, max_pending=2) as validator:
+            results = list(validator.validate(iter(lines * 20)))
+
+        assert results == expected
+        assert (validator.records, validator.invalid) == (100, 60)
+        assert validator.records_per_second > 0
+
+    def test_path_source(self, tmp_path, lines):
+        path = tmp_path / "payloads.jsonl"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        with StreamValidator(TEMPLATE, workers=1) as validator:
+            results = list(validator.validate(str(path)))
+
+        assert [n for n, errors in results if errors] == [2, 4, 5]
+
+    def test_empty_source(self):
+        with StreamValidator(TEMPLATE, workers=0) as validator:
+            assert list(validator.validate(iter([]))) == []
+        assert validator.records == 0 and validator.records_per_second == 0
+
+    def test_invalid_chunk_size(self):
+        with pytest.raises(ValueError):
+            StreamValidator(TEMPLATE, chunk_size=0, workers=0)
@@ -0,0 +1,82 @@
+import random
+import sys
+
+import pytest
+from project_validatedict import template, eric, michael, match_keys, match_values_types
+from validation_cache import ShapeCache, shape_of
+
+
+def mutations(rng, n):
+    """Payloads derived from `michael` with keys dropped, added or given values of another type."""
+    payloads = []
+    for _ in range(n):
+        payload = {'user_id': 102, 'name': dict(michael['name']),
+                   'bio': {'dob': dict(michael['bio']['dob']), 'birthplace': dict(michael['bio']['birthplace'])}}
+        level = rng.choice([payload, payload['name'], payload['bio']['dob'], payload['bio']['birthplace']])
+        action = rng.randrange(3)
+        if action == 0:
+            level.pop(rng.choice(list(level)))
+        elif action == 1:
+            level[rng.choice(['extra', 'city', 'nick'])] = rng.choice([1, 'x', {}])
+        else:
+            level[rng.choice(list(level))] = rng.choice([1, 'x', 2.5, None])
+        payloads.append(payload)
+    return payloads
+
+
+class Test_shape_cache:
+    def test_matches_legacy_functions(self, capsys):
+        cache = ShapeCache(template, maxsize=8)
+        for payload in [eric, michael] * 3 + mutations(random.Random(3), 500):
+            assert cache.validate(payload) == (match_keys(payload, template), match_values_types(payload, template))
+
+    def test_statistics(self):
+        cache = ShapeCache(template)
+        assert cache.cache_info().hit_rate == 0.0
+        for payload in [eric, michael] * 5:
+            cache.validate(payload)
+
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (8, 2, 2)
+        assert info.hit_rate == 0.8
+        cache.cache_clear()
+        assert cache.cache_info() == (0, 0, 1024, 0)
+
+    def test_lru_eviction(self):
+        cache = ShapeCache({'a': int}, maxsize=2)
+        first, second, third = {'a': 1}, {'b': 1}, {'c': 1}
+        cache.validate(first)
+        cache.validate(second)
+        cache.validate(first)
+        cache.validate(third)
+        assert cache.cache_info().currsize == 2
+
+        cache.validate(first)
+        assert cache.cache_info().hits == 2
+        cache.validate(second)
+        assert cache.cache_info().misses == 4
+
+    def test_shape_ignores_values_but_not_nesting(self):
+        assert shape_of({'a': 1, 'b': {'c': 2}}) == shape_of({'a': 'x', 'b': {'c': None}})
+        assert shape_of({'a': {}, 'b': 1}) != shape_of({'a': 1, 'b': {}})
+        assert shape_of({'a': 1, 'b': 2}) != shape_of({'b': 2, 'a': 1})
+
+    def test_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() * 5
+        deep_template = leaf = {}
+        deep_payload = value = {}
+        for _ in range(depth):
+            leaf['child'] = leaf = {}
+            value['child'] = value = {}
+        leaf['leaf'], value['leaf'] = int, 'x'
+
+        cache = ShapeCache(deep_template)
+        for _ in range(2):
+            verdict, type_errors = cache.validate(deep_payload)
+            assert verdict == (True, 'None missing keys')
+            assert type_errors == ["Data type mismatch at value x: expected <class 'int'>, got <class 'str'>"]
+        assert cache.cache_info().hits == 1
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError):
+            ShapeCache(template, maxsize=0)
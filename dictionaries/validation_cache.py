@@ -0,0 +1,133 @@
+"""
+Validation result cache keyed by payload shape, in front of `match_keys` and `match_values_types`.
+
+Payloads coming from the same client usually share one key structure and only differ in values. The key-match verdict
+of `match_keys` only depends on that structure, so it is computed once per shape and kept in an LRU cache. A payload whose
+shape was seen before skips `match_keys` and only pays for the type checks of its leaf values.
+"""
+
+from collections import OrderedDict, namedtuple
+
+from project_validatedict import extract_values, match_keys
+
+
+class CacheInfo(namedtuple("CacheInfo", "hits misses maxsize currsize")):
+    """Statistics of a `ShapeCache`, like `functools.lru_cache().cache_info()` plus `hit_rate`."""
+
+    __slots__ = ()
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _shape_and_leaves(data: dict):
+    #the shape is, per level, its keys and the keys holding a nested dictionary; the leaves come in the order of
+    #`extract_values` (same stack, same pops), so they line up with the template's types like in `match_values_types`
+    shape, leaves = [], []
+    stack = [data]
+    while stack:
+        current = stack.pop()
+        nested = []
+        for key, value in current.items():
+            if isinstance(value, dict):
+                stack.append(value)
+                nested.append(key)
+            else:
+                leaves.append(value)
+        shape.append((tuple(current), tuple(nested)))
+    return tuple(shape), leaves
+
+
+def shape_of(data: dict) -> tuple:
+    """
+        Cheap structural fingerprint of a dictionary: the keys of every level and which of them hold a nested dictionary.
+        Values other than dictionaries do not take part, so payloads that only differ in values share a shape.
+
+        Examples:
+            >>> shape_of({'a': 1, 'b': {'c': 2}})
+            ((('a', 'b'), ('b',)), (('c',), ()))
+            >>> shape_of({'a': 'x', 'b': {'c': None}}) == shape_of({'a': 1, 'b': {'c': 2}})
+            True
+    """
+    return _shape_and_leaves(data)[0]
+
+
+class ShapeCache:
+    """
+        LRU cache of `match_keys` verdicts per payload shape, for one template.
+
+        Args:
+            template (dict): The template every payload is checked against.
+            maxsize (int): Shapes kept at most, the least recently used one is evicted first. Defaults to 1024.
+
+        Methods:
+            validate(data) -> tuple: `(match_keys(data, template), match_values_types(data, template))`, without the prints
+            of `match_values_types`. On a hit, only the type checks of the leaves run.
+            cache_info() -> CacheInfo: Hits, misses, maxsize, current size and hit rate.
+            cache_clear(): Empties the cache and resets the statistics.
+
+        Examples:
+            >>> cache = ShapeCache({'a': int, 'b': {'c': str}})
+            >>> cache.validate({'a': 1, 'b': {'c': 'x'}})
+            ((True, 'None missing keys'), [])
+            >>> cache.validate({'a': 'one', 'b': {'c': 'y'}})
+            ((True, 'None missing keys'), ["Data type mismatch at value one: expected <class 'int'>, got <class 'str'>"])
+            >>> cache.cache_info()
+            CacheInfo(hits=1, misses=1, maxsize=1024, currsize=1)
+            >>> cache.cache_info().hit_rate
+            0.5
+    """
+
+    def __init__(self, template: dict, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be positive")
+        self._template = template
+        self._expected_types = extract_values(template)
+        self._maxsize = maxsize
+        self._verdicts = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def validate(self, data: dict) -> tuple:
+        shape, leaves = _shape_and_leaves(data)
+        verdict = self._verdicts.get(shape)
+        if verdict is None:
+            self._misses += 1
+            verdict = self._verdicts[shape] = match_keys(data, self._template)
+            if len(self._verdicts) > self._maxsize:
+                self._verdicts.popitem(last=False)
+        else:
+            self._hits += 1
+            self._verdicts.move_to_end(shape)
+
+        #same result as `match_values_types`
+        if len(leaves) != len(self._expected_types):
+            return verdict, "There is a missing key so no comparison is being made"
+        return verdict, [f"Data type mismatch at value {value}: expected {expected_type}, got {type(value)}"
+                         for value, expected_type in zip(leaves, self._expected_types)
+                         if not isinstance(value, expected_type)]
+
+    def cache_info(self) -> CacheInfo:
+        return CacheInfo(self._hits, self._misses, self._maxsize, len(self._verdicts))
+
+    def cache_clear(self) -> None:
+        self._verdicts.clear()
+        self._hits = self._misses = 0
+
+    def __repr__(self):
+        return f"ShapeCache({self.cache_info()})"
+
+
+if __name__ == "__main__":
+    from project_validatedict import template, eric, michael
+
+    cache = ShapeCache(template, maxsize=16)
+    for payload in [eric, michael] * 1000:
+        cache.validate(payload)
+
+    print(cache.validate(eric))
+    print(cache.validate(michael))
+    info = cache.cache_info()
+    print(info, f"hit rate = {info.hit_rate:.1%}")